@@ -1,13 +1,53 @@
 import sys
+import argparse
 from PySide6.QtWidgets import QApplication
 
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    argparser = argparse.ArgumentParser(add_help=False)
+    argparser.add_argument('--profile-startup', nargs='?', const='startup_profile', default=None, metavar='REPORT_BASENAME',
+        help='time imports, create_all, db statements and widget construction up to first paint; write REPORT_BASENAME.txt/.json and exit')
+    argparser.add_argument('--startup-budget', type=float, default=None, metavar='MS',
+        help='with --profile-startup: exit non-zero if first paint takes longer than MS')
+    cmdargs, qtargs = argparser.parse_known_args()
+
+    profiler = None
+    if cmdargs.profile_startup:
+        from startup_profiler import StartupProfiler, STARTUP_BUDGET_EXCEEDED
+        profiler = StartupProfiler().install()
+
+    app = QApplication(sys.argv[:1] + qtargs)
+    if profiler:
+        profiler.mark('qapplication')
 
     from MainScreen import MainScreen   # QApplication must exist before this import (qt.sql.qsqldatabase: QSqlDatabase requires a QCoreApplication)
+    if profiler:
+        profiler.mark('imports_done')
+
+    # create/upgrade the schemas - only does DDL if a database's schema version (its own PRAGMA user_version) doesn't match
+    from cMenu.models import bootstrap_cMenu_schema
+    from app.database import bootstrap_app_schema
+    bootstrap_cMenu_schema()
+    bootstrap_app_schema()
+    if profiler:
+        profiler.mark('schema_bootstrap')
     topscreen = MainScreen()
+    if profiler:
+        profiler.mark('mainscreen_built')
     topscreen.show()
 
+    # once the event loop is running (menu on screen), import the frequently used forms in the background
+    from PySide6.QtCore import QTimer
+    from cMenu.menucommand_handlers import prewarmForms
+    QTimer.singleShot(0, prewarmForms)
+
+    if profiler:
+        def _reportStartup():
+            smry = profiler.write_report(cmdargs.profile_startup, cmdargs.startup_budget)
+            profiler.uninstall()
+            print(profiler.text_report(cmdargs.startup_budget))
+            app.exit(STARTUP_BUDGET_EXCEEDED if smry['over_budget'] else 0)
+        profiler.watch_first_paint(topscreen, _reportStartup)
+
     sys.exit(app.exec())
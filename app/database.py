@@ -1,6 +1,7 @@
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from cMenu.dbengine import create_sqlite_engine
+
 # cMenu_dbName = "D:\\AppDev\\datasets\\hbl.sqlite"
 # rootdir = "F:\\MXMLKMHS\\python\\MXMLKMHS-v0"
 rootdir = "."
@@ -8,11 +9,29 @@ app_dbName = f"{rootdir}\\sellL6L10.sqlite"
 
 # an Engine, which the Session will use for connection
 # resources, typically in module scope
-app_engine = create_engine(
-    f"sqlite:///{app_dbName}",
-    )
+# connection PRAGMAs (WAL, cache, foreign keys, etc) come from the dbconfig profile
+app_engine = create_sqlite_engine(app_dbName)
 # a sessionmaker(), also in the same scope as the engine
 app_Session = sessionmaker(app_engine)
 
 def get_app_session():
     return app_Session()
+
+# bump when the app tables change; bootstrap_app_schema() re-runs the DDL when the version stored in sellL6L10.sqlite differs
+app_SCHEMA_VERSION = 2     # 2: PartDemandTotals (trigger-maintained per-part demand/picked)
+
+def bootstrap_app_schema() -> bool:
+    """
+    Create the app tables if the schema version stored in the app database (PRAGMA user_version)
+    doesn't match app_SCHEMA_VERSION - so a new or replaced sellL6L10.sqlite always gets its tables.
+    When it matches, app.models isn't even imported.
+
+    :return: True if the DDL ran
+    """
+    # imported here - cMenu.models pulls in cMenu.utils, which imports this module
+    from cMenu.models import bootstrap_schema
+
+    def _create():
+        from app.models import create_app_schema
+        create_app_schema(app_engine)
+    return bootstrap_schema('app', app_SCHEMA_VERSION, _create, app_engine)
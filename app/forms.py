@@ -1,8 +1,10 @@
 from typing import (Dict, Any, )
+import bisect
 import re
 
 from PySide6.QtCore import (
     Qt, Slot, qDebug,
+    QStringListModel,
 )
 from PySide6.QtGui import (
     QFont, QColorConstants,
@@ -14,12 +16,13 @@ from PySide6.QtWidgets import (
     QLabel, QLineEdit, QPushButton,
     QMessageBox,
 )
-from sqlalchemy import FromClause, func, select
+from sqlalchemy import FromClause, func, or_, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from cMenu.utils import (cQFmFldWidg, cQFmNameLabel, cDataList, cComboBoxFromDict, clearLayout, areYouSure, )
 from cMenu.utils import (cSimpleTableForm, cSimpleRecordForm, cSimpleRecordSubForm1, )
 
+from cMenu.database import (TableChanges, change_tracker, )
 from app.database import app_Session
 from app.models import (WorkOrderPartsNeeded, WorkOrders, Parts, Projects, TagPrefixes, Scans, BoxConfigurations, L6L10sellRepositories)
 from cMenu.utils.cQdbFormWidgets import cSimpleRecordSubForm2
@@ -29,19 +32,114 @@ from cMenu.utils.cQdbFormWidgets import cSimpleRecordSubForm2
 
 # choice dictionaries and widgets
 # many, many choices for these tables - construct the choice list only once or spend forever waiting
+# ... and not at all until something actually asks for it.  After that, only the rows changed since are re-read
+
+class _ChoiceList(dict):
+    """
+    One list of Kls_sellL6ChoiceList.  It's a real dict (widgets keep a reference to it and read it
+    like any other choices dict), but it fills itself from the db the first time it's read, and
+    folds in pending changes on each read after that.
+
+    cDataList lists also have completerModel(), a QStringListModel shared by every cDataList showing
+    the list; it's kept sorted and up to date in place, so completers never need rebuilding.
+    """
+    def __init__(self, owner: "Kls_sellL6ChoiceList", name: str):
+        super().__init__()
+        self._owner = owner
+        self._name = name
+        self._model: QStringListModel|None = None
+        self._ids: list = []        # ids in model row order (cDataList lists only)
+        self._values: list[str] = []
+
+    def _ensure(self):
+        self._owner._sync(self._name)
+
+    @property
+    def version(self) -> int:
+        return self._owner.version[self._name]
+
+    def completerModel(self) -> QStringListModel:
+        self._ensure()
+        if self._model is None:
+            self._model = QStringListModel(self._values)
+        return self._model
+
+    def __getitem__(self, key):
+        self._ensure()
+        return super().__getitem__(key)
+    def __contains__(self, key):
+        self._ensure()
+        return super().__contains__(key)
+    def __iter__(self):
+        self._ensure()
+        return super().__iter__()
+    def __len__(self):
+        self._ensure()
+        return super().__len__()
+    def get(self, key, default=None):
+        self._ensure()
+        return super().get(key, default)
+    def keys(self):
+        self._ensure()
+        return super().keys()
+    def values(self):
+        self._ensure()
+        return super().values()
+    def items(self):
+        self._ensure()
+        return super().items()
+
+    # raw (non-loading) edits, used by the owner
+    def _replace(self, rows: list[tuple[Any, str]], Nochoice: dict|None):
+        dict.clear(self)
+        if Nochoice is None:
+            dict.update(self, {id_: val for id_, val in rows})
+            self._ids = [id_ for id_, _ in rows]
+            self._values = [val for _, val in rows]
+            if self._model is not None:
+                self._model.setStringList(self._values)
+        else:
+            dict.update(self, Nochoice | {val: id_ for id_, val in rows})
+
+    def _upsert_row(self, id_, val: str):
+        if dict.get(self, id_) == val:
+            return
+        if dict.__contains__(self, id_):
+            self._remove_row(id_)
+        dict.__setitem__(self, id_, val)
+        pos = bisect.bisect_right(self._values, val)
+        self._ids.insert(pos, id_)
+        self._values.insert(pos, val)
+        if self._model is not None:
+            self._model.insertRows(pos, 1)
+            self._model.setData(self._model.index(pos), val)
+
+    def _remove_row(self, id_):
+        if not dict.__contains__(self, id_):
+            return
+        dict.__delitem__(self, id_)
+        pos = self._ids.index(id_)
+        del self._ids[pos]
+        del self._values[pos]
+        if self._model is not None:
+            self._model.removeRows(pos, 1)
+# _ChoiceList
 
 class Kls_sellL6ChoiceList:
     _instance: "Kls_sellL6ChoiceList | None" = None
     _sessionMaker = app_Session
-    choices: dict[str, Any]
-    widget: dict[str, cDataList|cComboBoxFromDict]
+    choices: dict[str, _ChoiceList]
+    version: dict[str, int]
     
-    _validLists = [
-        'CIMSPKNum',
-        'WOMAid',
-        'Project',
-        'Parts',
-    ]
+    # list name: (table, choice field, widget type)
+    _listDefs = {
+        'CIMSPKNum': (WorkOrders, WorkOrders.CIMSNum, cDataList),
+        'WOMAid': (WorkOrders, WorkOrders.WOMAid, cDataList),
+        'Project': (Projects, Projects.ProjectName, cComboBoxFromDict),
+        'Parts': (Parts, Parts.GPN, cDataList),
+    }
+    _validLists = list(_listDefs)
+    Nochoice = {'---': None}    # only needed for combo boxes, not datalists
 
     @classmethod
     def instance(cls):
@@ -55,66 +153,132 @@ class Kls_sellL6ChoiceList:
         if hasattr(self, "_initialized"):
             raise RuntimeError("Use Kls_sellL6ChoiceList.instance() instead")
 
-        # put your real init code here
-        self.choices = {}
-        self.widget = {}
-        self.regen('*')
+        # nothing is read here - each list loads the first time it's used
+        self.choices = {lst: _ChoiceList(self, lst) for lst in self._validLists}
+        self.version = {lst: 0 for lst in self._validLists}
+        self._loaded: set[str] = set()
+        self._maxid: dict[str, int] = {}
+        self._pending: dict[str, set] = {lst: set() for lst in self._validLists}   # ids changed (by this process) since last sync
+        self._stale: set[str] = set()       # lists hit by bulk DML - ids unknown, so reload
 
         self._initialized = True
     # __init__
     
+    def _listDef(self, choiceList: str):
+        if choiceList not in self._listDefs:
+            raise ValueError(f'{choiceList} is not a valid choice type')
+        return self._listDefs[choiceList]
+
+    def _sync(self, choiceList: str):
+        if choiceList not in self._loaded or choiceList in self._stale:
+            self.regen(choiceList)
+        elif self._pending[choiceList]:
+            self.refresh(choiceList)
+    # _sync
+
     def regen(self, choiceList:str):
+        """Reload choiceList (or '*' for all) from scratch."""
         if choiceList == '*':
             for lst in self._validLists:
                 self.regen(lst) 
             return
         
-        tbl = None
-        choiceListType = None
-        cFld = None
-        
-        if choiceList == 'CIMSPKNum':
-            tbl = WorkOrders
-            cFld = WorkOrders.CIMSNum
-            choiceListType = cDataList
-        if choiceList == 'WOMAid':
-            tbl = WorkOrders
-            cFld = WorkOrders.WOMAid
-            choiceListType = cDataList
-        if choiceList == 'Project':
-            tbl = Projects
-            cFld = Projects.ProjectName
-            choiceListType = cComboBoxFromDict
-        if choiceList == 'Parts':
-            tbl = Parts
-            cFld = Parts.GPN
-            choiceListType = cDataList
-
-        if tbl is None or cFld is None or choiceListType is None:
-            raise ValueError(f'{choiceList} is not a valid choice type')
+        tbl, cFld, choiceListType = self._listDef(choiceList)
         
-        Nochoice = {'---': None}    # only needed for combo boxes, not datalists
-        chdict = {}
-        wdgt = cDataList({})
         with self._sessionMaker() as session:
-            stmt = select(tbl).order_by(cFld)
-            records = session.execute(stmt)
-            # retList = list(records.mappings())
-            if choiceListType is cDataList:
-                chdict = {rec.id: str(getattr(rec, cFld.key)) for rec in records.scalars()}
-                wdgt = cDataList(chdict)
-            if choiceListType is cComboBoxFromDict:
-                chdict = Nochoice | { str(getattr(rec, cFld.key)): rec.id for rec in records.scalars()}
-                wdgt = cComboBoxFromDict(chdict)
+            stmt = select(tbl.id, cFld).order_by(cFld)
+            rows = [(id_, str(val)) for id_, val in session.execute(stmt)]
         
-        self.choices[choiceList] = chdict
-        self.widget[choiceList] = wdgt
+        chlist = self.choices[choiceList]
+        chlist._replace(rows, self.Nochoice if choiceListType is cComboBoxFromDict else None)
+        self._maxid[choiceList] = max((id_ for id_, _ in rows), default=0)
+        self._pending[choiceList].clear()
+        self._stale.discard(choiceList)
+        self._loaded.add(choiceList)
+        self.version[choiceList] += 1
     #regen
+
+    def refresh(self, choiceList: str = '*'):
+        """
+        Bring choiceList (or '*' for all loaded lists) up to date, reading only
+        rows added since the last max id plus rows this process is known to have changed.
+        Falls back to regen if the row count says something else was deleted.
+        """
+        if choiceList == '*':
+            for lst in self._loaded.copy():
+                self.refresh(lst)
+            return
+        if choiceList not in self._loaded or choiceList in self._stale:
+            self.regen(choiceList)
+            return
+
+        tbl, cFld, choiceListType = self._listDef(choiceList)
+        chlist = self.choices[choiceList]
+        pending = self._pending[choiceList]
+        maxid = self._maxid[choiceList]
+
+        with self._sessionMaker() as session:
+            whr = (tbl.id > maxid)
+            if pending:
+                whr = or_(whr, tbl.id.in_(pending))
+            rows = [(id_, str(val)) for id_, val in session.execute(select(tbl.id, cFld).where(whr).order_by(cFld))]
+            dbcount = session.scalar(select(func.count()).select_from(tbl))
+
+        found = {id_ for id_, _ in rows}
+        gone = pending - found
+        changed = bool(rows or gone)
+        if choiceListType is cComboBoxFromDict:
+            # short list; rebuild (in place, sorted) from what's already there
+            current = {id_: val for val, id_ in dict.items(chlist) if id_ is not None}
+            current.update(rows)
+            for id_ in gone:
+                current.pop(id_, None)
+            chlist._replace(sorted(current.items(), key=lambda r: r[1]), self.Nochoice)
+            nrows = len(current)
+        else:
+            for id_ in gone:
+                chlist._remove_row(id_)
+            for id_, val in rows:
+                chlist._upsert_row(id_, val)
+            nrows = dict.__len__(chlist)
+        self._maxid[choiceList] = max([maxid, *found])
+        pending.clear()
+
+        if nrows != dbcount:
+            self.regen(choiceList)
+        elif changed:
+            self.version[choiceList] += 1
+    # refresh
+
+    def newWidget(self, choiceList: str, parent: QWidget|None = None) -> cDataList|cComboBoxFromDict:
+        """A new widget presenting choiceList."""
+        _, _, choiceListType = self._listDef(choiceList)
+        if choiceListType is cComboBoxFromDict:
+            return cComboBoxFromDict(self.choices[choiceList], parent)
+        return cDataList(self.choices[choiceList], parent=parent)
+
+    def _noteChanges(self, tables_ids: dict[Any, set], bulk_tables: set):
+        for lst, (tbl, _, _) in self._listDefs.items():
+            if lst not in self._loaded:
+                continue
+            if tbl.__table__ in bulk_tables:
+                self._stale.add(lst)
+            self._pending[lst] |= tables_ids.get(tbl.__table__, set())
+    # _noteChanges
+# Kls_sellL6ChoiceList
+
+# hand the ids of choice-list rows written through any Session to the choice lists, on commit
+def _choicelist_changes(changes: TableChanges):
+    if Kls_sellL6ChoiceList._instance is not None:
+        Kls_sellL6ChoiceList._instance._noteChanges(changes.rows, changes.bulk)
+
+change_tracker.subscribe(_choicelist_changes)
+
 # this line actually creates the singleton instance
 # it will be created only once, when this module is first imported
-# syntactical note: this invocation will fly, since _instance is presently None
+# going through instance() registers it as _instance, which _choicelist_changes above reports to
 # any other call to the class needs to be via Kls_sellL6ChoiceList.instance()   
-sellL6ChoiceList = Kls_sellL6ChoiceList()
+sellL6ChoiceList = Kls_sellL6ChoiceList.instance()
     
 
 ##########################################################
@@ -677,7 +841,7 @@ class WOPartsNeededForm(QWidget):
         
         modlFld, modlLbl = 'CIMSNum', 'CIMS PK/RP Num'
 
-        choices_WO = {WO.id:WO.CIMSNum  for WO in L6L10sellRepositories.WorkOrders.get_all()}
+        choices_WO = {WO.id:WO.CIMSNum  for WO in L6L10sellRepositories.WorkOrders.select_columns(WorkOrders.id, WorkOrders.CIMSNum)}
         self.wdgtCIMSNum = cQFmFldWidg(cDataList, lblText=modlLbl, choices=choices_WO, modlFld=modlFld,parent=self)
         wdgt = self.wdgtCIMSNum
         self.formFields[modlFld] = wdgt
@@ -716,7 +880,7 @@ class WOPartsNeededForm(QWidget):
         self.layoutFormHdr.addWidget(wdgt,2,1,1,6)
 
         modlFld, modlLbl = 'Project', 'Prj/Bldg/Testr'
-        choices = {rec.ProjectName:rec.id for rec in L6L10sellRepositories.Projects.get_all()}
+        choices = {rec.ProjectName:rec.id for rec in L6L10sellRepositories.Projects.select_columns(Projects.ProjectName, Projects.id)}
         self.wdgtProject = cQFmFldWidg(cComboBoxFromDict, lblText=modlLbl, modlFld=modlFld, choices=choices, parent=self)
         wdgt = self.wdgtProject
         self.formFields[modlFld] = wdgt
@@ -769,7 +933,7 @@ class WOPartsNeededForm(QWidget):
         self.WOList_items = {}      # dictionary to store {id: QListWidgetItem}
 
         # T = L6L10sellRepositories.WorkOrders.get_all(order_by='CIMSNum')
-        T = L6L10sellRepositories.WorkOrders.get_all(order_by=WorkOrders.CIMSNum)
+        T = L6L10sellRepositories.WorkOrders.select_columns(WorkOrders.id, WorkOrders.CIMSNum, order_by=WorkOrders.CIMSNum)
 
         self.wdgtFormMainNav.clear()
         
@@ -845,7 +1009,7 @@ class WOPartsNeededForm(QWidget):
     ########    Read
 
     def getRecordfromdb(self, recid:int, createFlag:bool = False) -> int:
-        T = L6L10sellRepositories.WorkOrders.get_by_id(recid, newifnotfound=createFlag)
+        T = L6L10sellRepositories.WorkOrders.get_by_id(recid, newifnotfound=createFlag, profile='record')
         self.currRec = T
         self.fillFormFromcurrRec()
         
@@ -1,26 +1,30 @@
-from typing import (Dict, Any, )
+from typing import (Dict, Any, Iterator, )
+import time
 
 from PySide6.QtCore import (
-    Qt, Slot, qDebug,
+    Qt, Slot, qDebug, QTimer, 
 )
 from PySide6.QtGui import (
     QFont, QColorConstants,
     QPalette, QBrush,
-    QTextOption, 
+    QTextOption, QTextCursor, 
     )
 from PySide6.QtSql import (QSqlTableModel, QSqlRecord, QSqlQuery, QSqlQueryModel, )
 from PySide6.QtWidgets import (
     QWidget, QScrollArea, QListWidget, QListWidgetItem,
     QHBoxLayout, QVBoxLayout, QGridLayout, 
     QTableView, 
-    QLabel, QLineEdit, QPushButton, QTextEdit
+    QLabel, QLineEdit, QPushButton, QTextEdit, QPlainTextEdit, 
 )
 
 from cMenu.utils import (cQFmFldWidg, cQFmNameLabel, cDataList, cComboBoxFromDict, clearLayout, )
 
 from app.database import app_Session
 from app.models import (WorkOrderPartsNeeded, WorkOrders, Parts, Projects, L6L10sellRepositories, )
+from app.picklist import (PICKLIST_HEADER, iter_picklist_sections, spaceoutchars, )
 
+# seconds of formatting per event-loop turn while the pick list fills in
+_PICKLIST_RENDER_SLICE = 0.03
 
 
 
@@ -41,79 +45,64 @@ class PickListReport(QWidget):
         self.setWindowTitle(self.tr(self._formname))
         layoutForm.addLayout(layoutFormHdr)
 
-        self.txtedtPickList = QTextEdit(lineWrapMode=QTextEdit.LineWrapMode.NoWrap)
+        # plain text - QPlainTextEdit lays out a line at a time, so a long report appends quickly
+        self.txtedtPickList = QPlainTextEdit(lineWrapMode=QPlainTextEdit.LineWrapMode.NoWrap)
         font = QFont()
         font.setFamily('Courier New')
         # font.setFixedPitch(True)
         font.setPointSize(12)
         self.setFont(font)
         layoutForm.addWidget(self.txtedtPickList)
+        self.txtedtPickList.setUndoRedoEnabled(False)   # the report is appended to, piece by piece
+
+        self._sections: Iterator[str]|None = None
+        self._renderTimer = QTimer(self, singleShot=True, interval=0)
+        self._renderTimer.timeout.connect(self._renderMore)
 
         self.presentPicklist()
 
     # utility?
     def spaceoutchars(self, strInput:str) -> str:
-        return '   '.join(' '.join(word) for word in strInput.split())
+        return spaceoutchars(strInput)
 
     def presentPicklist(self):
-        # lists are faster than constantly querying the db
-        lstWO = L6L10sellRepositories.WorkOrders.get_all()  # fields=['id','CIMSNum','WOMAid','Project_id','ProjectName']   
-        # and convert it to a Dict -- generalize this and move to utils
-        dictWO = { WO.id: WO for WO in lstWO }
-
-        # and do the same with projects so we get the project color
-        lstProj = L6L10sellRepositories.Projects.get_all()  # fields=['id','ProjectName','Color']
-        # and convert it to a Dict -- generalize this and move to utils
-        dictProj = { Proj.id: Proj for Proj in lstProj }
-        
-        tblallParts = L6L10sellRepositories.Parts.get_all(order_by='GPN')
-        
-        # tblWONeedingPart = L6L10sellRepositories.WorkOrderPartsNeeded.get_all()
-        
-        txtPickList = \
-""" PICKING LIST
-/\\/\\/\\/\\/\\/\\/\\
-
-"""
-
-        # for each Part
-        for part in tblallParts:
-            # collect List of WOs needing Part
-            listWONeedingPart = part.workorders_needing_part
-
-            # go through the WOList to 1) build a list and 2) get total to be picked
-            totalneeded = sum(item.targetQty for item in listWONeedingPart)
-
-            if not self._includeNegativePicks and totalneeded <= 0:
-                continue
-            
-            # Print header
-            txtPickList += \
-f"""
-{self.spaceoutchars(part.GPN)},  Σ = {totalneeded}
-------------------------------------
-"""
-            # for each WO in WOList
-            for rec in listWONeedingPart:
-                # Print line
-                tblWOid = rec.WorkOrders_id
-                tblProjid = rec.workorder.Project_id
-                qty = rec.targetQty
-                notes = rec.notes
-                txtPickList += \
-f"""{rec.workorder.WOMAid} ({rec.workorder.CIMSNum}), {rec.workorder.project.ProjectName} ({rec.workorder.project.Color}), {qty}
-"""
-                if notes:
-                    txtPickList += \
-f"""    {notes}
-"""
-                #endif notes
-                txtPickList += \
-f"""
-***************************************************
-"""
-            #endfor each WO in WOList
-        #endfor each Part
-        
-        self.txtedtPickList.setText(txtPickList)
+        # one query (totals and lines together), streamed a part at a time into the document -
+        # the first parts show right away, the rest are appended from the event loop
+        self._stopRendering()
+        self.txtedtPickList.clear()
+        self._cursor = QTextCursor(self.txtedtPickList.document())
+        self._cursor.insertText(PICKLIST_HEADER)
+        self._sections = iter_picklist_sections(self._includeNegativePicks)
+        self._renderMore()
     # presentPicklist
+
+    @Slot()
+    def _renderMore(self):
+        if self._sections is None:
+            return
+        # as many parts as fit in a time slice, appended in one insert
+        chunk = []
+        t0 = time.monotonic()
+        for section in self._sections:
+            chunk.append(section)
+            if time.monotonic() - t0 >= _PICKLIST_RENDER_SLICE:
+                break
+        else:
+            self._sections = None       # all there
+        #endfor section
+        if chunk:
+            self._cursor.movePosition(QTextCursor.MoveOperation.End)
+            self._cursor.insertText(''.join(chunk))
+        if self._sections is not None:
+            self._renderTimer.start()
+    # _renderMore
+
+    def _stopRendering(self):
+        self._renderTimer.stop()
+        if self._sections is not None:
+            self._sections.close()      # releases the cursor/session
+            self._sections = None
+
+    def closeEvent(self, event):
+        self._stopRendering()
+        super().closeEvent(event)
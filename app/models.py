@@ -3,8 +3,10 @@ from typing import Any
 import decimal
 from datetime import datetime, date
 
-from sqlalchemy.orm import (DeclarativeBase, Mapped, mapped_column, relationship, Session, )
-from sqlalchemy import (Column, Date, Index, Integer, MetaData, String, Boolean, ForeignKey, SmallInteger, UniqueConstraint, inspect, )
+from sqlalchemy.orm import (DeclarativeBase, Mapped, mapped_column, relationship, Session, 
+    joinedload, selectinload, raiseload, )
+from sqlalchemy import (Column, Computed, Date, DDL, Index, Integer, MetaData, String, Boolean, ForeignKey, SmallInteger, UniqueConstraint, 
+    event, inspect, text, )
 from sqlalchemy.exc import IntegrityError
 
 # from random import randint
@@ -107,7 +109,8 @@ class L6L10sellBase(DeclarativeBase):
 ##########################################
 ##########################################
 
-# TODO: rethink the lazy loads of relationships - cComboBoxFromDict and cDataList can do that work
+# relationships use the default lazy="select" loading; callers that need related records ask for them per query
+# with a loader profile (see L6L10sellLoaderProfiles, below, and cMenu.database.LOADER_PROFILES)
 
 class Parts(L6L10sellBase):
     __tablename__ = 'Parts'
@@ -122,15 +125,12 @@ class Parts(L6L10sellBase):
         )
     tag_prefixes: Mapped[list["TagPrefixes"]] = relationship("TagPrefixes", 
         back_populates="part", cascade="all, delete-orphan",
-        lazy="selectin" # use selectin loading for better performance when loading multiple parts with their tag prefixes
         )
     scans: Mapped[list["Scans"]] = relationship("Scans", 
         back_populates="part", cascade="all, delete-orphan", 
-        lazy="selectin"
         )
     box_configurations: Mapped[list["BoxConfigurations"]] = relationship("BoxConfigurations", 
         back_populates="part", cascade="all, delete-orphan", 
-        lazy="selectin"
         )
 
     def __repr__(self) -> str:
@@ -149,7 +149,6 @@ class Projects(L6L10sellBase):
     
     workorders: Mapped[list["WorkOrders"]] = relationship("WorkOrders", 
         back_populates="project", cascade="all, delete-orphan",
-        lazy="selectin" # use selectin loading for better performance when loading multiple projects with their workorders
         )
     
     __table_args__ = (
@@ -176,15 +175,12 @@ class WorkOrders(L6L10sellBase):
     
     project: Mapped[Projects] = relationship("Projects", 
         back_populates="workorders",
-        lazy="joined" # use joined loading for better performance when loading a workorder with its project
         )
     parts_needed: Mapped[list["WorkOrderPartsNeeded"]] = relationship("WorkOrderPartsNeeded", 
         back_populates="workorder", cascade="all, delete-orphan",
-        lazy="selectin"
         )
     scans: Mapped[list["Scans"]] = relationship("Scans", 
         back_populates="workorder", cascade="all, delete-orphan",
-        lazy="selectin"
         )
 
     __table_args__ = (
@@ -231,11 +227,9 @@ class WorkOrderPartsNeeded(L6L10sellBase):
 
     workorder: Mapped[WorkOrders] = relationship("WorkOrders", 
         back_populates="parts_needed",
-        lazy="joined" # use joined loading for better performance when loading a workorder part needed with its workorder
         )
     part: Mapped[Parts] = relationship("Parts", 
         back_populates="workorders_needing_part",
-        lazy="joined" # use joined loading for better performance when loading a part with its workorder parts needed
         )
 
     __table_args__ = (
@@ -260,7 +254,6 @@ class TagPrefixes(L6L10sellBase):
 
     part: Mapped[Parts] = relationship("Parts", 
         back_populates="tag_prefixes",
-        lazy="joined" # use joined loading for better performance when loading a tag prefix with its part
         )
 
     def __repr__(self) -> str:
@@ -287,11 +280,9 @@ class Scans(L6L10sellBase):
 
     part: Mapped[Parts] = relationship("Parts", 
         back_populates="scans",
-        lazy="joined"
         )
     workorder: Mapped[WorkOrders] = relationship("WorkOrders", 
         back_populates="scans",
-        lazy="joined"
         )
 
     __table_args__ = (
@@ -316,7 +307,6 @@ class BoxConfigurations(L6L10sellBase):
 
     part: Mapped[Parts] = relationship("Parts", 
         back_populates="box_configurations",
-        lazy="joined"
         )
 
     __table_args__ = (
@@ -329,11 +319,125 @@ class BoxConfigurations(L6L10sellBase):
     def __str__(self) -> str:
         return f"BoxConfigurations: {self.Parts_id} - {self.palletqty} - {self.boxqty} - {self.unitqty}"
     
+class PartDemandTotals(L6L10sellBase):
+    # maintained by the triggers below - the app reads it, never writes it
+    __tablename__ = 'PartDemandTotals'
+
+    Parts_id: Mapped[int] = mapped_column(Integer, ForeignKey('Parts.id', ondelete='CASCADE'), primary_key=True)
+    demand: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)     # SUM(WorkOrderPartsNeeded.targetQty)
+    picked: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)     # SUM(Scans.qty)
+    remaining: Mapped[int] = mapped_column(Integer, Computed('demand - picked'))
+
+    def __repr__(self) -> str:
+        return f"<PartDemandTotals(Parts_id={self.Parts_id}, demand={self.demand}, picked={self.picked})>"
+
+# (source table, its quantity column, the PartDemandTotals column it adds to)
+_PartDemandTotals_sources = (
+    ('WorkOrderPartsNeeded', 'targetQty', 'demand'),
+    ('Scans', 'qty', 'picked'),
+)
+
+def _PartDemandTotals_triggers() -> list[str]:
+    stmts = []
+    for src, qty, total in _PartDemandTotals_sources:
+        add = f"""INSERT INTO "PartDemandTotals" ("Parts_id", "{total}") VALUES (NEW."Parts_id", NEW."{qty}")
+            ON CONFLICT ("Parts_id") DO UPDATE SET "{total}" = "{total}" + excluded."{total}";"""
+        sub = f"""UPDATE "PartDemandTotals" SET "{total}" = "{total}" - OLD."{qty}" WHERE "Parts_id" = OLD."Parts_id";"""
+        stmts += [
+            f"""CREATE TRIGGER IF NOT EXISTS "trg_{src}_PartDemandTotals_ins" AFTER INSERT ON "{src}"
+                BEGIN {add} END""",
+            f"""CREATE TRIGGER IF NOT EXISTS "trg_{src}_PartDemandTotals_del" AFTER DELETE ON "{src}"
+                BEGIN {sub} END""",
+            f"""CREATE TRIGGER IF NOT EXISTS "trg_{src}_PartDemandTotals_upd" AFTER UPDATE OF "Parts_id", "{qty}" ON "{src}"
+                BEGIN {sub} {add} END""",
+            ]
+    #endfor src, qty, total
+    return stmts
+
+_PartDemandTotals_rebuild = """INSERT INTO "PartDemandTotals" ("Parts_id", demand, picked)
+    SELECT "Parts_id", SUM(demand), SUM(picked) FROM (
+        SELECT "Parts_id", "targetQty" AS demand, 0 AS picked FROM "WorkOrderPartsNeeded"
+        UNION ALL
+        SELECT "Parts_id", 0, qty FROM "Scans"
+        )
+    GROUP BY "Parts_id"
+    """
+
+@event.listens_for(L6L10sellBase.metadata, 'after_create')
+def _create_PartDemandTotals_triggers(target, connection, tables=(), **kw) -> None:
+    # when create_all makes the table (new database, or bootstrap to app_SCHEMA_VERSION 2), add the triggers
+    # and fill it.  On the metadata, not the table: the source tables must exist first
+    if PartDemandTotals.__table__ not in tables:
+        return
+    for stmt in _PartDemandTotals_triggers() + [_PartDemandTotals_rebuild]:
+        connection.execute(DDL(stmt))
+
 
 ##########################################################
 ##########################################################
 
-from cMenu.database import Repository
+from cMenu.database import Repository, register_loader_profiles, register_derived_table, identity_cache, change_tracker
+
+register_derived_table(PartDemandTotals.__table__, [WorkOrderPartsNeeded.__table__, Scans.__table__])
+# other clients share sellL6L10.sqlite - drop cached records when they write it
+identity_cache.watch(app_Session.kw['bind'], L6L10sellBase.metadata)
+
+# loader profiles: which relationships each kind of caller gets, per model
+L6L10sellLoaderProfiles = {
+    Parts: {
+        'list': [raiseload('*')],
+        'record': [selectinload(Parts.tag_prefixes), selectinload(Parts.box_configurations)],
+        'picklist': [
+            selectinload(Parts.workorders_needing_part)
+                .joinedload(WorkOrderPartsNeeded.workorder)
+                .joinedload(WorkOrders.project),
+            ],
+    },
+    Projects: {
+        'list': [raiseload('*')],
+        'record': [selectinload(Projects.workorders)],
+    },
+    WorkOrders: {
+        'list': [raiseload('*')],
+        'record': [
+            joinedload(WorkOrders.project),
+            selectinload(WorkOrders.parts_needed).options(
+                joinedload(WorkOrderPartsNeeded.part),
+                joinedload(WorkOrderPartsNeeded.workorder),
+                ),
+            ],
+        'picklist': [
+            joinedload(WorkOrders.project),
+            selectinload(WorkOrders.parts_needed).joinedload(WorkOrderPartsNeeded.part),
+            ],
+    },
+    PickPriorities: {
+        'list': [raiseload('*')],
+    },
+    WorkOrderPartsNeeded: {
+        'list': [raiseload('*')],
+        'record': [joinedload(WorkOrderPartsNeeded.workorder), joinedload(WorkOrderPartsNeeded.part)],
+        'picklist': [
+            joinedload(WorkOrderPartsNeeded.workorder).joinedload(WorkOrders.project),
+            joinedload(WorkOrderPartsNeeded.part),
+            ],
+    },
+    TagPrefixes: {
+        'list': [raiseload('*')],
+        'record': [joinedload(TagPrefixes.part)],
+    },
+    Scans: {
+        'list': [raiseload('*')],
+        'record': [joinedload(Scans.part), joinedload(Scans.workorder)],
+    },
+    BoxConfigurations: {
+        'list': [raiseload('*')],
+        'record': [joinedload(BoxConfigurations.part)],
+    },
+}
+for _model, _profiles in L6L10sellLoaderProfiles.items():
+    register_loader_profiles(_model, _profiles)
+
 # Create a repository for each model
 class L6L10sellRepositories():
     Parts = Repository(app_Session, Parts)
@@ -344,17 +448,19 @@ class L6L10sellRepositories():
     TagPrefixes = Repository(app_Session, TagPrefixes)
     Scans = Repository(app_Session, Scans)
     BoxConfigurations = Repository(app_Session, BoxConfigurations)
+    PartDemandTotals = Repository(app_Session, PartDemandTotals)
 
 ##########################################################
 ##########################################################
 
-L6L10sellBase.metadata.create_all(app_Session().get_bind())
-# Ensure that the tables are created when the module is imported
-# Parts()
-# Projects()
-# WorkOrders()
-# PickPriorities()
-# WorkOrderPartsNeeded()
-# TagPrefixes()
-# Scans()
-# BoxConfigurations()
+def create_app_schema(engine=None) -> None:
+    """Create the app tables that don't exist.  Normally reached through app.database.bootstrap_app_schema."""
+    L6L10sellBase.metadata.create_all(engine or app_Session().get_bind())
+
+def rebuild_part_demand_totals(engine=None) -> None:
+    """Recompute PartDemandTotals from scratch (the triggers keep it current; this is for repairs)."""
+    with (engine or app_Session().get_bind()).begin() as conn:
+        conn.execute(text('DELETE FROM "PartDemandTotals"'))
+        conn.execute(text(_PartDemandTotals_rebuild))
+    # written on a raw connection - the Session events don't see it, so tell the caches
+    change_tracker.tables_written({PartDemandTotals.__table__})
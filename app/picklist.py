@@ -0,0 +1,102 @@
+from typing import (Iterator, List, )
+from itertools import (groupby, )
+from operator import (itemgetter, )
+
+from sqlalchemy import (func, select, )
+from sqlalchemy.orm import (sessionmaker, )
+
+from .database import app_Session
+from .models import (PartDemandTotals, WorkOrderPartsNeeded, WorkOrders, Parts, Projects, )
+
+# rows fetched per round trip while the report streams
+_PICKLIST_CHUNK = 500
+
+PICKLIST_HEADER = \
+""" PICKING LIST
+/\\/\\/\\/\\/\\/\\/\\
+
+"""
+
+def spaceoutchars(strInput:str) -> str:
+    return '   '.join(' '.join(word) for word in strInput.split())
+
+def picklist_statement(includeNegativePicks:bool = False):
+    """
+    The pick list in one statement: every part with its total needed, picked and remaining
+    (PartDemandTotals, kept current by triggers) and its lines (work order, project), ordered by GPN then line.
+
+    Row columns: Parts_id, GPN, total, picked, remaining, line_id, WOMAid, CIMSNum, ProjectName, Color, targetQty, notes.
+    A part with no lines comes back once, with the line columns NULL (totals 0).
+    """
+    WOPN = WorkOrderPartsNeeded
+    totals = PartDemandTotals
+    total = func.coalesce(totals.demand, 0)
+    picked = func.coalesce(totals.picked, 0)
+    remaining = func.coalesce(totals.remaining, 0)
+    stmt = select(
+        Parts.id.label('Parts_id'), Parts.GPN, total.label('total'),
+        picked.label('picked'), remaining.label('remaining'),
+        WOPN.id.label('line_id'), WorkOrders.WOMAid, WorkOrders.CIMSNum,
+        Projects.ProjectName, Projects.Color, WOPN.targetQty, WOPN.notes,
+        )
+    if includeNegativePicks:
+        # every part, lines or not
+        stmt = (
+            stmt.select_from(Parts)
+            .outerjoin(totals, totals.Parts_id == Parts.id)
+            .outerjoin(WOPN, WOPN.Parts_id == Parts.id)
+            .outerjoin(WorkOrders, WorkOrders.id == WOPN.WorkOrders_id)
+            .outerjoin(Projects, Projects.id == WorkOrders.Project_id)
+            )
+    else:
+        # a part with a positive total has lines - driven from the totals
+        stmt = (
+            stmt.select_from(totals)
+            .join(Parts, Parts.id == totals.Parts_id)
+            .join(WOPN, WOPN.Parts_id == totals.Parts_id)
+            .join(WorkOrders, WorkOrders.id == WOPN.WorkOrders_id)
+            .join(Projects, Projects.id == WorkOrders.Project_id)
+            .where(totals.demand > 0)
+            )
+    stmt = stmt.order_by(Parts.GPN, Parts.id, WOPN.id)
+    return stmt
+
+def format_part(rows) -> str:
+    """One part's section of the report, from its picklist_statement rows."""
+    first = rows[0]
+    out: List[str] = [
+        f"""
+{spaceoutchars(first.GPN)},  Σ = {first.total},  picked {first.picked},  remaining {first.remaining}
+------------------------------------
+"""
+        ]
+    for rec in rows:
+        if rec.line_id is None:
+            continue
+        out.append(f"""{rec.WOMAid} ({rec.CIMSNum}), {rec.ProjectName} ({rec.Color}), {rec.targetQty}
+""")
+        if rec.notes:
+            out.append(f"""    {rec.notes}
+""")
+        out.append("""
+***************************************************
+""")
+    #endfor rec
+    return ''.join(out)
+
+def iter_picklist_sections(includeNegativePicks:bool = False, session_factory:sessionmaker = app_Session,
+                           chunk_size:int = _PICKLIST_CHUNK) -> Iterator[str]:
+    """
+    Yield the pick list a part at a time, as formatted text, while the rows stream from the cursor -
+    the first part is ready as soon as its rows arrive. Close the generator to stop early.
+    """
+    stmt = picklist_statement(includeNegativePicks)
+    with session_factory() as session:
+        result = session.execute(stmt, execution_options={'yield_per': chunk_size})
+        for _, rows in groupby(result, key=itemgetter(0)):
+            yield format_part(list(rows))
+    #endwith session
+
+def picklist_text(includeNegativePicks:bool = False, session_factory:sessionmaker = app_Session) -> str:
+    """The whole pick list as one string."""
+    return PICKLIST_HEADER + ''.join(iter_picklist_sections(includeNegativePicks, session_factory))
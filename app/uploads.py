@@ -0,0 +1,48 @@
+from cMenu.utils import (UpldSprdsheet, )
+
+from .database import app_Session
+from .models import (WorkOrders, WorkOrderPartsNeeded, Parts, Projects, )
+
+# cleanprocs for SprdsheetFlds (the per-cell fallback behind ColumnType):
+# spreadsheets hand back numbers as floats and codes as numbers
+def _cleanStr(val) -> str:
+    if isinstance(val, float) and val.is_integer():
+        val = int(val)
+    return str(val).strip()
+
+def _cleanInt(val) -> int:
+    if isinstance(val, float) and not val.is_integer():
+        raise ValueError('not a whole number')
+    return int(val)
+
+_STRING = [(str, _cleanStr), (int, _cleanStr), (float, _cleanStr), ]
+_WHOLENUM = [(int, _cleanInt), (float, _cleanInt), (str, _cleanInt), ]
+
+
+class WorkOrders_Upload(UpldSprdsheet):
+    """Work orders from a spreadsheet; a CIMS number already on file is updated."""
+    TargetModel = WorkOrders
+    SessionFactory = app_Session
+    SprdsheetFlds = {
+        'WOType': UpldSprdsheet.SprdsheetFldDescriptor_creator('WOType', _STRING, ColumnType='str'),
+        'CIMSNum': UpldSprdsheet.SprdsheetFldDescriptor_creator('CIMSNum', _STRING, ColumnType='str'),
+        'WOMAid': UpldSprdsheet.SprdsheetFldDescriptor_creator('WOMAid', _STRING, ColumnType='str'),
+        'MRRequestor': UpldSprdsheet.SprdsheetFldDescriptor_creator('MRRequestor', _STRING, ColumnType='str'),
+        'Project': UpldSprdsheet.SprdsheetFldDescriptor_creator('Project_id', _STRING, (Projects, 'ProjectName'), ColumnType='str'),
+        'notes': UpldSprdsheet.SprdsheetFldDescriptor_creator('notes', _STRING, ColumnType='str'),
+    }
+# endclass WorkOrders_Upload
+
+class WOPartsNeeded_Upload(UpldSprdsheet):
+    """Pick lines (parts needed by a work order) from a spreadsheet; a CIMS number/GPN pair already on file is updated."""
+    TargetModel = WorkOrderPartsNeeded
+    SessionFactory = app_Session
+    SprdsheetFlds = {
+        'CIMSNum': UpldSprdsheet.SprdsheetFldDescriptor_creator('WorkOrders_id', _STRING, (WorkOrders, 'CIMSNum'), ColumnType='str'),
+        'GPN': UpldSprdsheet.SprdsheetFldDescriptor_creator('Parts_id', _STRING, (Parts, 'GPN'), ColumnType='str'),
+        'targetQty': UpldSprdsheet.SprdsheetFldDescriptor_creator('targetQty', _WHOLENUM, ColumnType='int'),
+        'status': UpldSprdsheet.SprdsheetFldDescriptor_creator('status', _STRING, ColumnType='str'),
+        'priority': UpldSprdsheet.SprdsheetFldDescriptor_creator('priority', _STRING, ColumnType='str'),
+        'notes': UpldSprdsheet.SprdsheetFldDescriptor_creator('notes', _STRING, ColumnType='str'),
+    }
+# endclass WOPartsNeeded_Upload
@@ -1,9 +1,10 @@
-from typing import Dict, List
+from typing import Dict, List, NamedTuple
+from collections import OrderedDict
 
 from PySide6.QtCore import (QCoreApplication, 
     QDate, QDateTime, QLocale,
     QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt,
+    QSize, QTime, QTimer, QUrl, Qt,
     Signal, Slot, )
 from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
@@ -30,6 +31,23 @@ _SCRN_menuDIVWIDTH:int = 40
 _NUM_menuBUTTONS:int = 20
 _NUM_menuBUTNCOLS:int = 2
 _NUM_menuBTNperCOL: int = int(_NUM_menuBUTTONS/_NUM_menuBUTNCOLS)
+_NUM_menuPAGECACHE: int = 32      # built menu pages kept (visited + prefetched)
+
+class _menuBtnState(NamedTuple):
+    text: str
+    enabled: bool
+    TopLine: bool
+    BottomLine: bool
+_menuBtnBLANK = _menuBtnState('\n\n', False, False, False)
+
+class _menuPageState(NamedTuple):
+    """Everything displayMenu puts on screen for one menu, plus the menu itself (for handleMenuButtonClick)"""
+    menuGroup: int|str
+    menuID: int|str
+    menuName: str
+    version: str
+    buttons: tuple         # of _menuBtnState, one per button
+    menuItems: Dict[int, Dict]
 
 #############################################
 #############################################
@@ -67,6 +85,10 @@ class cMenu(QWidget):
         self.lblmenuName: QLabel = QLabel("")
         self._menuSOURCE = MenuRecords()
         self.currentMenu: Dict[int,Dict] = {}
+        # built menu pages, LRU order; dropped wholesale when the menu tree changes
+        self._pageCache: OrderedDict[tuple, _menuPageState] = OrderedDict()
+        self._pageCacheVersion: int = MenuRecords.treeVersion
+        self._shownPage: _menuPageState|None = None
         
         self.childScreens: Dict[str,QWidget] = {}
 
@@ -121,28 +143,104 @@ class cMenu(QWidget):
             childScreen.show()
 
     def clearoutMenu(self):
-        self.lblmenuID.display("")
-        self.lblmenuName.setText("")
-        for bNum in range(_NUM_menuBTNperCOL):
-            self.menuButton[bNum].setText("\n\n")
-            self.menuButton[bNum].setEnabled(False)
-            self.menuButton[bNum+_NUM_menuBTNperCOL].setText("\n\n")
-            self.menuButton[bNum+_NUM_menuBTNperCOL].setEnabled(False)
+        grp = self._shownPage.menuGroup if self._shownPage else ''
+        self._applyPageState(_menuPageState(grp, '', '', sysver["DEV"], (_menuBtnBLANK,)*_NUM_menuBUTTONS, {}))
+        self.currentMenu = {}
     
-    def displayMenu(self, menuGroup:int, menuID:int, menuItems:Dict[int,Dict]):
-        # self.lblmenuID.setText(f'{menuGroup},{menuID}\n{sysver["DEV"]}')
-        self.lblmenuGroupID.display(menuGroup)
-        self.lblmenuID.display(menuID)
-        self.lblVersion.setText(sysver["DEV"])
-        self.lblmenuName.setText(str(menuItems[0]['OptionText']))
+    def _buildPageState(self, menuGroup:int, menuID:int) -> _menuPageState|None:
+        SRC = self._menuSOURCE
+        if not SRC.menuExist(menuGroup, menuID):
+            return None
+        menuItems = SRC.menuDict(menuGroup, menuID)
+        btns = []
         for n in range(_NUM_menuBUTTONS):
             if n+1 in menuItems:
-                self.menuButton[n].setText(f'\n{menuItems[n+1]["OptionText"]}\n')
-                self.menuButton[n].setEnabled(True)
+                itm = menuItems[n+1]
+                btns.append(_menuBtnState(f'\n{itm["OptionText"]}\n', True, bool(itm.get('TopLine')), bool(itm.get('BottomLine'))))
             else:
-                self.menuButton[n].setText(f'\n\n')
-                self.menuButton[n].setEnabled(False)
-                pass
+                btns.append(_menuBtnBLANK)
+        #endfor n
+        return _menuPageState(menuGroup, menuID, str(menuItems[0]['OptionText']), sysver["DEV"], tuple(btns), menuItems)
+    # _buildPageState
+
+    def _pageState(self, menuGroup:int, menuID:int) -> _menuPageState|None:
+        """The built page for (menuGroup, menuID) from the LRU, building it if needed. None if the menu doesn't exist."""
+        if self._pageCacheVersion != MenuRecords.treeVersion:
+            # menus were edited since these pages were built
+            self._pageCache.clear()
+            self._pageCacheVersion = MenuRecords.treeVersion
+        key = (menuGroup, menuID)
+        page = self._pageCache.get(key)
+        if page is not None:
+            self._pageCache.move_to_end(key)
+            return page
+        page = self._buildPageState(menuGroup, menuID)
+        if page is not None:
+            self._pageCache[key] = page
+            while len(self._pageCache) > _NUM_menuPAGECACHE:
+                self._pageCache.popitem(last=False)
+        return page
+    # _pageState
+
+    def _applyPageState(self, page:_menuPageState):
+        # touch only what differs from what's on screen - every setText/setEnabled costs a relayout/repaint
+        shown = self._shownPage
+        if shown is None or shown.menuGroup != page.menuGroup:
+            self.lblmenuGroupID.display(page.menuGroup)
+        if shown is None or shown.menuID != page.menuID:
+            self.lblmenuID.display(page.menuID)
+        if shown is None or shown.version != page.version:
+            self.lblVersion.setText(page.version)
+        if shown is None or shown.menuName != page.menuName:
+            self.lblmenuName.setText(page.menuName)
+        for n, btnState in enumerate(page.buttons):
+            oldState = shown.buttons[n] if shown is not None else None
+            if btnState == oldState:
+                continue
+            btn = self.menuButton[n]
+            if oldState is None or oldState.text != btnState.text:
+                btn.setText(btnState.text)
+            if oldState is None or oldState.enabled != btnState.enabled:
+                btn.setEnabled(btnState.enabled)
+            if oldState is None or (oldState.TopLine, oldState.BottomLine) != (btnState.TopLine, btnState.BottomLine):
+                # exposed for stylesheets, e.g. QPushButton[TopLine="true"] { border-top: ... }
+                btn.setProperty('TopLine', btnState.TopLine)
+                btn.setProperty('BottomLine', btnState.BottomLine)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+        #endfor n
+        self._shownPage = page
+    # _applyPageState
+
+    def _prefetchPages(self, page:_menuPageState):
+        # build the pages this one's LoadMenu options lead to, so the next click is just a diff
+        if self._shownPage is not page:
+            return      # user has already moved on
+        SRC = self._menuSOURCE
+        # same group handleMenuButtonClick will ask loadMenu for
+        targetGroup = self.menuGroup if self.menuGroup != self._DFLT_menuGroup else SRC.dfltMenuGroup()
+        if targetGroup is None:
+            return
+        for itm in page.menuItems.values():
+            if MENUCOMMANDS.get(itm.get('Command')) != 'LoadMenu':
+                continue
+            try:
+                targetID = int(itm['Argument'])
+            except (TypeError, ValueError):
+                continue
+            if (targetGroup, targetID) not in self._pageCache:
+                self._pageState(targetGroup, targetID)
+        #endfor itm
+    # _prefetchPages
+
+    def displayMenu(self, menuGroup:int, menuID:int):
+        page = self._pageState(menuGroup, menuID)
+        if page is None:
+            self.clearoutMenu()
+            return
+        self.currentMenu = page.menuItems
+        self._applyPageState(page)
+        QTimer.singleShot(0, lambda: self._prefetchPages(page))
      
     def loadMenu(self, menuGroup: int = menuGroup, menuID: int = _DFLT_menuID):
         SRC = self._menuSOURCE
@@ -174,9 +272,8 @@ class cMenu(QWidget):
         self.intmenuGroup = menuGroup
         self.intmenuID = menuID
         
-        if SRC.menuExist(menuGroup, menuID):
-            self.currentMenu = SRC.menuDict(menuGroup, menuID)
-            self.displayMenu(menuGroup, menuID, self.currentMenu)
+        if self._pageState(menuGroup, menuID) is not None:
+            self.displayMenu(menuGroup, menuID)
         else:
             # menu doesn't exist; say so
             msg = QMessageBox(self)
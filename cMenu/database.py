@@ -1,16 +1,16 @@
 # from PySide6.QtSql import (QSqlDatabase, QSqlQuery )
 
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from .dbengine import create_sqlite_engine
+
 rootdir = "."
 cMenu_dbName = f"{rootdir}\\cMenudb.sqlite"
 
 # an Engine, which the Session will use for connection
 # resources, typically in module scope
-cMenu_engine = create_engine(
-    f"sqlite:///{cMenu_dbName}",
-    )
+# connection PRAGMAs (WAL, cache, foreign keys, etc) come from the dbconfig profile
+cMenu_engine = create_sqlite_engine(cMenu_dbName)
 # a sessionmaker(), also in the same scope as the engine
 cMenu_Session = sessionmaker(cMenu_engine)
 
@@ -21,11 +21,361 @@ def get_cMenu_session():
 ###################    REPOSITORIES    ###################
 ##########################################################
 
-from sqlalchemy import select
-from typing import Generic, Sequence, TypeVar, Type
+from collections import OrderedDict
+from itertools import chain
+import os
+import sqlite3
+from threading import RLock
+from urllib.request import pathname2url
+
+from sqlalchemy import Row, UniqueConstraint, and_, event, exists as sql_exists, func, inspect, or_, select, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+from typing import Any, Callable, Generic, Iterator, NamedTuple, Sequence, TypeVar, Type
+
+from dbconfig import (identity_cache_size, dbconfig_key, )
 
 T = TypeVar("T")  # entity type
 
+# SQLite caps the number of bound parameters per statement (999 in older builds), so IN lists are chunked
+SQLITE_MAX_INLIST = 900
+
+##########################################################
+###################   LOADER PROFILES   ##################
+##########################################################
+
+# models keep the default lazy="select" relationships; callers say how much of the graph they need, per query,
+# by naming a loader profile.  Each model registers {profile name: [loader options]} for the profiles it supports
+#   'list'     - rows for lists/tables/choices; touching a relationship raises instead of quietly loading
+#   'record'   - one record for a record form, with the relationships the form displays
+#   'picklist' - what the pick list needs
+LOADER_PROFILES = ('list', 'record', 'picklist', )
+_loader_profiles: dict[type, dict[str, list]] = {}
+
+def register_loader_profiles(model: type, profiles: dict[str, list]) -> None:
+    """
+    Register the loader options for each named profile of model.
+
+    :param model: ORM model class
+    :param profiles: {profile name: [loader options, e.g. selectinload(model.rel)]}
+    """
+    for profile in profiles:
+        if profile not in LOADER_PROFILES:
+            raise ValueError(f'{profile} is not a known loader profile')
+    _loader_profiles.setdefault(model, {}).update(profiles)
+
+def loader_options(model: type, profile: str|None) -> list:
+    """
+    Return the loader options for model under profile.
+    None, or a profile the model hasn't registered, gives [] (the model's default lazy loading).
+    """
+    if profile is None:
+        return []
+    if profile not in LOADER_PROFILES:
+        raise ValueError(f'{profile} is not a known loader profile')
+    return list(_loader_profiles.get(model, {}).get(profile, []))
+
+##########################################################
+###################   IDENTITY CACHE   ###################
+##########################################################
+
+# a process-wide LRU of detached records, keyed by (model, pk).  A record loaded under different
+# loader profiles has a different graph attached, so each (model, pk) slot holds one copy per profile.
+# Callers never get the cached instance itself - get() hands back a copy made by Session.merge(load=False)
+# (no SQL), so a form can edit its current record without touching the cache.
+# Invalidation is automatic and deliberately coarse: a Session flush, commit or bulk INSERT/UPDATE/DELETE on a
+# table (reported by change_tracker, below) drops every cached model whose relationships can reach that table
+# (a cached WorkOrders 'record' carries its parts_needed), so a write never leaves a stale graph behind.
+# Writes that don't go through a Session here - another process sharing the file, or a raw connection in this
+# one - are caught by watch(): before a lookup, PRAGMA data_version tells whether anyone else has committed to
+# the file, and if so everything cached from it is dropped
+class _DataVersionWatch:
+    """PRAGMA data_version of one SQLite file, read on a private read-only connection. It changes whenever
+    another connection - another process, or any other connection in this one - commits to the file."""
+    def __init__(self, path: str, metadata):
+        self.path = path
+        self.metadata = metadata
+        self._conn: sqlite3.Connection|None = None
+        self._version = None
+
+    def changed(self) -> bool:
+        """True if the file may have changed since the last call (or can't be read)."""
+        try:
+            if self._conn is None:
+                uri = 'file:' + pathname2url(os.path.abspath(self.path)) + '?mode=ro'
+                self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            version = self._conn.execute('PRAGMA data_version').fetchone()[0]
+        except sqlite3.Error:
+            self._conn = None
+            return True
+        changed, self._version = version != self._version, version
+        return changed
+# endclass _DataVersionWatch
+
+class IdentityCache:
+    def __init__(self, maxsize: int = 2000):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[type, Any], dict[str|None, Any]] = OrderedDict()
+        self._lock = RLock()
+        self._watches: list[_DataVersionWatch] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_drops = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _pk_of(obj) -> Any:
+        return inspect(type(obj)).primary_key_from_instance(obj)[0]
+
+    def get(self, model: type, pk: Any, profile: str|None = None) -> Any|None:
+        """
+        Return a detached copy of the cached (model, pk) record loaded under profile, or None on a miss.
+        """
+        with self._lock:
+            self._dropStale()
+            slot = self._entries.get((model, pk))
+            obj = slot.get(profile) if slot is not None else None
+            if obj is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((model, pk))
+            self.hits += 1
+        return self._copy(obj)
+
+    def put(self, obj, profile: str|None = None) -> None:
+        """
+        Cache a copy of the detached record obj, loaded under profile.
+        """
+        if obj is None or self.maxsize <= 0:
+            return
+        pk = self._pk_of(obj)
+        if pk is None:
+            return
+        cpy = self._copy(obj)
+        with self._lock:
+            key = (type(obj), pk)
+            self._entries.setdefault(key, {})[profile] = cpy
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def watch(self, engine, metadata) -> None:
+        """
+        Drop the cached records of metadata's models whenever engine's SQLite file is written by
+        another connection (see _DataVersionWatch). In-memory databases have no other writers.
+        """
+        path = engine.url.database
+        if engine.dialect.name != 'sqlite' or not path or path == ':memory:':
+            return
+        with self._lock:
+            self._watches.append(_DataVersionWatch(path, metadata))
+
+    def _dropStale(self) -> None:
+        # under _lock.  Our own commits move data_version too (they're made on other connections), so this
+        # also drops records a flush already refreshed the cache for - coarse, but never stale
+        for watch in self._watches:
+            if watch.changed():
+                stale = [k for k in self._entries if getattr(k[0], 'metadata', None) is watch.metadata]
+                for key in stale:
+                    del self._entries[key]
+                self.stale_drops += len(stale)
+
+    @staticmethod
+    def _copy(obj) -> Any:
+        # merge(load=False) copies the loaded state (and loaded relationships) without going to the db
+        session = Session()
+        try:
+            cpy = session.merge(obj, load=False)
+            session.expunge_all()
+        finally:
+            session.close()
+        return cpy
+
+    def invalidate(self, model: type, pk: Any) -> None:
+        """Drop (model, pk) under every profile."""
+        with self._lock:
+            self._entries.pop((model, pk), None)
+
+    def invalidate_models(self, models) -> None:
+        """Drop everything cached for the given model classes."""
+        models = set(models)
+        if not models:
+            return
+        with self._lock:
+            for key in [k for k in self._entries if k[0] in models]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for tuning maxsize."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'stale_drops': self.stale_drops,
+                'hit_ratio': (self.hits / lookups) if lookups else 0.0,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.stale_drops = 0
+# endclass IdentityCache
+
+identity_cache = IdentityCache(identity_cache_size.get(dbconfig_key, 2000))
+
+_reachable_tables_memo: dict[type, frozenset] = {}
+
+def _reachable_tables(model: type) -> frozenset:
+    """model's table plus every table reachable from it through relationships (any depth)"""
+    if model not in _reachable_tables_memo:
+        tables = set()
+        seen = set()
+        todo = [inspect(model)]
+        while todo:
+            mapper = todo.pop()
+            if mapper in seen:
+                continue
+            seen.add(mapper)
+            tables.add(mapper.local_table)
+            todo.extend(rel.mapper for rel in mapper.relationships)
+        _reachable_tables_memo[model] = frozenset(tables)
+    return _reachable_tables_memo[model]
+
+def _invalidate_tables(tables) -> None:
+    """drop every cached record whose loaded graph could include a row of one of tables"""
+    if not tables:
+        return
+    with identity_cache._lock:
+        models = {k[0] for k in identity_cache._entries}
+    identity_cache.invalidate_models(m for m in models if not _reachable_tables(m).isdisjoint(tables))
+
+##########################################################
+###################   CHANGE TRACKER   ###################
+##########################################################
+
+class TableChanges(NamedTuple):
+    """What was written: rows by primary key, and tables written in bulk (rows unknown)."""
+    rows: dict[Any, set]    # {table: {primary key values}} - flushed through the ORM
+    bulk: set               # tables written by bulk/Core DML, by triggers, or outside any Session
+
+    @property
+    def tables(self) -> set:
+        return set(self.rows) | self.bulk
+
+    def __bool__(self) -> bool:
+        return bool(self.rows or self.bulk)
+# endclass TableChanges
+
+# one set of Session listeners collects what every Session writes, and hands it to whatever caches subscribe
+# (the identity cache here, the app's choice lists, the menu tree): at each flush or bulk statement to
+# subscribers that must drop entries straight away, and at commit - everything the transaction wrote - to the rest.
+# A rollback forgets the transaction's changes
+class ChangeTracker:
+    def __init__(self):
+        self._atFlush: list[Callable[[TableChanges], None]] = []
+        self._atCommit: list[Callable[[TableChanges], None]] = []
+        self._derived: dict[Any, set] = {}  # {source table: {tables the database writes when it's written}}
+
+    def subscribe(self, callback: Callable[[TableChanges], None], at_flush: bool = False) -> None:
+        """
+        Call callback(TableChanges) after every commit that wrote something (at_flush: after every flush
+        and before every bulk statement instead - those changes may yet be rolled back).
+        """
+        (self._atFlush if at_flush else self._atCommit).append(callback)
+
+    def register_derived_table(self, table, sources) -> None:
+        """
+        Record that the database writes table (e.g. with triggers) whenever one of sources is written,
+        so a write to a source is also reported as a bulk write to table.
+        """
+        for src in sources:
+            self._derived.setdefault(src, set()).add(table)
+
+    def tables_written(self, tables) -> None:
+        """Report tables written (and committed) outside any Session - e.g. through engine.begin()."""
+        changes = TableChanges({}, self._withDerived(tables))
+        self._notify(self._atFlush, changes)
+        self._notify(self._atCommit, changes)
+
+    def _withDerived(self, tables) -> set:
+        tables = set(tables)
+        return tables.union(*(self._derived.get(t, ()) for t in tables))
+
+    @staticmethod
+    def _notify(callbacks, changes: TableChanges) -> None:
+        if changes:
+            for callback in callbacks:
+                callback(changes)
+
+    @staticmethod
+    def _pending(session) -> TableChanges:
+        if 'change_tracker' not in session.info:
+            session.info['change_tracker'] = TableChanges({}, set())
+        return session.info['change_tracker']
+
+    def _after_flush(self, session, flush_context):
+        flushed = TableChanges({}, set())
+        for obj in chain(session.new, session.dirty, session.deleted):
+            mapper = inspect(type(obj))
+            pk = mapper.primary_key_from_instance(obj)
+            flushed.rows.setdefault(mapper.local_table, set()).add(pk[0] if len(pk) == 1 else tuple(pk))
+        flushed.bulk.update(self._withDerived(flushed.rows) - set(flushed.rows))
+        pending = self._pending(session)
+        for table, pks in flushed.rows.items():
+            pending.rows.setdefault(table, set()).update(pks)
+        pending.bulk.update(flushed.bulk)
+        self._notify(self._atFlush, flushed)
+
+    def _do_orm_execute(self, orm_execute_state):
+        # bulk/Core DML through a Session (e.g. Repository.add_many, update(Model).where(...)) - there's no flush to watch
+        if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        table = getattr(orm_execute_state.statement, 'table', None)
+        if table is None:
+            return
+        written = TableChanges({}, self._withDerived({table}))
+        self._pending(orm_execute_state.session).bulk.update(written.bulk)
+        self._notify(self._atFlush, written)
+
+    def _after_commit(self, session):
+        self._notify(self._atCommit, session.info.pop('change_tracker', TableChanges({}, set())))
+
+    def _after_rollback(self, session):
+        session.info.pop('change_tracker', None)
+# endclass ChangeTracker
+
+change_tracker = ChangeTracker()
+event.listen(Session, "after_flush", change_tracker._after_flush)
+event.listen(Session, "do_orm_execute", change_tracker._do_orm_execute)
+event.listen(Session, "after_commit", change_tracker._after_commit)
+event.listen(Session, "after_rollback", change_tracker._after_rollback)
+
+def register_derived_table(table, sources) -> None:
+    """Record that the database writes table whenever one of sources is written (see ChangeTracker.register_derived_table)."""
+    change_tracker.register_derived_table(table, sources)
+
+def _identity_cache_changes(changes: TableChanges) -> None:
+    _invalidate_tables(changes.tables)
+
+# drop at the flush, and again at commit, so a read between flush and commit can't leave a stale copy behind
+change_tracker.subscribe(_identity_cache_changes, at_flush=True)
+change_tracker.subscribe(_identity_cache_changes)
+
+##########################################################
+
 class Repository(Generic[T]):
     def __init__(self, session_factory, model: Type[T]):
         self._session_factory = session_factory
@@ -34,7 +384,8 @@ class Repository(Generic[T]):
     def get_all(
         self,
         whereclause=None,
-        order_by=None
+        order_by=None,
+        profile: str|None = None
     ) -> list[T]:    # | list[tuple]:
         """
         Retrieve records with optional fields, filter, and ordering.
@@ -43,10 +394,11 @@ class Repository(Generic[T]):
             # fields is deprecated - get_all needs to always return an ORM instance - have the caller build a dict instead
         :param whereclause: SQLAlchemy expression for filtering
         :param order_by: column(s) or ORM attributes for ordering
+        :param profile: loader profile naming the relationships to load (see LOADER_PROFILES)
         """
 
         # Build select
-        stmt = select(self._model)
+        stmt = select(self._model).options(*loader_options(self._model, profile))
 
         if whereclause is not None:
             stmt = stmt.where(whereclause)
@@ -61,21 +413,251 @@ class Repository(Generic[T]):
             rs = session.execute(stmt)
 
             # Full model objects
-            results = rs.scalars().all()
+            results = rs.unique().scalars().all()
             for row in results:
                 session.expunge(row)
 
         return results
+
+    def select_columns(
+        self,
+        *cols,
+        whereclause=None,
+        order_by=None,
+        as_columns: bool = False
+    ) -> list[Row] | dict[str, list]:
+        """
+        Retrieve only the given columns - no ORM objects, so no relationship loading at all.
+
+        :param cols: column names or ORM attributes (e.g. WorkOrders.id, 'CIMSNum')
+        :param whereclause: SQLAlchemy expression for filtering
+        :param order_by: column(s) or ORM attributes for ordering
+        :param as_columns: return {column name: [values]} instead of a list of rows
+        :return: list of Rows (tuples with attribute access by column name), or column arrays
+        """
+        if not cols:
+            raise ValueError("select_columns needs at least one column")
+        selcols = [getattr(self._model, c) if isinstance(c, str) else c for c in cols]
+
+        stmt = select(*selcols)
+        if whereclause is not None:
+            stmt = stmt.where(whereclause)
+        if order_by is not None:
+            if isinstance(order_by, (list, tuple)):
+                stmt = stmt.order_by(*order_by)
+            else:
+                stmt = stmt.order_by(order_by)
+
+        with self._session_factory() as session:
+            rs = session.execute(stmt)
+            colnames = list(rs.keys())
+            rows = rs.all()
+
+        if as_columns:
+            return {name: list(vals) for name, vals in zip(colnames, zip(*rows))} if rows else {name: [] for name in colnames}
+        return list(rows)
+
+    def _keyset(self, order_by=None) -> tuple[Any, Any, bool]:
+        """
+        Resolve order_by into the (sort column, primary key column, descending) used for keyset paging.
+
+        :param order_by: None (page on the primary key), a column name, an ORM attribute, or attr.desc()
+        """
+        pk = inspect(self._model).primary_key[0]
+        if order_by is None:
+            return pk, pk, False
+        if isinstance(order_by, (list, tuple)):
+            if len(order_by) != 1:
+                raise ValueError("keyset paging takes a single sort column")
+            order_by = order_by[0]
+
+        descending = False
+        sortcol = order_by
+        if isinstance(sortcol, UnaryExpression):
+            descending = sortcol.modifier is operators.desc_op
+            sortcol = sortcol.element
+        if isinstance(sortcol, str):
+            sortcol = getattr(self._model, sortcol)
+        if getattr(sortcol, 'expression', sortcol).compare(pk):
+            # Model.id, 'id' or Model.id.desc() - page on the primary key alone
+            sortcol = pk
+        return sortcol, pk, descending
+
+    @staticmethod
+    def _nullable(col) -> bool:
+        """True unless col is known to be NOT NULL (an expression that isn't a plain column may be NULL)."""
+        return getattr(getattr(col, 'expression', col), 'nullable', True)
+
+    def _seek(self, after_key, order_by=None):
+        """
+        The WHERE clause for the rows after after_key in keyset_order(order_by).
+
+        SQLite sorts NULL below every value - first ascending, last descending - and a tuple
+        comparison with a NULL in it is never true, so NULL sort values get their own branches.
+        """
+        sortcol, pk, descending = self._keyset(order_by)
+        if sortcol is pk:
+            return pk < after_key if descending else pk > after_key
+        sortval, pkval = after_key
+        pkafter = pk < pkval if descending else pk > pkval
+        if sortval is None:
+            # in the NULLs: the rest of them, then (ascending) every non-NULL row
+            nullrest = and_(sortcol.is_(None), pkafter)
+            return nullrest if descending else or_(nullrest, sortcol.is_not(None))
+        seek = tuple_(sortcol, pk)
+        seek = seek < tuple_(sortval, pkval) if descending else seek > tuple_(sortval, pkval)
+        if descending and self._nullable(sortcol):
+            # the NULLs come after every value
+            seek = or_(seek, sortcol.is_(None))
+        return seek
+
+    def keyset_order(self, order_by=None) -> list:
+        """The ORDER BY get_page pages in: the sort column, then the primary key to break ties."""
+        sortcol, pk, descending = self._keyset(order_by)
+        if sortcol is pk:
+            return [pk.desc() if descending else pk]
+        return [sortcol.desc(), pk.desc()] if descending else [sortcol, pk]
+
+    def page_key(self, rec: T, order_by=None) -> Any:
+        """
+        Return the key of rec to pass as after_key to get_page for the page following rec.
+        This is the primary key value, or (sort value, primary key value) when order_by is given.
+        """
+        sortcol, pk, _ = self._keyset(order_by)
+        if sortcol is pk:
+            return getattr(rec, pk.key)
+        return (getattr(rec, sortcol.key), getattr(rec, pk.key))
+
+    def get_page(
+        self,
+        after_key=None,
+        limit: int = 100,
+        whereclause=None,
+        order_by=None,
+        profile: str|None = None,
+        offset: int = 0
+    ) -> list[T]:
+        """
+        Retrieve one page of detached records using keyset (seek) pagination.
+
+        :param after_key: page_key() of the last record of the previous page; None for the first page
+        :param limit: maximum number of records to return
+        :param whereclause: SQLAlchemy expression for filtering
+        :param order_by: single sort column (see _keyset); the primary key breaks ties. A nullable
+            column pages its NULLs too (first ascending, last descending - see _seek)
+        :param profile: loader profile naming the relationships to load (see LOADER_PROFILES)
+        :param offset: records to skip first - only for jumping to a page whose after_key isn't known;
+            the database still walks the skipped rows, so prefer after_key
+        """
+        stmt = select(self._model).options(*loader_options(self._model, profile))
+        if whereclause is not None:
+            stmt = stmt.where(whereclause)
+
+        if after_key is not None:
+            stmt = stmt.where(self._seek(after_key, order_by))
+        stmt = stmt.order_by(*self.keyset_order(order_by))
+        if offset:
+            stmt = stmt.offset(offset)
+        stmt = stmt.limit(limit)
+
+        with self._session_factory() as session:
+            results = session.execute(stmt).unique().scalars().all()
+            for row in results:
+                session.expunge(row)
+
+        return list(results)
+
+    def iter_all(
+        self,
+        whereclause=None,
+        order_by=None,
+        page_size: int = 500,
+        profile: str|None = None
+    ) -> Iterator[T]:
+        """
+        Yield every matching record, detached, fetching page_size rows at a time.
+        Only one page is held in memory, no matter how big the table is.
+
+        :param whereclause: SQLAlchemy expression for filtering
+        :param order_by: single sort column (see _keyset); default is the primary key
+        :param page_size: number of records fetched per query
+        :param profile: loader profile naming the relationships to load (see LOADER_PROFILES)
+        """
+        after_key = None
+        while True:
+            page = self.get_page(after_key, page_size, whereclause, order_by, profile)
+            yield from page
+            if len(page) < page_size:
+                return
+            after_key = self.page_key(page[-1], order_by)
     
-    def get_by_id(self, id_: int, newifnotfound: bool = False) -> T | None:
+    def get_by_id(self, id_: int, newifnotfound: bool = False, profile: str|None = None) -> T | None:
         with self._session_factory() as session:
-            obj = session.get(self._model, id_)
+            obj = identity_cache.get(self._model, id_, profile)
+            if obj is not None:
+                return obj
+            obj = session.get(self._model, id_, options=loader_options(self._model, profile))
             if obj:
                 session.expunge(obj)
+                identity_cache.put(obj, profile)
             elif newifnotfound:
                 obj = self._model(id=id_) # type: ignore
             return obj
 
+    def get_many(self, ids, chunk_size: int = SQLITE_MAX_INLIST, profile: str|None = None) -> dict[Any, T]:
+        """
+        Retrieve many records by primary key with IN queries instead of one get per id.
+
+        :param ids: iterable of primary key values; duplicates and None are ignored
+        :param chunk_size: maximum number of ids per IN list
+        :param profile: loader profile naming the relationships to load (see LOADER_PROFILES)
+        :return: {id: detached record} - ids not found are simply absent
+        Records already in identity_cache are served from it; only the rest are queried.
+        """
+        pk = inspect(self._model).primary_key[0]
+        results: dict[Any, T] = {}
+        idlist = []
+        for i in dict.fromkeys(i for i in ids if i is not None):
+            obj = identity_cache.get(self._model, i, profile)
+            if obj is not None:
+                results[i] = obj
+            else:
+                idlist.append(i)
+
+        with self._session_factory() as session:
+            for start in range(0, len(idlist), chunk_size):
+                stmt = (select(self._model)
+                    .options(*loader_options(self._model, profile))
+                    .where(pk.in_(idlist[start:start+chunk_size]))
+                    )
+                for row in session.execute(stmt).unique().scalars():
+                    session.expunge(row)
+                    identity_cache.put(row, profile)
+                    results[getattr(row, pk.key)] = row
+        return results
+
+    def exists(self, whereclause=None) -> bool:
+        """
+        True if any record matches whereclause (or, with no whereclause, if the table has any rows).
+        Runs SELECT EXISTS(...) - no ORM objects are built.
+        """
+        subq = select(self._model.__table__)   # type: ignore
+        if whereclause is not None:
+            subq = subq.where(whereclause)
+        with self._session_factory() as session:
+            return bool(session.scalar(select(sql_exists(subq))))
+
+    def count(self, whereclause=None) -> int:
+        """
+        Number of records matching whereclause (all records if None).
+        Runs SELECT count(*) - no ORM objects are built.
+        """
+        stmt = select(func.count()).select_from(self._model)
+        if whereclause is not None:
+            stmt = stmt.where(whereclause)
+        with self._session_factory() as session:
+            return session.scalar(stmt) or 0
+
     def add(self, entity: T) -> T:
         with self._session_factory() as session:
             session.add(entity)
@@ -84,6 +666,91 @@ class Repository(Generic[T]):
             session.expunge(entity)
         return entity
 
+    def _conflict_columns(self) -> list[str]:
+        """
+        Columns of the table's unique constraint (the primary key if there is none).  table.constraints
+        is a set, so with more than one there is no "first" - the caller has to name it.
+        """
+        table = self._model.__table__   # type: ignore
+        # unique=True on a column and a UniqueConstraint on the same column are the same key
+        keysets = {
+            tuple(col.name for col in constraint.columns)
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint) and constraint.columns
+            }
+        if len(keysets) > 1:
+            raise ValueError(f'{table.name} has several unique constraints {sorted(keysets)} - pass conflict_cols')
+        if keysets:
+            return list(keysets.pop())
+        return [col.name for col in table.primary_key.columns]
+
+    def _insert_row(self, entity) -> dict[str, Any]:
+        """Column-name dict for an insert; ORM instances drop None values so server/column defaults apply."""
+        if isinstance(entity, dict):
+            return dict(entity)
+        mapper = inspect(self._model)
+        row = {}
+        for attr in mapper.column_attrs:
+            val = getattr(entity, attr.key)
+            if val is not None:
+                row[attr.columns[0].name] = val
+        return row
+
+    def add_many(
+        self,
+        entities,
+        on_conflict: str|None = None,
+        conflict_cols: Sequence[str]|None = None,
+        batch_size: int = 1000
+    ) -> list[Any]:
+        """
+        Insert many records in one transaction with Core INSERT statements (no per-row flush/refresh).
+
+        :param entities: iterable of model instances and/or dicts of {column name: value}
+        :param on_conflict: None (a conflict raises), "ignore" (skip conflicting rows), or
+            "update" (overwrite the existing row with the supplied values)
+        :param conflict_cols: columns of the unique constraint to test; default is the table's unique constraint
+            (required when the table has more than one)
+        :param batch_size: rows per INSERT
+        :return: primary keys of the rows inserted (and, for "update", the rows updated).  Rows are written
+            grouped by the set of keys they supply, so the ids come back grouped the same way - not in input
+            order - and "ignore" leaves out the rows it skipped
+        :raises ValueError: bad on_conflict, or no conflict_cols for a table with several unique constraints
+        """
+        if on_conflict not in (None, "ignore", "update"):
+            raise ValueError(f'{on_conflict} is not a valid on_conflict choice')
+
+        table = self._model.__table__   # type: ignore
+        pk = table.primary_key.columns[0]
+        if on_conflict:
+            conflict_cols = list(conflict_cols) if conflict_cols else self._conflict_columns()
+
+        # rows with the same set of keys go in the same statement, so column defaults fill the rest
+        rowgroups: dict[frozenset, list[dict[str, Any]]] = {}
+        for entity in entities:
+            row = self._insert_row(entity)
+            rowgroups.setdefault(frozenset(row), []).append(row)
+
+        new_ids = []
+        with self._session_factory() as session:
+            for keys, rows in rowgroups.items():
+                stmt = sqlite_insert(table)
+                if on_conflict == "ignore":
+                    stmt = stmt.on_conflict_do_nothing(index_elements=conflict_cols)
+                elif on_conflict == "update":
+                    updcols = {k: stmt.excluded[k] for k in keys if k != pk.name and k not in conflict_cols}
+                    if updcols:
+                        stmt = stmt.on_conflict_do_update(index_elements=conflict_cols, set_=updcols)
+                    else:
+                        stmt = stmt.on_conflict_do_nothing(index_elements=conflict_cols)
+                stmt = stmt.returning(pk)
+
+                for start in range(0, len(rows), batch_size):
+                    new_ids.extend(session.execute(stmt, rows[start:start+batch_size]).scalars().all())
+            session.commit()
+
+        return new_ids
+
     def remove(self, entity: T) -> None:
         with self._session_factory() as session:
             obj = session.merge(entity)  # reattach if detached
@@ -0,0 +1,47 @@
+from typing import (Any, Dict, )
+
+from sqlalchemy import (create_engine, event, )
+from sqlalchemy.engine import Engine
+
+from dbconfig import (sqlite_pragmas, dbconfig_key, )
+
+
+def sqlite_pragma_profile(profile: str|None = None) -> Dict[str, Any]:
+    """Return the PRAGMA settings for a config profile.
+
+    Args:
+        profile (str | None, optional): key into dbconfig.sqlite_pragmas. Defaults to dbconfig_key.
+
+    Returns:
+        Dict[str, Any]: {pragma name: value}
+    """
+    profile = profile or dbconfig_key
+    if profile not in sqlite_pragmas:
+        raise ValueError(f'{profile} is not a defined sqlite pragma profile')
+    return dict(sqlite_pragmas[profile])
+#enddef sqlite_pragma_profile
+
+def create_sqlite_engine(dbName: str, profile: str|None = None, **kwargs: Any) -> Engine:
+    """Create an Engine for a SQLite file, with the profile's PRAGMAs set on every connect.
+
+    Args:
+        dbName (str): path to the SQLite database file.
+        profile (str | None, optional): key into dbconfig.sqlite_pragmas. Defaults to dbconfig_key.
+        **kwargs: passed through to create_engine.
+
+    Returns:
+        Engine: the configured engine.
+    """
+    pragmas = sqlite_pragma_profile(profile)
+    engine = create_engine(f"sqlite:///{dbName}", **kwargs)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+    # _set_sqlite_pragmas
+
+    return engine
+#enddef create_sqlite_engine
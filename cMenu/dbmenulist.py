@@ -1,9 +1,10 @@
-from typing import (Any, Dict, List, Optional, )
+from typing import (Any, Dict, Iterable, List, Optional, )
+import threading
 
 from sqlalchemy import Row, RowMapping, Select, Table, select, text
 
 from .menucommand_constants import (MENUCOMMANDS, COMMANDNUMBER, )
-from .database import cMenu_Session
+from .database import (cMenu_Session, TableChanges, change_tracker, )
 
 from .utils import (retListofQSQLRecord, recordsetList, select_with_join_excluding, )
 
@@ -45,10 +46,26 @@ class MenuRecords:
     
     _tbl = menuItems
     _tblGroup = menuGroups
+    _schemaChecked: bool = False     # once per process, not once per record
+
+    # the whole menu tree, shared by every MenuRecords, loaded on first use and served from memory after that.
+    # Any commit that writes cMenu_menuItems/cMenu_menuGroups drops it (see _menutree_changes below);
+    # call MenuRecords.invalidate() after changing the tables some other way
+    _treeLock = threading.RLock()
+    _tree: Dict[str, Any]|None = None
+    treeVersion: int = 0                # bumped on every invalidate, so anything built from the tree knows it's stale
 
     def __init__(self):
         self.session = None
 
+    @classmethod
+    def _ensureSchema(cls):
+        # Main.py bootstraps the schema at startup; this covers anything that writes menu items without going through Main
+        if not MenuRecords._schemaChecked:
+            from .models import bootstrap_cMenu_schema
+            bootstrap_cMenu_schema()
+            MenuRecords._schemaChecked = True
+
     def __enter__(self):
         self.session = cMenu_Session()
         return self
@@ -61,15 +78,99 @@ class MenuRecords:
                 self.session.rollback()
             self.session.close()
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the cached menu tree; the next lookup reloads it."""
+        with MenuRecords._treeLock:
+            MenuRecords._tree = None
+            MenuRecords.treeVersion += 1
+
+    @classmethod
+    def _menuTree(cls) -> Dict[str, Any]:
+        """
+        The cached menu tree:
+            'groups': {group id: {GroupName, GroupInfo, ...}}
+            'items': {(group, menuID, option): {column: value}}
+            'menus': {(group, menuID): {option: {column: value}}} - only groups that exist (as menuDict's join did)
+            'dfltGroup': lowest group with menu items
+            'dfltMenu': {group: menuID of its 'Default' menu, else its lowest menuID}
+        """
+        with MenuRecords._treeLock:
+            if MenuRecords._tree is not None:
+                return MenuRecords._tree
+
+            with cMenu_Session() as session:
+                groups = {row['id']: dict(row) for row in session.execute(select(*cls._tblGroup.__table__.columns)).mappings()}
+                itemrows = [dict(row) for row in session.execute(
+                    select(*cls._tbl.__table__.columns).order_by(cls._tbl.id)).mappings()]
+
+            items: Dict[tuple, Dict[str, Any]] = {}
+            menus: Dict[tuple, Dict[int, Dict[str, Any]]] = {}
+            dfltMenu: Dict[int, int] = {}
+            minMenu: Dict[int, int] = {}
+            for row in itemrows:
+                grp, mnu, opt = row['MenuGroup_id'], row['MenuID'], row['OptionNumber']
+                items[(grp, mnu, opt)] = row
+                if grp in groups:
+                    menus.setdefault((grp, mnu), {})[opt] = row
+                if opt == 0:
+                    if grp not in minMenu or mnu < minMenu[grp]:
+                        minMenu[grp] = mnu
+                    if grp not in dfltMenu and str(row['Argument'] or '').lower() == 'default':
+                        dfltMenu[grp] = mnu
+            #endfor row
+            for grp, mnu in minMenu.items():
+                dfltMenu.setdefault(grp, mnu)
+
+            MenuRecords._tree = {
+                'groups': groups,
+                'items': items,
+                'menus': menus,
+                'minMenu': minMenu,
+                'dfltMenu': dfltMenu,
+                'dfltGroup': min((row['MenuGroup_id'] for row in itemrows), default=None),
+            }
+            return MenuRecords._tree
+    # _menuTree
+
     def create(self, persist:bool = True, **kwargs) -> menuItems:
         """Create a new menu item record."""
         new_item = self._tbl(**kwargs)
         if persist:
+            self._ensureSchema()
             with cMenu_Session() as session:
                 session.add(new_item)
                 session.commit()
         #endif
         return new_item
+
+    def create_many(self, records: Iterable[Dict[str, Any]|menuItems], persist:bool = True, **overrides) -> List[menuItems]:
+        """
+        Create many menu item records in one transaction (e.g. copying a whole menu).
+
+        :param records: dicts of field values, or menuItems (their column values are copied; id never is)
+        :param persist: save them; otherwise just build them
+        :param overrides: field values applied to every record, e.g. MenuID=newMenuID
+        :return: the new menuItems (detached; ids filled in if persisted)
+        """
+        colnames = [col.name for col in self._tbl.__table__.columns if col.name != 'id']
+        new_items = []
+        for rec in records:
+            if isinstance(rec, dict):
+                vals = {k: v for k, v in rec.items() if k != 'id'}
+            else:
+                vals = {name: getattr(rec, name) for name in colnames}
+            vals.update(overrides)
+            new_items.append(self._tbl(**vals))
+        #endfor rec
+
+        if persist and new_items:
+            self._ensureSchema()
+            with cMenu_Session(expire_on_commit=False) as session:
+                session.add_all(new_items)
+                session.commit()
+        #endif
+        return new_items
     
     def get(self, record_id: int) -> Optional[menuItems]:
         """Get a menu item by its primary key."""
@@ -97,67 +198,33 @@ class MenuRecords:
                 return True
         return False
     
+    # the navigation lookups below are served from the cached menu tree - no queries after the first
+
     def menuAttr(self, mGroup: int, mID: int, Opt: int, AttrName: str) -> Any:
         """Get a specific attribute from a menu item."""
-        stmt = select(getattr(self._tbl, AttrName)).where(
-            self._tbl.MenuGroup_id == mGroup,
-            self._tbl.MenuID == mID,
-            self._tbl.OptionNumber == Opt
-        )
-        with cMenu_Session() as session:
-            return session.scalar(stmt)
+        row = self._menuTree()['items'].get((mGroup, mID, Opt))
+        return row.get(AttrName) if row else None
     
     def minMenuID_forGroup(self, mGroup: int) -> Optional[int]:
         """
         Returns the minimum MenuID for the given MenuGroup.
         """
-        stmt = select(self._tbl.MenuID).where(
-            self._tbl.MenuGroup_id == mGroup,
-            self._tbl.OptionNumber == 0
-        ).order_by(self._tbl.MenuID.asc())
-        with cMenu_Session() as session:
-            retval = session.scalars(stmt).first()
-        return retval
+        return self._menuTree()['minMenu'].get(mGroup)
 
     def dfltMenuID_forGroup(self, mGroup:int) -> Optional[int]:
-        stmt = select(self._tbl.MenuID).where(
-            self._tbl.MenuGroup_id == mGroup,
-            self._tbl.Argument.ilike('default'),
-            self._tbl.OptionNumber == 0
-            )
-        with cMenu_Session() as session:
-            retval = session.scalar(stmt)
-        if not retval:
-            # If no record found, we need to find the minimum MenuID for this group
-            retval = self.minMenuID_forGroup(mGroup)
-        return retval
+        # the menu whose Argument is 'Default', or failing that, the minimum MenuID for this group
+        return self._menuTree()['dfltMenu'].get(mGroup)
 
     def dfltMenuGroup(self) -> Optional[int]:
         """
         Returns the minimum MenuGroup.
         """
-        stmt = select(self._tbl.MenuGroup_id).order_by(self._tbl.MenuGroup_id.asc())
-        with cMenu_Session() as session:
-            retval = session.scalars(stmt).first()
-        return retval
+        return self._menuTree()['dfltGroup']
     
     def menuDict(self, mGroup:int, mID:int) ->  Dict[int,Dict[str, Any]]:
-        # use selectjoin
-        stmt = (
-            select(*self._tbl.__table__.columns)
-            .join(self._tblGroup, self._tbl.MenuGroup_id == self._tblGroup.id)
-            .where(
-                self._tbl.MenuGroup_id == mGroup,
-                self._tbl.MenuID == mID
-                )
-            )
-        with cMenu_Session() as session:
-            result = session.execute(stmt).mappings()
-            # Convert the result to a dictionary with OptionNumber as keys
-            # and dictionaries of field values as values
-            # Note: 'rec' is a RowMapping, so we can access fields by name
-            retDict = { row['OptionNumber']: dict(row) for row in result }
-        return retDict
+        # {OptionNumber: {field: value}} - copies, so callers can't disturb the cached tree
+        menu = self._menuTree()['menus'].get((mGroup, mID), {})
+        return { opt: dict(row) for opt, row in menu.items() }
 
     # def menuDBRecs(self, mGroup:int, mID:int) ->  QuerySet:
     def menuDBRecs(self, mGroup:int, mID:int) ->  Dict[int, menuItems]:
@@ -178,16 +245,8 @@ class MenuRecords:
         return retDict
 
     def menuExist(self, mGroup:int, mID:int) ->  bool:
-        stmt = select(self._tbl).where(
-            self._tbl.MenuGroup_id == mGroup,
-            self._tbl.MenuID == mID,
-            self._tbl.OptionNumber == 0
-        )
-        with cMenu_Session() as session:
-            result = session.execute(stmt).first()
-        # If the result is None, the menu does not exist
-        # If the result is a Row or RowMapping, the menu exists
-        return (result is not None)
+        # a menu exists if it has an option 0 (the menu header)
+        return (mGroup, mID, 0) in self._menuTree()['items']
 
     # TODO: generalize this, mebbe to a new class
     def recordsetList(self, retFlds:int|List[str] = retListofQSQLRecord, filter:Optional[str] = None) -> List:
@@ -222,4 +281,14 @@ class MenuRecords:
         return newgroupnewmenu_menulist
     def newmenuDict(self, mGroup:int, mID:int) ->  List[Dict]:
         return newmenu_menulist
-    
\ No newline at end of file
+    
+
+# drop the cached menu tree whenever a commit has written the menu tables - whoever the writer is
+# (cEditMenu.writeRecord/copyMenu/createNewMenuGroup, cWidgetMenuItem save/delete/copy, MenuRecords itself)
+_menuTables = {menuItems.__table__, menuGroups.__table__}
+
+def _menutree_changes(changes: TableChanges):
+    if not _menuTables.isdisjoint(changes.tables):
+        MenuRecords.invalidate()
+
+change_tracker.subscribe(_menutree_changes)
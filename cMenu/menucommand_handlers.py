@@ -1,5 +1,7 @@
 from typing import (Dict, List, Mapping, Tuple, Any, )
 import copy
+import importlib
+import threading
 
 from PySide6.QtCore import (Qt, QObject,
     Signal, Slot, 
@@ -11,12 +13,11 @@ from PySide6.QtWidgets import ( QBoxLayout, QLayout, QStyle, QTabWidget,
     QWidget, QGridLayout, QHBoxLayout, QVBoxLayout, QFormLayout, QFrame, 
     QTableView, QHeaderView, QScrollArea,
     QDialog, QMessageBox, QFileDialog, QDialogButtonBox,
-    QLabel, QLCDNumber, QLineEdit, QTextEdit, QPlainTextEdit, QPushButton, QCheckBox, QComboBox, 
+    QLabel, QLCDNumber, QLineEdit, QTextEdit, QPlainTextEdit, QPushButton, QCheckBox, QComboBox, QSpinBox, 
     QRadioButton, QGroupBox, QButtonGroup, 
     QSizePolicy, 
     )
 
-from openpyxl import Workbook
 from sqlalchemy import (inspect, select, Engine, ) 
 from sqlalchemy.orm import (make_transient, sessionmaker, )
 from sqlalchemy.orm.session import make_transient
@@ -27,7 +28,7 @@ from sqlalchemy.orm.session import make_transient
 
 from _newcode import _NUM_menuBUTTONS, Nochoice
 from cMenu.utils import areYouSure, cComboBoxFromDict, cSimpleRecordForm_Base, cstdTabWidget
-from menuformname_viewMap import FormNameToURL_Map
+from menuformname_viewMap import (FormNameToURL_Map, FormPrewarmList, )
 
 from .database import cMenu_Session
 from .dbmenulist import (MenuRecords, newgroupnewmenu_menulist, newmenu_menulist, )
@@ -37,9 +38,10 @@ from .models import (menuItems, menuGroups, )
 from .utils import (cComboBoxFromDict, cQFmFldWidg, cQFmNameLabel, cQFmNameLabel,
     SQLAlchemyTableModel, SQLAlchemySQLQueryModel,
     UnderConstruction_Dialog, areYouSure,
-    Excelfile_fromqs, ExcelWorkbook_fileext,
+    RowExporter, ExcelWorkbook_fileext, CSVfile_fileext,
     pleaseWriteMe,  
     )
+from .utils.cQModels import _DFLT_SQL_PREVIEW
 
 
 # copied from cMenu - if you change it here, change it there
@@ -54,6 +56,51 @@ Nochoice = {'---': None}    # only needed for combo boxes, not datalists
 # fontFormTitle.setPointSize(24)
 
 
+_formResolveLock = threading.RLock()
+
+def resolveFormView(formname) -> Any|None:
+    """
+    Return the view for formname from FormNameToURL_Map.
+    A view given as a 'module:attr' string is imported now, and the result replaces the
+    string in the map, so each module is imported once, on first use.
+
+    Raises ImportError / AttributeError if the path doesn't resolve.
+    """
+    with _formResolveLock:
+        url, view = FormNameToURL_Map[formname]
+        if isinstance(view, str):
+            modname, _, attr = view.partition(':')
+            view = getattr(importlib.import_module(modname), attr)
+            FormNameToURL_Map[formname] = (url, view)
+        # endif view is a path
+    return view
+# resolveFormView
+
+def prewarmForms(formnames=None) -> threading.Thread:
+    """
+    Import the views for formnames (default FormPrewarmList) on a background thread,
+    so the first FormBrowse for them doesn't pay for the import.  Only imports - no widgets are built.
+    Failures are left for FormBrowse to report when the form is actually opened.
+    """
+    if formnames is None:
+        formnames = FormPrewarmList
+
+    def _prewarm():
+        for formname in formnames:
+            if formname not in FormNameToURL_Map:
+                continue
+            try:
+                resolveFormView(formname)
+            except Exception:
+                pass
+        # endfor formname
+    # _prewarm
+
+    thrd = threading.Thread(target=_prewarm, name='prewarmForms', daemon=True)
+    thrd.start()
+    return thrd
+# prewarmForms
+
 def FormBrowse(parntWind, formname, *args, **kwargs) -> Any|None:
     urlIndex = 0
     viewIndex = 1
@@ -80,12 +127,14 @@ def FormBrowse(parntWind, formname, *args, **kwargs) -> Any|None:
         elif FormNameToURL_Map[formname][viewIndex]:
             fn = None
             try:
-                fn = FormNameToURL_Map[formname][viewIndex]
-                theForm = fn(*args, **kwargs)
-            except NameError:
+                fn = resolveFormView(formname)
+            except (NameError, ImportError, AttributeError):
                 # fn = None
                 formname = f'{formname} exists but view {FormNameToURL_Map[formname][viewIndex]}'
             #end try
+            # only a view that won't resolve is "not built yet" - an error in the form itself propagates
+            if fn is not None:
+                theForm = fn(*args, **kwargs)
     if not theForm:
         formname = f'Form {formname} is not built yet.  Calvin needs more coffee.'
         # print(formname)
@@ -134,6 +183,12 @@ class QWGetSQL(QWidget):
         self.layoutFormMain = QFormLayout()
         self.txtedSQL = QTextEdit()
         self.layoutFormMain.addRow(self.tr('SQL statement'), self.txtedSQL)
+        self.spinPreviewRows = QSpinBox()
+        self.spinPreviewRows.setRange(0, 10_000_000)
+        self.spinPreviewRows.setSingleStep(1000)
+        self.spinPreviewRows.setValue(_DFLT_SQL_PREVIEW)
+        self.spinPreviewRows.setSpecialValueText(self.tr('all'))
+        self.layoutFormMain.addRow(self.tr('Rows to fetch'), self.spinPreviewRows)
         
         # run/Cancel buttons
         self.layoutFormActionButtons = QHBoxLayout()
@@ -177,6 +232,10 @@ class QWGetSQL(QWidget):
         self.layoutForm.addWidget(horzline2)
         self.layoutForm.addWidget(self.lblHints)
         
+    def previewLimit(self) -> int|None:
+        # rows to fetch before pausing; None = all
+        return self.spinPreviewRows.value() or None
+
     def _on_run_sql_clicked(self):
         # Emit the runSQL signal with the text from the editor.
         sql_text = self.txtedSQL.toPlainText()
@@ -226,13 +285,13 @@ class QWShowSQL(QWidget):
         self.layoutFormSQLDescription = QFormLayout()
         lblOrigSQL = QLabel()
         lblOrigSQL.setText(origSQL)
-        lblnRecs = QLabel()
-        lblnRecs.setText(f'{numrows}')
-        lblcolNames = QLabel()
-        lblcolNames.setText(str(colNames))
+        self.lblnRecs = QLabel()
+        self.lblnRecs.setText(f'{numrows}')
+        self.lblcolNames = QLabel()
+        self.lblcolNames.setText(str(colNames))
         self.layoutFormSQLDescription.addRow('SQL Entered:', lblOrigSQL)
-        self.layoutFormSQLDescription.addRow('rows affctd:', lblnRecs)
-        self.layoutFormSQLDescription.addRow('cols:', lblcolNames)
+        self.layoutFormSQLDescription.addRow('rows affctd:', self.lblnRecs)
+        self.layoutFormSQLDescription.addRow('cols:', self.lblcolNames)
         
 
         # main area for displaying SQL
@@ -256,6 +315,20 @@ class QWShowSQL(QWidget):
         
         #  buttons
         self.layoutFormActionButtons = QHBoxLayout()
+        self.lblExportStatus = QLabel()
+        self.layoutFormActionButtons.addWidget(self.lblExportStatus)
+        self._exporter: RowExporter|None = None
+        self.buttonStopQuery = QPushButton( QIcon.fromTheme(QIcon.ThemeIcon.ProcessStop), self.tr('Stop Query') ) 
+        self.buttonStopQuery.clicked.connect(qmodel.cancel)
+        self.buttonStopQuery.setEnabled(qmodel.isRunning())
+        self.layoutFormActionButtons.addWidget(self.buttonStopQuery, alignment=Qt.AlignmentFlag.AlignRight)
+        self.buttonFetchMore = QPushButton( QIcon.fromTheme(QIcon.ThemeIcon.GoDown), self.tr('Fetch More') ) 
+        self.buttonFetchMore.clicked.connect(lambda: self._qmodel.fetchMoreRows())
+        self.layoutFormActionButtons.addWidget(self.buttonFetchMore, alignment=Qt.AlignmentFlag.AlignRight)
+        self.buttonFetchAll = QPushButton( QIcon.fromTheme(QIcon.ThemeIcon.MediaSeekForward), self.tr('Fetch All') ) 
+        self.buttonFetchAll.clicked.connect(self._qmodel.fetchAllRows)
+        self.layoutFormActionButtons.addWidget(self.buttonFetchAll, alignment=Qt.AlignmentFlag.AlignRight)
+        self._enableFetchButtons()
         self.buttonGetSQL = QPushButton( QIcon.fromTheme(QIcon.ThemeIcon.GoPrevious), self.tr('Back to SQL') ) 
         self.buttonGetSQL.clicked.connect(self._return_to_sql)
         self.layoutFormActionButtons.addWidget(self.buttonGetSQL, alignment=Qt.AlignmentFlag.AlignRight)
@@ -279,32 +352,80 @@ class QWShowSQL(QWidget):
         
         colfctr = 90
         self.setMinimumWidth(colfctr*len(colNames))
+
+        # a background query (SQLAlchemySQLQueryModel.execute) fills in as rows arrive
+        qmodel.modelReset.connect(self._showColumns)
+        qmodel.progress.connect(self._showProgress)
+        qmodel.fetchPaused.connect(self._enableFetchButtons)
+        qmodel.finished.connect(self._queryFinished)
+        if qmodel.isRunning():
+            self._showProgress(numrows, qmodel.elapsed())
         
+    @Slot()
+    def _showColumns(self):
+        colNames = [self._qmodel.headerData(x,Qt.Orientation.Horizontal) for x in range(self._qmodel.columnCount())]
+        self.lblcolNames.setText(str(colNames))
+        self.setMinimumWidth(90*len(colNames))
+
+    @Slot()
+    def _enableFetchButtons(self):
+        canFetch = self._qmodel.isRunning() and not self._qmodel.isFetching()
+        self.buttonFetchMore.setEnabled(canFetch)
+        self.buttonFetchAll.setEnabled(canFetch)
+
+    @Slot(int, float)
+    def _showProgress(self, nrows:int, elapsed:float):
+        qmodel = self._qmodel
+        # N+ until the cursor runs dry - there may be more rows than have been fetched
+        nrowsText = f'{nrows}' if qmodel.isExhausted() or not qmodel.isRunning() else f'{nrows}+'
+        if qmodel.isFetching():
+            self.lblnRecs.setText(f'{nrowsText} rows  (running, {elapsed:.1f}s)')
+        else:
+            self.lblnRecs.setText(f'{nrowsText} rows  ({elapsed:.1f}s)')
+        self.buttonStopQuery.setEnabled(qmodel.isRunning())
+        self._enableFetchButtons()
+
+    @Slot(str)
+    def _queryFinished(self, message:str):
+        self.buttonStopQuery.setEnabled(False)
+        self._enableFetchButtons()
+        nrows = self._qmodel.rowCount()
+        if message:
+            self.lblnRecs.setText(f'{nrows}+ rows  ({message} after {self._qmodel.elapsed():.1f}s)')
+        else:
+            self.lblnRecs.setText(f'{nrows} rows  ({self._qmodel.elapsed():.1f}s)')
+
     @Slot()
     def DLResults(self):
         ExcelFileNamePrefix = "SQLresults"
-        # Create a dictionary of records from the model
-        row_count = self._qmodel.rowCount()
-        col_count = self._qmodel.columnCount()
-        column_names = [self._qmodel.headerData(i, Qt.Orientation.Horizontal) for i in range(col_count)]
-
-        Excel_qdict = []
-        for row in range(row_count):
-            record = {}
-            for col in range(col_count):
-                value = self._qmodel.data(self._qmodel.index(row, col))
-                record[column_names[col]] = value
-            Excel_qdict.append(record)
-
-        # Create an Excel workbook and save it
-        xlws = Excelfile_fromqs(Excel_qdict)
-        filName, _ = QFileDialog.getSaveFileName(self, 
+        xlFilter = f'Excel ({ExcelFileNamePrefix}*{ExcelWorkbook_fileext})'
+        csvFilter = f'CSV ({ExcelFileNamePrefix}*{CSVfile_fileext})'
+        filName, selFilter = QFileDialog.getSaveFileName(self, 
             caption="Enter Spreadsheet File Name",
-            filter=f'{ExcelFileNamePrefix}*{ExcelWorkbook_fileext}',
-            selectedFilter=f'*{ExcelWorkbook_fileext}'
+            filter=f'{xlFilter};;{csvFilter}',
+            selectedFilter=xlFilter
         )
-        if filName and isinstance(xlws, Workbook):
-            xlws.save(filName)     
+        if not filName:
+            return
+        ext = CSVfile_fileext if selFilter == csvFilter else ExcelWorkbook_fileext
+        if not filName.upper().endswith((ExcelWorkbook_fileext, CSVfile_fileext)):
+            filName += ext
+
+        # streams to the file on a pool thread - the rows are never all in memory at once
+        self._exporter = RowExporter.fromModel(filName, self._qmodel, self)
+        self._exporter.progress.connect(lambda n: self.lblExportStatus.setText(f'exporting... {n} rows'))
+        self._exporter.finished.connect(self._exportFinished)
+        self.buttonDLResults.setEnabled(False)
+        self.lblExportStatus.setText('exporting...')
+        self._exporter.start()
+
+    @Slot(int, str)
+    def _exportFinished(self, nrows:int, message:str):
+        self.buttonDLResults.setEnabled(True)
+        if message:
+            self.lblExportStatus.setText(f'export {message}')
+        else:
+            self.lblExportStatus.setText(f'{nrows} rows written to {self._exporter.flName}')
         
     def _return_to_sql(self):
         self.ReturnToSQL.emit()
@@ -314,6 +435,8 @@ class QWShowSQL(QWidget):
         self.closeBoth.emit()        
 
     def closeEvent(self, event):
+        self._qmodel.cancel()   # no point finishing a query nobody will see
+        # an export in progress carries on - its runner owns everything it needs
         self.closeMe.emit()  # Emit the signal
         event.accept()  # Accept the close event (allows the window to close)
     
@@ -346,9 +469,33 @@ class cMRunSQL(QWidget):
         #TODO: choose session - put in user control
         engine = app_Session.kw["bind"]
 
-        self.qmodel = SQLAlchemySQLQueryModel(inputSQL, engine)
+        if self.wndwAlive.get('Show'):
+            self.wndwShowSQL.close()
+        # runs on a pool thread - the results window fills in as rows arrive, and can stop the query
+        self.qmodel = SQLAlchemySQLQueryModel(inputSQL, engine, asynchronous=True,
+                                              preview_limit=self.wndwGetSQL.previewLimit())
+        self.qmodel.fetchPaused.connect(self._rawSQLpaused)
+        self.qmodel.finished.connect(self._rawSQLfinished)
+        self.wndwGetSQL.lblStatusMsg.setText(self.tr('running...'))
 
         self.rawSQLshow()
+
+    @Slot()
+    def _rawSQLpaused(self):
+        if not self.wndwAlive.get('Get') or self.sender() is not self.qmodel:
+            return
+        self.wndwGetSQL.lblStatusMsg.setText(f'first {self.qmodel.rowCount()} rows in {self.qmodel.elapsed():.1f}s - more available')
+
+    @Slot(str)
+    def _rawSQLfinished(self, message:str):
+        if not self.wndwAlive.get('Get') or self.sender() is not self.qmodel:
+            return      # window gone, or a query that was replaced by a newer one
+        if message and message != 'cancelled':
+            # the statement failed - back to the SQL so it can be fixed
+            self.wndwGetSQL.lblStatusMsg.setText(message)
+            self._ShowToGetSQL()
+        else:
+            self.wndwGetSQL.lblStatusMsg.setText(f'{self.qmodel.rowCount()} rows in {self.qmodel.elapsed():.1f}s {message}'.rstrip())
             
     def rawSQLshow(self):
         self.wndwShowSQL = QWShowSQL(self.qmodel, self.parent())
@@ -1123,26 +1270,9 @@ class cEditMenu(QWidget):
                 grppk = newrec.id            
 
             # create a default menu
-            # newgroupnewmenu_menulist to menuItems
-            for rec in newgroupnewmenu_menulist:
-                # rec is a dict with keys: OptionNumber, OptionText, Command, Argument, PWord, TopLine, BottomLine
-                # create a new record in menuItems
-                newmenurec = menuItems(
-                    MenuGroup_id=grppk,
-                    MenuID=0,  # default menu ID
-                    OptionNumber=rec['OptionNumber'],
-                    OptionText=rec['OptionText'],
-                    Command=rec['Command'],
-                    Argument=rec['Argument'],
-                    PWord=rec['PWord'],
-                    TopLine=rec['TopLine'],
-                    BottomLine=rec['BottomLine'],
-                )
-                # save the new record
-                with cMenu_Session() as session:
-                    session.add(newmenurec)
-                    session.commit()
-                # add the new record to the menuItems table
+            # newgroupnewmenu_menulist to menuItems, in one transaction
+            # each rec is a dict with keys: OptionNumber, OptionText, Command, Argument, PWord, TopLine, BottomLine
+            MenuRecords().create_many(newgroupnewmenu_menulist, MenuGroup_id=grppk, MenuID=0)
 
             self.loadMenu(grppk, 0)
         return
@@ -1156,35 +1286,24 @@ class cEditMenu(QWidget):
         if retval:
             assert isinstance(newMnuID, int) and newMnuID >= 0, "New Menu ID must be a non-negative integer"
             qsFrom = self.currentMenu
-            with cMenu_Session() as session:         
-                if CMChoiceCopy:
-                    qsTo: Dict[int, menuItems] = {}     # qsTo is technically not used, but being built JIC its needed later
-                    for i, orig_rec in qsFrom.items():
-                        new_rec = menuItems()
-                        for col in menuItems.__table__.columns:
-                            name = col.name
-                            if name != "id":
-                                setattr(new_rec, name, getattr(orig_rec, name))
-                        #endfor col in menuItems.__table__.columns
-
-                        new_rec.MenuID = newMnuID
-                        session.add(new_rec)
-                        qsTo[i] = new_rec     # qsTo is technically not used, but being built JIC its needed later
-                    #endfor i, orig_rec in qsFrom.items()
-                else:
+            if CMChoiceCopy:
+                # copy the whole menu in one transaction
+                MenuRecords().create_many(qsFrom.values(), MenuID=newMnuID)
+            else:
+                with cMenu_Session() as session:         
                     # Move the menu items to the new menu ID
                     for i, orig_rec in qsFrom.items():
                         # Update the MenuID of the original record
                         orig_rec.MenuID = newMnuID
                         session.merge(orig_rec)
                     #endfor i, orig_rec in qsFrom.items()
-                #endif CMChoiceCopy
-                
-                session.commit()                # commit the changes
+                    
+                    session.commit()                # commit the changes
+                #endwith cMenu_Session() as session:
+            #endif CMChoiceCopy
                 
-                self.loadMenu(mnuGrp, newMnuID)
+            self.loadMenu(mnuGrp, newMnuID)
                 
-            #endwith cMenu_Session() as session:
         #endif retval
 
         return
@@ -10,7 +10,7 @@ from PySide6.QtCore import (QObject, )
 from PySide6.QtWidgets import (QApplication, )
 from .utils import (pleaseWriteMe, )
 
-from .database import cMenu_Session
+from .database import cMenu_Session, cMenu_engine, identity_cache
 from .menucommand_constants import MENUCOMMANDS, COMMANDNUMBER
 from .dbmenulist import (newgroupnewmenu_menulist, )
 
@@ -20,6 +20,9 @@ tblName_menuItems = 'cMenu_menuItems'
 tblName_cParameters = 'cMenu_cParameters'
 tblName_cGreetings = 'cMenu_cGreetings'
 
+# bump when the cMenu tables change; bootstrap_cMenu_schema() re-runs the DDL when the stored version differs
+cMenu_SCHEMA_VERSION = 1
+
 
 ix_naming_convention = {
     "ix": "ix_%(column_0_label)s",
@@ -93,6 +96,9 @@ class cMenuBase(DeclarativeBase):
 
     #     return retval
 
+# the menu database is shared by every client - drop cached records when another one writes it
+identity_cache.watch(cMenu_engine, cMenuBase.metadata)
+
 class menuGroups(cMenuBase):
     """
     id = models.AutoField(primary_key=True)
@@ -189,20 +195,8 @@ class menuItems(cMenuBase):
     def __str__(self) -> str:
         return f"{self.OptionText} (ID: {self.MenuID}, Option: {self.OptionNumber})"
 
-    def __init__(self, **kw: Any):
-        """
-        Initialize a new menuItems instance. If the menu table doesn't exist, it will be created.
-        If the menuGroups table doesn't exist, it will also be created, and a starter group and menu will be added.
-        :param kw: Keyword arguments for the menuItems instance.
-        """
-        inspector = inspect(cMenu_Session().get_bind())
-        if not inspector.has_table(self.__tablename__):
-            # If the table does not exist, create it
-            cMenuBase.metadata.create_all(cMenu_Session().get_bind())
-            # Optionally, you can also create a starter group and menu here
-            menuGroups._createtable(cMenu_Session().get_bind())
-        #endif not inspector.has_table():
-        super().__init__(**kw)
+    # the table (and starter group) used to be checked for, and created, on every construction;
+    # that's bootstrap_cMenu_schema()'s job now, done once at startup
 
     # @classmethod
     # def _createtable(cls, engine):
@@ -272,9 +266,46 @@ class cGreetings(cMenuBase):
         return f"{self.Greeting} (ID: {self.id})"
 
 
-cMenuBase.metadata.create_all(cMenu_Session().get_bind())
-# Ensure that the tables are created when the module is imported
-menuGroups._createtable(cMenu_Session().get_bind())
-menuItems() #._createtable(cMenu_Session().get_bind())
-cParameters() #._createtable(cMenu_Session().get_bind())
-cGreetings() #._createtable(cMenu_Session().get_bind())
\ No newline at end of file
+##########################################################
+###################  SCHEMA BOOTSTRAP  ###################
+##########################################################
+
+# each schema's version lives in its own database file, in PRAGMA user_version (0 in a new or replaced file),
+# so a normal launch costs one PRAGMA instead of reflecting every table.
+# Nothing here runs at import - call the bootstraps at startup (Main.py)
+def getSchemaVersion(engine=None) -> int:
+    """The schema version stored in engine's database (PRAGMA user_version) - 0 if none was ever set."""
+    engine = engine or cMenu_engine
+    with engine.connect() as conn:
+        return conn.exec_driver_sql('PRAGMA user_version').scalar() or 0
+
+def setSchemaVersion(version: int, engine=None) -> None:
+    engine = engine or cMenu_engine
+    with engine.connect() as conn:
+        conn.exec_driver_sql(f'PRAGMA user_version = {int(version)}')
+        conn.commit()
+
+def bootstrap_schema(schema: str, version: int, create_fn, engine=None) -> bool:
+    """
+    Run create_fn() (the DDL, seed rows, etc) unless engine's database already records version.
+
+    :param schema: schema name, e.g. 'cMenu' (for messages only)
+    :param version: the version the code expects - a positive int
+    :param create_fn: builds/upgrades the schema; must be safe to re-run (create_all is)
+    :param engine: the database the schema lives in (its user_version is checked); default cMenu_Session's bind
+    :return: True if create_fn ran
+    """
+    engine = engine or cMenu_engine
+    if getSchemaVersion(engine) == version:
+        return False
+    create_fn()
+    setSchemaVersion(version, engine)
+    return True
+
+def bootstrap_cMenu_schema(engine=None) -> bool:
+    """Create the cMenu tables and the starter group/menu if the stored schema version doesn't match."""
+    engine = engine or cMenu_engine
+    def _create():
+        cMenuBase.metadata.create_all(engine)
+        menuGroups._createtable(engine)
+    return bootstrap_schema('cMenu', cMenu_SCHEMA_VERSION, _create, engine)
@@ -1,16 +1,41 @@
-from typing import (Dict, List, Any, )
+from typing import (Dict, Iterable, List, Any, Callable, NamedTuple, Sequence, Tuple, )
+import csv
+import datetime
+import functools
+import itertools
+import operator
+from decimal import (Decimal, )
+import os
+import re
+import threading
 
 from PySide6.QtCore import (
+    Qt, Signal, Slot, 
+    QObject, QRunnable, QThreadPool, 
     QAbstractTableModel, 
     )
 
-from openpyxl import (Workbook, )
+import sqlalchemy
+from sqlalchemy import (inspect, )
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import (SQLAlchemyError, )
+from sqlalchemy.orm import (sessionmaker, )
+
+from openpyxl import (Workbook, load_workbook, )
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 from openpyxl.styles import PatternFill, Font, fills, colors
 from openpyxl.utils.datetime import from_excel, WINDOWS_EPOCH
 
-from .cQModels import (SQLAlchemyTableModel, )
+from ..database import (Repository, )
+from .cQModels import (SQLAlchemyTableModel, SQLAlchemySQLQueryModel, isReadOnlySQL, )
 
 ExcelWorkbook_fileext = ".XLSX"
+CSVfile_fileext = ".CSV"
+
+# streaming exports: rows fetched per round trip, and rows written between progress reports (and cancel checks)
+_EXPORT_CHUNK: int = 1000
+_EXPORT_PROGRESS_ROWS: int = 5000
 
 
 def Excelfile_fromqs(qset:SQLAlchemyTableModel|List[Dict[str, Any]], flName:str|None = None,
@@ -84,35 +109,466 @@ def Excelfile_fromqs(qset:SQLAlchemyTableModel|List[Dict[str, Any]], flName:str|
     #endif returnFileName
 
 
+##########################################
+########    Streaming export
+
+def _headerCells(ws, fields:Sequence[str]) -> List[WriteOnlyCell]:
+    # bold, shaded grey - like Excelfile_fromqs
+    cells = []
+    for name in fields:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.font = Font(bold=True)
+        cell.fill = PatternFill(fill_type=fills.FILL_SOLID,
+                        start_color=colors.Color("00808080"),
+                        end_color=colors.Color("00808080")
+                        )
+        cells.append(cell)
+    return cells
+
+# types openpyxl writes as they are; anything else (bytes, UUIDs, ...) goes in as text
+_XL_TYPES = frozenset({type(None), int, float, bool, Decimal,
+                       datetime.datetime, datetime.date, datetime.time, datetime.timedelta, })
+
+def _xlValue(v:Any) -> Any:
+    if type(v) in _XL_TYPES and getattr(v, 'tzinfo', None) is None:
+        return v
+    # control characters can't go in a worksheet (openpyxl raises IllegalCharacterError) - drop them
+    return ILLEGAL_CHARACTERS_RE.sub('', v if type(v) is str else str(v))
+
+def write_rows(flName:str, fields:Sequence[str], rows:Iterable[Sequence[Any]],
+               progress:Callable[[int], None]|None = None, cancel:threading.Event|None = None) -> int:
+    """Write a header row and then rows to flName, without holding the rows in memory.
+    
+    Args:
+        flName (str): File to write (WITH extension) - CSVfile_fileext writes CSV, anything else an Excel
+            workbook in openpyxl write-only mode (header bold, grey and frozen, like Excelfile_fromqs).
+        fields (Sequence[str]): Column names.
+        rows (Iterable[Sequence[Any]]): The rows - consumed once, in order.
+        progress (Callable[[int], None] | None, optional): Called with the rows written so far every
+            _EXPORT_PROGRESS_ROWS rows. Defaults to None.
+        cancel (threading.Event | None, optional): Checked as often as progress; once set, writing stops
+            and nothing is left at flName. Defaults to None.
+    
+    Returns:
+        int: Rows written, or -1 if cancelled.
+    """
+    asCSV = flName.upper().endswith(CSVfile_fileext)
+    nrows = 0
+    try:
+        if asCSV:
+            with open(flName, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(fields)
+                for row in rows:
+                    writer.writerow(row)
+                    nrows += 1
+                    if nrows % _EXPORT_PROGRESS_ROWS == 0:
+                        if cancel is not None and cancel.is_set():
+                            break
+                        if progress:
+                            progress(nrows)
+                #endfor row
+        else:
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            ws.freeze_panes = 'A2'
+            ws.append(_headerCells(ws, fields))
+            for row in rows:
+                ws.append([_xlValue(v) for v in row])
+                nrows += 1
+                if nrows % _EXPORT_PROGRESS_ROWS == 0:
+                    if cancel is not None and cancel.is_set():
+                        break
+                    if progress:
+                        progress(nrows)
+            #endfor row
+            if cancel is None or not cancel.is_set():
+                wb.save(flName)
+            wb.close()
+        #endif asCSV
+    except BaseException:
+        if asCSV and os.path.exists(flName):
+            os.remove(flName)
+        raise
+    if cancel is not None and cancel.is_set():
+        if asCSV and os.path.exists(flName):
+            os.remove(flName)
+        return -1
+    if progress:
+        progress(nrows)
+    return nrows
+# write_rows
+
+def write_query(flName:str, stmt:str|sqlalchemy.Executable, engine:Engine, chunk_size:int = _EXPORT_CHUNK,
+                progress:Callable[[int], None]|None = None, cancel:threading.Event|None = None) -> int:
+    """Run stmt and stream its rows straight from the cursor into flName (see write_rows).
+    
+    Args:
+        flName (str): File to write (WITH extension).
+        stmt (str | Executable): Raw SQL, or a SQLAlchemy statement.
+        engine (Engine): Engine to run it on.
+        chunk_size (int, optional): Rows fetched per round trip. Defaults to _EXPORT_CHUNK.
+        progress, cancel: as for write_rows.
+    
+    Returns:
+        int: Rows written, or -1 if cancelled.
+    """
+    if isinstance(stmt, str):
+        stmt = sqlalchemy.text(stmt)
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(stmt)
+        if not result.returns_rows:
+            return write_rows(flName, [], [], progress, cancel)
+        try:
+            return write_rows(flName, list(result.keys()), result, progress, cancel)
+        finally:
+            result.close()
+    #endwith conn
+# write_query
+
+class _ExportSignals(QObject):
+    """Carries an export runner's progress to the GUI thread (queued connections)."""
+    progress = Signal(int)      # rows written so far
+    done = Signal(int, str)     # rows written; '' on success, else the error (or 'cancelled')
+# endclass _ExportSignals
+
+class _ExportRunner(QRunnable):
+    """Runs one export on a pool thread."""
+    def __init__(self, job:Callable[..., int], signals:_ExportSignals, cancelEvent:threading.Event):
+        super().__init__()
+        self._job = job
+        self._signals = signals     # held here so it outlives the exporter if its window closes mid-export
+        self._cancel = cancelEvent
+
+    def run(self):
+        sig = self._signals
+        nrows, msg = 0, 'export failed'
+        try:
+            nrows = self._job(progress=sig.progress.emit, cancel=self._cancel)
+            msg = ''
+        except SQLAlchemyError as e:
+            msg = str(getattr(e, 'orig', e))
+        except Exception as e:
+            # whatever went wrong, the exporter has to hear that it's over
+            msg = str(e) or type(e).__name__
+        finally:
+            if self._cancel.is_set():
+                nrows, msg = 0, 'cancelled'
+            sig.done.emit(nrows, msg)
+    # run
+# endclass _ExportRunner
+
+class RowExporter(QObject):
+    """Exports a query or a table model to an Excel (write-only) or CSV file on a QThreadPool thread.
+    
+    Rows stream from the cursor (or the model's own storage) straight into the file, so memory use
+    doesn't grow with the row count. Build one with fromQuery or fromModel, then start() it.
+    
+    Signals:
+        progress: Emitted with the rows written so far.
+        finished: Emitted with (rows written, '' on success, else the error message, or 'cancelled').
+    """
+    progress = Signal(int)
+    finished = Signal(int, str)
+
+    def __init__(self, flName:str, job:Callable[..., int], parent:QObject|None = None):
+        """Use fromQuery or fromModel.
+        
+        Args:
+            flName (str): File to write (WITH extension).
+            job (Callable[..., int]): Writes the file; called with progress= and cancel= keywords.
+            parent (QObject | None, optional): Parent QObject. Defaults to None.
+        """
+        super().__init__(parent)
+        self.flName = flName
+        self._job = job
+        self._cancelEvent = threading.Event()
+        self._running = False
+        self._rows = 0
+
+    @classmethod
+    def fromQuery(cls, flName:str, stmt:str|sqlalchemy.Executable, engine:Engine, parent:QObject|None = None) -> 'RowExporter':
+        """Export the rows of stmt (raw SQL or a SQLAlchemy statement)."""
+        return cls(flName, lambda **kw: write_query(flName, stmt, engine, **kw), parent)
+
+    @classmethod
+    def fromModel(cls, flName:str, model:QAbstractTableModel, parent:QObject|None = None) -> 'RowExporter':
+        """Export what model shows.
+        
+        A SQLAlchemyTableModel is re-queried (saved rows only - see exportStatement). A SQLAlchemySQLQueryModel
+        that hasn't fetched every row re-runs its SQL if that only reads; otherwise its fetched rows are written
+        as they stand. Any other model is copied on this thread first.
+        """
+        if isinstance(model, SQLAlchemyTableModel):
+            return cls.fromQuery(flName, model.exportStatement(), model.session_factory.kw['bind'], parent)
+        if isinstance(model, SQLAlchemySQLQueryModel):
+            if not model.isExhausted() and isReadOnlySQL(model.sql):
+                return cls.fromQuery(flName, model.sql, model.engine, parent)
+            fields, rows = list(model.header), model.iterRows()
+        else:
+            ncols = model.columnCount()
+            fields = [str(model.headerData(c, Qt.Orientation.Horizontal)) for c in range(ncols)]
+            rows = [[model.data(model.index(r, c)) for c in range(ncols)] for r in range(model.rowCount())]
+        return cls(flName, lambda **kw: write_rows(flName, fields, rows, **kw), parent)
+
+    def start(self):
+        """Start the export (once)."""
+        if self._running:
+            return
+        signals = _ExportSignals()
+        signals.progress.connect(self._onProgress)
+        signals.done.connect(self._onDone)
+        self._running = True
+        QThreadPool.globalInstance().start(_ExportRunner(self._job, signals, self._cancelEvent))
+
+    def cancel(self):
+        """Stop the export; the partial file is discarded. finished(0, 'cancelled') follows."""
+        if self._running:
+            self._cancelEvent.set()
+
+    def isRunning(self) -> bool:
+        """True while the export is in progress."""
+        return self._running
+
+    @Slot(int)
+    def _onProgress(self, nrows:int):
+        self._rows = nrows
+        self.progress.emit(nrows)
+
+    @Slot(int, str)
+    def _onDone(self, nrows:int, message:str):
+        self._running = False
+        self._rows = nrows
+        self.finished.emit(nrows, message)
+# endclass RowExporter
+
+########    Streaming export
+##########################################
+
+
+class SprdsheetImportReport(NamedTuple):
+    """What UpldSprdsheet.process_spreadsheet did.
+    
+    Attributes:
+        rows_read (int): Data rows read (the header row not counted; wholly blank rows skipped).
+        rows_written (int): Rows inserted or updated.
+        errors (List[Tuple[int, str]]): (spreadsheet row number, message) for every row not written.
+        ignored_cols (List[str]): Header cells that match no field and were skipped.
+        missing_flds (List[str]): Fields in SprdsheetFlds with no column in the spreadsheet.
+        cancelled (bool): The cancel event stopped the import; batches written before that stay written.
+    """
+    rows_read: int
+    rows_written: int
+    errors: List[Tuple[int, str]]
+    ignored_cols: List[str]
+    missing_flds: List[str]
+    cancelled: bool = False
+# endclass SprdsheetImportReport
+
+def _headerKey(hdr:Any) -> str:
+    # header cells match field names ignoring case and spaces
+    return re.sub(r'\s+', '', str(hdr)).casefold() if hdr is not None else ''
+
+def _lookupKey(val:Any) -> Any:
+    # spreadsheet numbers come back as floats - 12345.0 looks up as '12345'
+    if isinstance(val, float) and val.is_integer():
+        val = int(val)
+    return str(val).strip()
+
+##########################################
+########    Column coercion
+
+# Whole-column conversions for SprdsheetFldDescriptor_creator's ColumnType. Each takes a column's values
+# (and the sheet's date epoch) and returns (converted values, reject mask). Blanks become None. Where
+# mask[i] is set, value i couldn't be converted here and goes to cleanupfld one cell at a time.
+# A column is nearly always one type (all floats, all text), and then it's converted with map() over C
+# functions. Otherwise it holds few distinct values for its length (dates, quantities, codes), so each distinct
+# value is converted once in Python and the column is mapped through the results.
+# A converter never raises on bad data - it returns _REJECT, and cleanupfld reports the cell.
+
+_REJECT = object()
+_NoneType = type(None)
+_stripDollars = operator.methodcaller('replace', '$', '')
+_stripCommas = operator.methodcaller('replace', ',', '')
+
+def _byDistinct(convert:Callable[[Any, Any], Any], values:Sequence[Any], epoch) -> Tuple[List[Any], bytearray]:
+    converted = {v: convert(v, epoch) for v in set(values)}
+    out = list(map(converted.__getitem__, values))
+    if _REJECT in converted.values():
+        mask = bytearray(map(operator.is_, out, itertools.repeat(_REJECT)))
+    else:
+        mask = bytearray(len(values))
+    return out, mask
+
+def _blankOrNone(v:Any) -> bool:
+    return v is None or (type(v) is str and not v.strip())
+
+def _toStr(v:Any, epoch) -> Any:
+    t = type(v)
+    if t is str:
+        return v.strip() or None
+    if v is None:
+        return None
+    if t is int or (t is float and v.is_integer()):
+        return str(int(v))
+    if t is float:
+        return str(v)
+    return _REJECT
+
+def _toInt(v:Any, epoch) -> Any:
+    t = type(v)
+    if t is int or v is None:
+        return v
+    if t is float:
+        return int(v) if v.is_integer() else _REJECT
+    if t is str:
+        s = v.strip()
+        if not s:
+            return None
+        try:
+            return int(s)
+        except ValueError:
+            return _REJECT
+    return _REJECT
+
+def _toDec(v:Any, epoch) -> Any:
+    t = type(v)
+    if v is None or t is Decimal:
+        return v
+    if t is str:
+        s = v.replace('$', '').replace(',', '').strip()     # as app.models.str_to_dec reads it
+        if not s:
+            return None
+    elif t is int or t is float:
+        s = str(v)      # through str, so 0.1 stays 0.1
+    else:
+        return _REJECT
+    try:
+        return Decimal(s)
+    except (ValueError, ArithmeticError):
+        return _REJECT
+
+def _toDate(v:Any, epoch) -> Any:
+    t = type(v)
+    if v is None or t is datetime.date:
+        return v
+    if t is datetime.datetime:
+        return v.date()
+    if t is int or t is float:
+        try:
+            d = from_excel(v, epoch)
+        except (ValueError, ArithmeticError):     # a serial out of the date range
+            return _REJECT
+        return d.date() if isinstance(d, datetime.datetime) else _REJECT
+    if t is str:
+        s = v.strip()
+        if not s:
+            return None
+        try:
+            return datetime.date.fromisoformat(s)
+        except ValueError:
+            return _REJECT
+    return _REJECT
+
+def _strColumn(values:Sequence[Any], epoch) -> Tuple[List[Any], bytearray]:
+    kinds = set(map(type, values))
+    if kinds == {str}:
+        out = list(map(str.strip, values))
+        if '' not in out:
+            return out, bytearray(len(values))
+    elif kinds == {int}:
+        return list(map(str, values)), bytearray(len(values))
+    return _byDistinct(_toStr, values, epoch)
+
+def _intColumn(values:Sequence[Any], epoch) -> Tuple[List[Any], bytearray]:
+    kinds = set(map(type, values))
+    if kinds <= {int, _NoneType}:
+        return list(values), bytearray(len(values))
+    if kinds == {float}:
+        try:
+            out = list(map(int, values))
+        except (ValueError, OverflowError):     # nan, inf
+            return _byDistinct(_toInt, values, epoch)
+        mask = bytearray(map(operator.ne, out, values))     # 2.5 -> 2: not a whole number
+        if not any(mask):
+            return out, mask
+    return _byDistinct(_toInt, values, epoch)
+
+def _decColumn(values:Sequence[Any], epoch) -> Tuple[List[Any], bytearray]:
+    kinds = set(map(type, values))
+    try:
+        if kinds == {str}:
+            return list(map(Decimal, map(str.strip, map(_stripCommas, map(_stripDollars, values))))), bytearray(len(values))
+        if kinds <= {int, float}:
+            return list(map(Decimal, map(str, values))), bytearray(len(values))
+    except (ValueError, ArithmeticError):
+        pass
+    return _byDistinct(_toDec, values, epoch)
+
+SprdsheetColumnTypes: Dict[str, Callable[[Sequence[Any], Any], Tuple[List[Any], bytearray]]] = {
+    'str': _strColumn,
+    'int': _intColumn,
+    'decimal': _decColumn,
+    'date': functools.partial(_byDistinct, _toDate),
+}
+
+########    Column coercion
+##########################################
+
 class UpldSprdsheet():
     """Base class for handling spreadsheet uploads with field validation.
     
     This class provides functionality for processing uploaded spreadsheets,
     validating field types, and cleaning data according to defined rules.
+    A subclass names the TargetModel and SessionFactory and describes the columns in SprdsheetFlds;
+    process_spreadsheet then streams an .xlsx into the table.
     
     Attributes:
         TargetModel: The target ORM model class for the spreadsheet data.
+        SessionFactory (sessionmaker): Session factory for the TargetModel's database.
         SprdsheetDateEpoch: Date epoch used for spreadsheet date conversion.
         SprdsheetFlds (dict): Dictionary mapping spreadsheet field names to field descriptors.
+        OnConflict (str | None): Repository.add_many on_conflict - "update" (default) overwrites the row with the
+            same unique key, "ignore" keeps it, None makes it an error.
+        ConflictCols (List[str] | None): Unique columns for OnConflict; None uses the table's unique constraint (required if it has several).
+        BatchSize (int): Rows per batched write (and per columnar validation pass).
+        Columnar (bool): Validate a batch a column at a time (see SprdsheetColumnTypes) rather than a cell at a time.
     """
     TargetModel = None
+    SessionFactory: sessionmaker|None = None
     SprdsheetDateEpoch = WINDOWS_EPOCH
+    OnConflict: str|None = "update"
+    ConflictCols: List[str]|None = None
+    BatchSize: int = 1000
+    Columnar: bool = True
 
-    def SprdsheetFldDescriptor_creator(self, ModelFldName, AllowedTypes):
+    @staticmethod
+    def SprdsheetFldDescriptor_creator(ModelFldName, AllowedTypes, Lookup = None, ColumnType:str|None = None):
         """Create a field descriptor for spreadsheet field validation.
         
         Args:
             ModelFldName (str): The name of the field in the TargetModel.
             AllowedTypes: List of tuples (type, cleanproc) specifying allowed types
                 and their cleaning procedures. Empty list if any string is allowed.
+                A cleanproc may raise ValueError (or TypeError, or ArithmeticError such as decimal.InvalidOperation) to reject a value.
+            Lookup (optional): (Model, key column name) - the cleaned value is that column's value, and the
+                field gets the matching row's primary key (e.g. (WorkOrders, 'CIMSNum') for WorkOrders_id).
+                Defaults to None.
+            ColumnType (str | None, optional): A SprdsheetColumnTypes key ('str', 'int', 'decimal', 'date') -
+                columnar validation converts the whole column that way, and only the values it rejects
+                go through AllowedTypes. Defaults to None (every value through AllowedTypes).
         
         Returns:
-            dict: Field descriptor dictionary with ModelFldName and AllowedTypes.
+            dict: Field descriptor dictionary with ModelFldName, AllowedTypes, Lookup and ColumnType.
         """
+        if ColumnType is not None and ColumnType not in SprdsheetColumnTypes:
+            raise ValueError(f'{ColumnType} is not a valid ColumnType')
         return  {
             # 'SprdsheetName': None,    # nope, this will be the index of SprdsheetFlds
             'ModelFldName': ModelFldName,
             'AllowedTypes': AllowedTypes,     
+            'Lookup': Lookup,
+            'ColumnType': ColumnType,
         }
     
     SprdsheetFlds = {}  # key will be the SprdsheetName, value is a SprdsheetFldDescriptor
@@ -148,14 +604,235 @@ class UpldSprdsheet():
             #endfor type, cleanproc
         #endif fld not in self.SprdsheetFlds
 
-    def process_spreadsheet(self, SprsheetName):
+        return usefld, cleanval
+
+    def sprdsheetDate(self, val) -> datetime.date:
+        """A cleanproc for date fields: Excel date cells come back as datetimes, bare serial numbers use SprdsheetDateEpoch."""
+        if isinstance(val, (int, float)):
+            val = from_excel(val, self.SprdsheetDateEpoch)
+        if isinstance(val, datetime.datetime):
+            return val.date()
+        if isinstance(val, datetime.date):
+            return val
+        return datetime.date.fromisoformat(str(val).strip())
+
+    ##########################################
+    ########    Import engine
+
+    def _buildLookups(self) -> Dict[str, Dict[Any, Any]]:
+        """{field: {key value: primary key}} for every field with a Lookup - read once, up front."""
+        lookups = {}
+        for fld, desc in self.SprdsheetFlds.items():
+            if not desc.get('Lookup'):
+                continue
+            model, keycol = desc['Lookup']
+            pk = inspect(model).primary_key[0].name
+            cols = Repository(self.SessionFactory, model).select_columns(keycol, pk, as_columns=True)
+            lookups[fld] = {_lookupKey(k): v for k, v in zip(cols[keycol], cols[pk])}   # type: ignore
+        return lookups
+
+    def _mapHeader(self, header:Sequence[Any]) -> Tuple[List[Tuple[int, str]], List[str], List[str]]:
+        """Match header cells to fields: ([(column number, SprdsheetFlds name or model column)], ignored, missing)."""
+        flds = {_headerKey(name): name for name in self.SprdsheetFlds}
+        modelcols = {_headerKey(col.name): col.name for col in self.TargetModel.__table__.columns}    # type: ignore
+        colmap, ignored = [], []
+        for colnum, hdr in enumerate(header):
+            key = _headerKey(hdr)
+            if key in flds:
+                colmap.append((colnum, flds[key]))
+            elif key in modelcols:
+                colmap.append((colnum, modelcols[key]))     # passed through as is - see cleanupfld
+            elif hdr is not None:
+                ignored.append(str(hdr))
+        found = {fld for _, fld in colmap}
+        missing = [name for name in self.SprdsheetFlds if name not in found]
+        return colmap, ignored, missing
+
+    def _cleanRow(self, row:Sequence[Any], colmap:List[Tuple[int, str]], lookups:Dict[str, Dict[Any, Any]]) -> Dict[str, Any]:
+        """{model column: value} for one spreadsheet row; raises ValueError naming the first bad field."""
+        rec = {}
+        for colnum, fld in colmap:
+            val = row[colnum] if colnum < len(row) else None
+            if val is None or (isinstance(val, str) and not val.strip()):
+                continue    # blank - the column default applies
+            try:
+                usefld, cleanval = self.cleanupfld(fld, val)
+            except (ValueError, TypeError, ArithmeticError) as e:
+                raise ValueError(f'{fld}: {val!r} - {e}') from None
+            if not usefld:
+                raise ValueError(f'{fld}: {val!r} is not an allowed type')
+            desc = self.SprdsheetFlds.get(fld)
+            if fld in lookups:
+                key = _lookupKey(cleanval)
+                if key not in lookups[fld]:
+                    model, keycol = desc['Lookup']     # type: ignore
+                    raise ValueError(f'{fld}: no {model.__name__} with {keycol} {key!r}')
+                cleanval = lookups[fld][key]
+            rec[desc['ModelFldName'] if desc else fld] = cleanval
+        #endfor colnum, fld
+        return rec
+
+    def _cleanBatch(self, batch:List[Tuple[int, Sequence[Any]]], colmap:List[Tuple[int, str]],
+                    lookups:Dict[str, Dict[Any, Any]], errors:List[Tuple[int, str]]) -> List[Tuple[int, Dict[str, Any]]]:
+        """_cleanRow for a batch of (row number, row), a column at a time.
+        
+        Each column with a ColumnType is converted whole. The values it rejects (and every value of a column
+        without one) go through cleanupfld. Lookup fields map the whole column through their map.
+        Rows with a bad value are reported in errors (first bad field only, as _cleanRow would) and dropped.
+        """
+        nrows = len(batch)
+        width = max((colnum for colnum, _ in colmap), default=-1) + 1
+        rows = [row for _, row in batch]
+        if rows and min(map(len, rows)) < width:
+            rows = [row if len(row) >= width else tuple(row) + (None,) * (width - len(row)) for row in rows]
+        columns = list(zip(*rows)) if rows else []
+        bad: Dict[int, str] = {}        # batch index: first error
+        cleancols: List[Tuple[str, List[Any]]] = []
+        for colnum, fld in colmap:
+            values = columns[colnum]
+            desc = self.SprdsheetFlds.get(fld)
+            coercer = SprdsheetColumnTypes.get(desc.get('ColumnType')) if desc else None   # type: ignore
+            if coercer:
+                try:
+                    out, mask = coercer(values, self.SprdsheetDateEpoch)
+                except (ValueError, TypeError, ArithmeticError):
+                    # the converters shouldn't raise; if one does, every cell goes through cleanupfld
+                    out, mask = [None] * nrows, bytearray(b'\x01') * nrows
+            else:
+                out, mask = [None] * nrows, bytearray(b'\x01') * nrows
+            # the rejects - one cell at a time
+            i = mask.find(1)
+            while i >= 0:
+                val = values[i]
+                if _blankOrNone(val):
+                    out[i] = None
+                elif i not in bad:
+                    try:
+                        usefld, out[i] = self.cleanupfld(fld, val)
+                        if not usefld:
+                            bad[i] = f'{fld}: {val!r} is not an allowed type'
+                    except (ValueError, TypeError, ArithmeticError) as e:
+                        bad[i] = f'{fld}: {val!r} - {e}'
+                i = mask.find(1, i + 1)
+            #endwhile i >= 0
+            if fld in lookups:
+                lookup = lookups[fld]
+                model, keycol = desc['Lookup']     # type: ignore
+                keys = out
+                out = [None if k is None else lookup.get(_lookupKey(k)) for k in keys]
+                for i, (k, v) in enumerate(zip(keys, out)):
+                    if v is None and k is not None and i not in bad:
+                        bad[i] = f'{fld}: no {model.__name__} with {keycol} {_lookupKey(k)!r}'
+            cleancols.append((desc['ModelFldName'] if desc else fld, out))
+        #endfor colnum, fld
+
+        # the records, then blanks taken out so column defaults apply (found with an identity test -
+        # comparing a Decimal with None goes through an isinstance check)
+        names = [name for name, _ in cleancols]
+        recs = list(map(dict, map(zip, itertools.repeat(names), zip(*(out for _, out in cleancols)))))
+        for name, out in cleancols:
+            blanks = bytearray(map(operator.is_, out, itertools.repeat(None)))
+            i = blanks.find(1)
+            while i >= 0:
+                del recs[i][name]
+                i = blanks.find(1, i + 1)
+        #endfor name, out
+        cleaned = list(zip([rownum for rownum, _ in batch], recs))
+        if bad:
+            errors.extend((cleaned[i][0], bad[i]) for i in sorted(bad))
+            cleaned = [rec for i, rec in enumerate(cleaned) if i not in bad]
+        return cleaned
+
+    def _writeBatch(self, repo:Repository, batch:List[Tuple[int, Dict[str, Any]]], errors:List[Tuple[int, str]]) -> int:
+        """Write a batch in one go; if that fails, row by row so only the bad rows are reported. Returns rows written."""
+        try:
+            repo.add_many([rec for _, rec in batch], on_conflict=self.OnConflict, conflict_cols=self.ConflictCols,
+                          batch_size=self.BatchSize)
+            return len(batch)
+        except SQLAlchemyError:
+            pass
+        nwritten = 0
+        for rownum, rec in batch:
+            try:
+                repo.add_many([rec], on_conflict=self.OnConflict, conflict_cols=self.ConflictCols)
+                nwritten += 1
+            except SQLAlchemyError as e:
+                errors.append((rownum, str(getattr(e, 'orig', e))))
+        #endfor rownum, rec
+        return nwritten
+
+    def process_spreadsheet(self, SprsheetName, sheet:str|None = None,
+                            progress:Callable[[int], None]|None = None,
+                            cancel:threading.Event|None = None) -> SprdsheetImportReport:
         """Process a spreadsheet file.
+
+        The first row is the header. The workbook is read in openpyxl read_only mode, one row at a time.
+        Each row is cleaned (cleanupfld) and its Lookup fields resolved from maps built once, up front.
+        Good rows are written BatchSize at a time with Repository.add_many, so memory holds one batch,
+        not the sheet. A row that fails validation or the write is reported; the rest still go in.
         
         Args:
-            SprsheetName: Name or path of the spreadsheet to process.
+            SprsheetName: Name or path of the spreadsheet (.xlsx) to process.
+            sheet (str | None, optional): Worksheet to read. Defaults to None (the active sheet).
+            progress (Callable[[int], None] | None, optional): Called with the rows read so far after every batch. Defaults to None.
+            cancel (threading.Event | None, optional): Checked after every batch; once set, the import stops. Defaults to None.
         
-        Note:
-            This method is not yet implemented.
+        Returns:
+            SprdsheetImportReport: Counts, per-row errors and unmatched columns.
         """
-        pass
+        if self.TargetModel is None or self.SessionFactory is None:
+            raise ValueError(f'{type(self).__name__} needs a TargetModel and a SessionFactory')
+        repo = Repository(self.SessionFactory, self.TargetModel)
+
+        wb = load_workbook(SprsheetName, read_only=True, data_only=True)
+        try:
+            ws = wb[sheet] if sheet else wb.active
+            rows = ws.iter_rows(values_only=True)   # type: ignore
+            header = next(rows, None)
+            if header is None:
+                return SprdsheetImportReport(0, 0, [], [], list(self.SprdsheetFlds))
+            colmap, ignored, missing = self._mapHeader(header)
+            lookups = self._buildLookups()
+
+            nread = nwritten = 0
+            errors: List[Tuple[int, str]] = []
+            batch: List[Tuple[int, Any]] = []      # raw rows (Columnar) or cleaned records
+            cancelled = False
+            for rownum, row in enumerate(rows, start=2):
+                if all(v is None for v in row):
+                    continue
+                nread += 1
+                if self.Columnar:
+                    batch.append((rownum, row))
+                else:
+                    try:
+                        batch.append((rownum, self._cleanRow(row, colmap, lookups)))
+                    except ValueError as e:
+                        errors.append((rownum, str(e)))
+                if len(batch) >= self.BatchSize:
+                    if self.Columnar:
+                        batch = self._cleanBatch(batch, colmap, lookups, errors)
+                    nwritten += self._writeBatch(repo, batch, errors)
+                    batch = []
+                    if progress:
+                        progress(nread)
+                    if cancel is not None and cancel.is_set():
+                        cancelled = True
+                        break
+            #endfor rownum, row
+            if batch and not cancelled:
+                if self.Columnar:
+                    batch = self._cleanBatch(batch, colmap, lookups, errors)
+                nwritten += self._writeBatch(repo, batch, errors)
+            if progress:
+                progress(nread)
+        finally:
+            wb.close()
+
+        errors.sort()
+        return SprdsheetImportReport(nread, nwritten, errors, ignored, missing, cancelled)
+    # process_spreadsheet
 
+    ########    Import engine
+    ##########################################
+# endclass UpldSprdsheet
@@ -1,7 +1,20 @@
 from typing import (Dict, List, Any, Type, )
+from bisect import bisect_right
+from collections import OrderedDict
+import datetime
+import itertools
+from decimal import (Decimal, InvalidOperation, )
+import operator
+from operator import attrgetter
+import queue
+import re
+import threading
+import time
 
 from PySide6.QtCore import (
-    Qt, 
+    Qt, Signal, Slot, 
+    QDate, QDateTime, QTime, 
+    QObject, QRunnable, QThreadPool, 
     QAbstractTableModel, 
     QModelIndex, QPersistentModelIndex,
     )
@@ -9,9 +22,11 @@ from PySide6.QtCore import (
 import sqlalchemy
 from sqlalchemy import (select, text, )
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import (SQLAlchemyError, )
 from sqlalchemy.orm import (Session, sessionmaker, )
 from sqlalchemy.dialects import sqlite
 
+from ..database import (Repository, )
 from .messageBoxes import pleaseWriteMe
 
 
@@ -91,28 +106,60 @@ class cDictModel(QAbstractTableModel):
 
         return flags
 
+# rows per keyset page, and how many pages a SQLAlchemyTableModel keeps in memory
+_DFLT_PAGE_SIZE: int = 256
+_DFLT_MAX_PAGES: int = 8
+
+# comparison prefixes a column filter may start with (longest first, so '>=' isn't read as '>')
+_FILTER_OPERATORS = (
+    ('>=', operator.ge), ('<=', operator.le), ('!=', operator.ne), ('<>', operator.ne),
+    ('=', operator.eq), ('>', operator.gt), ('<', operator.lt),
+    )
+# table name -> columns that lead some index in the database (so ORDER BY them can walk the index)
+_indexedColumns_memo: Dict[str, frozenset] = {}
+
 class SQLAlchemyTableModel(QAbstractTableModel):
     """A Qt table model backed by SQLAlchemy ORM.
     
     This model provides a table view interface to SQLAlchemy ORM objects,
     with support for editing, inserting, and deleting records.
+
+    Rows are fetched on demand, a page at a time, using keyset paging (Repository.get_page).
+    By default the model grows as the view scrolls (canFetchMore/fetchMore); with count_rows
+    it runs one count query up front so the scrollbar is right, and loads pages as they're shown.
+    Only the max_pages most recently used pages stay in memory - pages holding edited rows are kept
+    until they're saved. Rows added with insertRow are shown after the database rows.
+
+    sort() and setColumnFilters() re-query with the new ORDER BY / WHERE - nothing is sorted or
+    filtered in Python. Sorting on a column no index leads emits indexAdvisory.
     
     Attributes:
         session_factory (sessionmaker): Factory for creating database sessions.
         model_class (Type[Any]): The SQLAlchemy ORM model class.
-        _data (list): List of ORM objects currently displayed.
+        _pages (list): One dict per page - key (page_key to seek from), start (row offset), len, rows (None if evicted),
+            disp (the rows' display strings, formatted on first paint).
+        _added (list): Rows inserted into the model (new records), shown after the database rows.
         _dirty (set): Set of (row, col) tuples that have been modified.
         header (list): List of column names.
+    
+    Signals:
+        indexAdvisory: Emitted with advice when sort() orders by a column that has no index.
     """
-    def __init__(self, model_class:Type[Any], session_factory:sessionmaker, filter = None, orderby = None, parent=None):
+    indexAdvisory = Signal(str)
+
+    def __init__(self, model_class:Type[Any], session_factory:sessionmaker, filter = None, orderby = None, parent=None,
+                 page_size:int = _DFLT_PAGE_SIZE, max_pages:int = _DFLT_MAX_PAGES, count_rows:bool = False):
         """Initialize the SQLAlchemy table model.
         
         Args:
             model_class (Type[Any]): SQLAlchemy ORM model class.
             session_factory (sessionmaker): Session factory for database connections.
             filter (optional): Filter condition for initial data load. Defaults to None.
-            orderby (optional): Order by clause for initial data load. Defaults to None.
+            orderby (optional): Order by clause for initial data load - a single sort column, so rows can be keyset paged. Defaults to None (primary key).
             parent (optional): Parent QObject. Defaults to None.
+            page_size (int, optional): Rows fetched per query. Defaults to _DFLT_PAGE_SIZE.
+            max_pages (int, optional): Pages kept in memory; 0 keeps every page. Defaults to _DFLT_MAX_PAGES.
+            count_rows (bool, optional): Count the rows up front, so rowCount (and the scrollbar) covers the whole table. Defaults to False.
         """
         super().__init__(parent)
         self.session_factory = sessionmaker(
@@ -121,56 +168,394 @@ class SQLAlchemyTableModel(QAbstractTableModel):
             **{**session_factory.kw, "expire_on_commit": False}
         )
         self.model_class = model_class
-        self._data = []
+        self._repo = Repository(self.session_factory, model_class)
+        self._pageSize = max(1, page_size)
+        self._maxPages = max(0, max_pages)
+        self._countRows = count_rows
+        self._baseFilter = None     # the filter passed to refresh
+        self._colFilters: List[Any] = []    # WHERE clauses from setColumnFilters
+        self._filter = None         # both together - what's queried
+        self._orderby = None
+        self._pages: List[Dict[str, Any]] = []
+        self._pageStarts: List[int] = []
+        self._loadedPages: OrderedDict[int, None] = OrderedDict()    # LRU of page numbers with rows in memory
+        self._dbRows = 0            # database rows the model covers
+        self._atEnd = True          # no more database rows to fetch
+        self._nextKey = None        # page_key of the last row fetched (grow mode)
+        self._added = []
         self._dirty = set()  # {(row, col)} pairs that are dirty
         # self.header = []
         
         # Set headers based on model class (optional)
         # if hasattr(model_class, '__table__'):
         self.header = [column.name for column in model_class.__table__.columns]
+        # resolved once - data() runs for every visible cell on every repaint
+        self._getters = [attrgetter(name) for name in self.header]
+        self._colIndex = {name: col for col, name in enumerate(self.header)}
+        self._pytypes = [self._columnPyType(column) for column in model_class.__table__.columns]
+        self._alignments = [self._columnAlignment(pytype) for pytype in self._pytypes]
+        self._findIndex: Dict[int, Dict[Any, int]] = {}     # {role: {column 0 value: first row}}, built by findData
 
         self.refresh(filter, orderby)
     
     def refresh(self, filter = None, orderby = None):
-        """Reload data from the database"""
-        with self.session_factory() as session:
-            stmt = select(self.model_class)
-            if filter is not None:
-                stmt = stmt.where(filter)
-            if orderby is not None:
-                stmt = stmt.order_by(orderby)
-            rows = session.execute(stmt).scalars().all()
-            for row in rows:
-                session.expunge(row)  # detach from session
-
+        """Reload data from the database (column filters set with setColumnFilters still apply)"""
         self.beginResetModel()
-        self._data = rows
+        self._baseFilter = filter
+        clauses = ([filter] if filter is not None else []) + self._colFilters
+        self._filter = sqlalchemy.and_(*clauses) if clauses else None
+        self._orderby = orderby
+        self._pages = []
+        self._pageStarts = []
+        self._loadedPages.clear()
+        self._nextKey = None
+        self._added = []
         self._dirty.clear()  # nothing's dirty
+        self._findIndex.clear()
+        if self._countRows:
+            # fixed size - pages are laid out now, and loaded when a row in them is asked for
+            self._dbRows = self._repo.count(self._filter)
+            for start in range(0, self._dbRows, self._pageSize):
+                self._pages.append({'key': None, 'start': start, 'len': min(self._pageSize, self._dbRows - start), 'rows': None, 'disp': None})
+            self._pageStarts = [pg['start'] for pg in self._pages]
+            self._atEnd = True
+        else:
+            # grows - the first page now, the rest as the view asks for it (fetchMore)
+            self._dbRows = 0
+            self._atEnd = False
+            rows = self._fetchNextPage()
+            if rows:
+                self._storePage(rows)
         self.endResetModel()
+
+    ##########################################
+    ########    Paging
+
+    def _fetchPage(self, pgnum:int) -> List[Any]:
+        """Query the rows of page pgnum: seek from its key if we have it, else skip to its start row."""
+        pg = self._pages[pgnum]
+        if pg['key'] is not None or pg['start'] == 0:
+            rows = self._repo.get_page(pg['key'], pg['len'], self._filter, self._orderby)
+        else:
+            rows = self._repo.get_page(None, pg['len'], self._filter, self._orderby, offset=pg['start'])
+        # remember where the next page starts, so it can be seeked to
+        if rows and pgnum+1 < len(self._pages) and self._pages[pgnum+1]['key'] is None:
+            self._pages[pgnum+1]['key'] = self._repo.page_key(rows[-1], self._orderby)
+        return rows
+
+    def _loadPage(self, pgnum:int) -> List[Any|None]:
+        """The rows of page pgnum, loading (and evicting older pages) as needed."""
+        pg = self._pages[pgnum]
+        if pg['rows'] is None:
+            rows = self._fetchPage(pgnum)
+            # the table may have changed since the page was laid out; the model keeps its shape until refresh
+            pg['rows'] = (rows + [None] * pg['len'])[:pg['len']]
+            pg['disp'] = [None] * pg['len']
+            self._loadedPages[pgnum] = None
+            self._evictPages(keep=pgnum)
+        else:
+            self._loadedPages.move_to_end(pgnum)
+        return pg['rows']
+
+    def _evictPages(self, keep:int):
+        """Drop the least recently used pages beyond max_pages - but never one with unsaved edits."""
+        if not self._maxPages or len(self._loadedPages) <= self._maxPages:
+            return
+        pinned = {keep} | {self._pageOfRow(row) for row, _ in self._dirty if row < self._dbRows}
+        for pgnum in list(self._loadedPages):
+            if len(self._loadedPages) <= self._maxPages:
+                break
+            if pgnum in pinned:
+                continue
+            self._pages[pgnum]['rows'] = None
+            self._pages[pgnum]['disp'] = None
+            del self._loadedPages[pgnum]
+        #endfor pgnum
+
+    def _fetchNextPage(self) -> List[Any]:
+        """Query the page after the last fetched row (grow mode)."""
+        rows = self._repo.get_page(self._nextKey, self._pageSize, self._filter, self._orderby)
+        if len(rows) < self._pageSize:
+            self._atEnd = True
+        return rows
+
+    def _storePage(self, rows:List[Any]):
+        """Append freshly fetched rows as a new page after the database rows we have."""
+        pgnum = len(self._pages)
+        self._pages.append({'key': self._nextKey, 'start': self._dbRows, 'len': len(rows), 'rows': rows, 'disp': [None] * len(rows)})
+        self._pageStarts.append(self._dbRows)
+        self._dbRows += len(rows)
+        self._nextKey = self._repo.page_key(rows[-1], self._orderby)
+        self._loadedPages[pgnum] = None
+        self._evictPages(keep=pgnum)
+
+    def _pageOfRow(self, row:int) -> int:
+        return bisect_right(self._pageStarts, row) - 1
+
+    def _rowObject(self, row:int) -> Any|None:
+        """The ORM object shown in row (None if out of range, or if the database no longer has it)."""
+        if row < 0:
+            return None
+        if row >= self._dbRows:
+            row -= self._dbRows
+            return self._added[row] if row < len(self._added) else None
+        pgnum = self._pageOfRow(row)
+        return self._loadPage(pgnum)[row - self._pages[pgnum]['start']]
+
+    def canFetchMore(self, parent:QModelIndex | QPersistentModelIndex=QModelIndex()) -> bool:
+        """True while there are database rows the model hasn't fetched yet."""
+        if parent.isValid():
+            return False
+        return not self._atEnd
+
+    def fetchMore(self, parent:QModelIndex | QPersistentModelIndex=QModelIndex()):
+        """Fetch the next page of rows; new database rows go in ahead of any added rows."""
+        if parent.isValid() or self._atEnd:
+            return
+        before = self._dbRows
+        rows = self._fetchNextPage()     # fetch first, so the view is only told about rows that exist
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), before, before + len(rows) - 1)
+        self._storePage(rows)
+        self._findIndex.clear()
+        # the added rows moved down
+        self._dirty = {(r + len(rows) if r >= before else r, c) for r, c in self._dirty}
+        self.endInsertRows()
+
+    def _iterRows(self):
+        """Every row of the model, in order, without growing the pages kept in memory."""
+        for pgnum, pg in enumerate(self._pages):
+            rows = pg['rows'] if pg['rows'] is not None else self._fetchPage(pgnum)
+            yield from (r for r in rows if r is not None)
+        if not self._atEnd:
+            key = self._nextKey
+            while True:
+                rows = self._repo.get_page(key, self._pageSize, self._filter, self._orderby)
+                yield from rows
+                if len(rows) < self._pageSize:
+                    break
+                key = self._repo.page_key(rows[-1], self._orderby)
+            #endwhile
+        yield from self._added
+
+    ########    Paging
+    ##########################################
+
+    ##########################################
+    ########    Sort and Filter
+
+    def sort(self, column:int, order:Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Re-query ordered by column (ORDER BY column, then the primary key). Unsaved changes are dropped."""
+        if not 0 <= column < len(self.header):
+            return
+        sortcol = self.model_class.__table__.columns[self.header[column]]
+        advice = self.indexAdvice(column)
+        if advice:
+            self.indexAdvisory.emit(advice)
+        self.refresh(self._baseFilter, sortcol.desc() if order == Qt.SortOrder.DescendingOrder else sortcol)
+
+    def setColumnFilters(self, filters:Dict[int, str]) -> List[int]:
+        """Re-query with a WHERE built from per-column filter text. Unsaved changes are dropped.
+
+        Text may start with a comparison (=, !=, <>, <, <=, >, >=) against a value of the column's type
+        (numbers, dates as YYYY-MM-DD, yes/no for booleans). Otherwise text columns match anywhere
+        (LIKE %text%) and other columns must equal it. Blank filters are ignored.
+
+        Args:
+            filters (Dict[int, str]): {column: filter text}.
+        
+        Returns:
+            List[int]: Columns whose filter couldn't be understood - those are left out.
+        """
+        clauses, bad = [], []
+        for col, txt in sorted(filters.items()):
+            txt = (txt or '').strip()
+            if not txt or not 0 <= col < len(self.header):
+                continue
+            try:
+                clauses.append(self._columnFilterClause(col, txt))
+            except ValueError:
+                bad.append(col)
+        #endfor col
+        self._colFilters = clauses
+        self.refresh(self._baseFilter, self._orderby)
+        return bad
+
+    def _columnFilterClause(self, col:int, txt:str):
+        column = self.model_class.__table__.columns[self.header[col]]
+        for prefix, op in _FILTER_OPERATORS:
+            if txt.startswith(prefix):
+                return op(column, self._filterValue(column, txt[len(prefix):].strip()))
+        pytype = self._columnPyType(column)
+        if pytype is not None and issubclass(pytype, str):
+            return column.contains(txt, autoescape=True)
+        return column == self._filterValue(column, txt)
+
+    @classmethod
+    def _filterValue(cls, column, txt:str) -> Any:
+        """txt converted to column's type; ValueError if it isn't one."""
+        pytype = cls._columnPyType(column)
+        if pytype is None or issubclass(pytype, str):
+            return txt
+        if issubclass(pytype, bool):
+            answers = {'1': True, 'y': True, 'yes': True, 't': True, 'true': True,
+                       '0': False, 'n': False, 'no': False, 'f': False, 'false': False}
+            if txt.lower() not in answers:
+                raise ValueError(f'{txt} is not yes or no')
+            return answers[txt.lower()]
+        if issubclass(pytype, datetime.datetime):
+            return datetime.datetime.fromisoformat(txt)
+        if issubclass(pytype, datetime.date):
+            return datetime.date.fromisoformat(txt)
+        if issubclass(pytype, (int, float, Decimal)):
+            try:
+                return pytype(txt)
+            except InvalidOperation:
+                raise ValueError(f'{txt} is not a number')
+        return txt
+
+    def _indexedColumns(self) -> frozenset:
+        """Names of the columns that lead an index on the table - in the model or in the database."""
+        table = self.model_class.__table__
+        if table.name not in _indexedColumns_memo:
+            lead = {col.name for col in list(table.primary_key.columns)[:1]}
+            lead |= {list(ix.columns)[0].name for ix in table.indexes if ix.columns}
+            lead |= {list(uc.columns)[0].name for uc in table.constraints
+                     if isinstance(uc, sqlalchemy.UniqueConstraint) and uc.columns}
+            try:
+                with self.session_factory() as session:
+                    dbindexes = sqlalchemy.inspect(session.connection()).get_indexes(table.name)
+                lead |= {ix['column_names'][0] for ix in dbindexes if ix.get('column_names')}
+            except SQLAlchemyError:
+                pass    # the model's own index list will have to do
+            _indexedColumns_memo[table.name] = frozenset(lead)
+        return _indexedColumns_memo[table.name]
+
+    def indexAdvice(self, column:int) -> str|None:
+        """Advice about an index for sorting on column - None if an index already leads with it."""
+        name = self.header[column]
+        if name in self._indexedColumns():
+            return None
+        table = self.model_class.__table__.name
+        return (f'{table}.{name} is not indexed, so sorting on it reads and sorts every matching row. '
+                f'If this sort is used often, consider: CREATE INDEX ix_{table}_{name} ON "{table}" ("{name}")')
+
+    def hasUnsavedChanges(self) -> bool:
+        """True if there are edits or new rows that save_changes hasn't written yet."""
+        pk = sqlalchemy.inspect(self.model_class).primary_key[0]
+        return bool(self._dirty) or any(getattr(item, pk.key) is None for item in self._added)
+
+    ########    Sort and Filter
+    ##########################################
     
     def rowCount(self, parent:QModelIndex | QPersistentModelIndex=QModelIndex()):
         """Return number of rows"""
-        return len(self._data)
+        if parent.isValid():
+            return 0
+        return self._dbRows + len(self._added)
     
     def columnCount(self, parent:QModelIndex | QPersistentModelIndex=QModelIndex()):
         """Return number of columns"""
-        return len(self.header) if self.header else len(self._data[0].__table__.columns)
+        return len(self.header) if self.header else len(self.model_class.__table__.columns)
     
+    @staticmethod
+    def _columnAlignment(pytype:type|None) -> Qt.AlignmentFlag|None:
+        """Right-align numeric columns (by their _columnPyType); None (the view's default) for everything else."""
+        if pytype is not None and issubclass(pytype, (int, float, Decimal)) and not issubclass(pytype, bool):
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    @staticmethod
+    def _columnPyType(column) -> type|None:
+        """The Python type a column holds, or None if the column type doesn't say."""
+        try:
+            return column.type.python_type
+        except NotImplementedError:
+            return None
+
+    @staticmethod
+    def _editValue(value:Any) -> Any:
+        """The EditRole value: dates and times as their Qt types, so the default delegate opens a
+        date/time editor; Decimals as their display string (no delegate edits a Decimal);
+        everything else as is."""
+        if isinstance(value, datetime.datetime):
+            return QDateTime(QDate(value.year, value.month, value.day),
+                             QTime(value.hour, value.minute, value.second, value.microsecond // 1000))
+        if isinstance(value, datetime.date):
+            return QDate(value.year, value.month, value.day)
+        if isinstance(value, datetime.time):
+            return QTime(value.hour, value.minute, value.second, value.microsecond // 1000)
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
+
+    def _fromEditValue(self, col:int, value:Any) -> Any:
+        """Convert a value from an editor back to column col's Python type.
+
+        Raises:
+            ValueError, ArithmeticError: value can't be read as the column's type.
+        """
+        if isinstance(value, (QDate, QDateTime, QTime)):
+            value = value.toPython()
+        pytype = self._pytypes[col]
+        if pytype is None or value is None:
+            return value
+        if pytype is datetime.date and isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, pytype):
+            return value
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                return None
+            if pytype in (datetime.date, datetime.datetime, datetime.time):
+                return pytype.fromisoformat(value)
+            if pytype is bool:
+                return value.lower() in ('1', 'y', 'yes', 't', 'true')
+        return pytype(value)
+
+    @staticmethod
+    def _formatValue(value:Any) -> str:
+        """The display string for a column value."""
+        return '' if value is None else str(value)
+
+    def _displayRow(self, row:int) -> List[str]|None:
+        """The display strings of row, formatted once and kept with its page until the row is edited or evicted."""
+        if row >= self._dbRows:
+            # added rows are few, and change as they're filled in - don't bother caching
+            item = self._rowObject(row)
+            return [self._formatValue(getter(item)) for getter in self._getters] if item is not None else None
+        pgnum = self._pageOfRow(row)
+        rows = self._loadPage(pgnum)
+        pg = self._pages[pgnum]
+        off = row - pg['start']
+        disp = pg['disp'][off]
+        if disp is None and rows[off] is not None:
+            disp = pg['disp'][off] = [self._formatValue(getter(rows[off])) for getter in self._getters]
+        return disp
+
     def data(self, index, role:int=Qt.ItemDataRole.DisplayRole):
-        """Return data at index for given role"""
+        """Return data at index for given role
+        
+        DisplayRole gives the formatted string, EditRole the column's value in a type delegates
+        have an editor for (see _editValue), TextAlignmentRole right-aligns numeric columns.
+        """
         if not index.isValid():
             return None
 
-        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
-            row = index.row()
-            col = index.column()
-            
-            if row >= len(self._data) or col >= self.columnCount():
-                return None
-                
-            item = self._data[row]
-            column_name = self.header[col] if self.header else item.__table__.columns[col].name
-            return str(getattr(item, column_name))
+        row, col = index.row(), index.column()
+        if row >= self.rowCount() or col >= len(self._getters):
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            disp = self._displayRow(row)
+            return disp[col] if disp is not None else None
+        elif role == Qt.ItemDataRole.EditRole:
+            item = self._rowObject(row)
+            return self._editValue(self._getters[col](item)) if item is not None else None
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._alignments[col]
         
         return None
     
@@ -193,20 +578,32 @@ class SQLAlchemyTableModel(QAbstractTableModel):
         return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
 
     def setData(self, index, value, role:int=Qt.ItemDataRole.EditRole, persist:bool=False):
-        """Set data at index"""
+        """Set data at index - value is converted to the column's type (QDate to date, text to
+        int/Decimal/date...); a value that can't be converted is refused (returns False)"""
         if not index.isValid() or role != Qt.ItemDataRole.EditRole:
             return False
         
         row, col = index.row(), index.column()
         
-        if row >= len(self._data) or col >= self.columnCount():
+        if row >= self.rowCount() or col >= self.columnCount():
             return False
             
-        item = self._data[row]
-        column_name = self.header[col] if self.header else item.__table__.columns[col].name
+        item = self._rowObject(row)
+        if item is None:
+            return False
+
+        try:
+            value = self._fromEditValue(col, value)
+        except (ValueError, TypeError, ArithmeticError):
+            return False
         
-        setattr(item, column_name, value)
-        self._dirty.add((row, col))        # mark dirty
+        setattr(item, self.header[col], value)
+        self._dirty.add((row, col))        # mark dirty - this also keeps the row's page in memory
+        if row < self._dbRows:
+            pg = self._pages[self._pageOfRow(row)]
+            pg['disp'][row - pg['start']] = None
+        if col == 0:
+            self._findIndex.clear()
 
         if persist:
             with self.session_factory() as session:
@@ -218,24 +615,95 @@ class SQLAlchemyTableModel(QAbstractTableModel):
         self.dataChanged.emit(index, index)
         return True
 
-    def save_changes(self):
-        """Save all modified rows to the database.
+    def save_changes(self) -> Dict[int, Exception]:
+        """Save the edited and added rows to the database.
         
-        Merges all data rows with the database session and commits the changes.
-        Clears all dirty flags after successful save.
+        Edited rows are written without loading anything first: one executemany UPDATE
+        (by primary key) per set of changed columns. New rows are INSERTed. If a batch fails,
+        its rows are retried one at a time, each in a savepoint, so one bad row doesn't sink the rest.
+        Dirty flags are cleared only for the rows that were saved.
+
+        Returns:
+            Dict[int, Exception]: {row: error} for the rows that couldn't be saved - empty if all were.
         """
+        table = self.model_class.__table__
+        pk = sqlalchemy.inspect(self.model_class).primary_key[0]
+
+        inserts = [row for row in range(self._dbRows, self.rowCount())
+                   if getattr(self._added[row - self._dbRows], pk.key) is None]
+        dirtycols: Dict[int, set] = {}
+        for row, col in self._dirty:
+            dirtycols.setdefault(row, set()).add(col)
+        # rows that changed the same columns share an UPDATE statement
+        updates: Dict[tuple, List[int]] = {}
+        for row, cols in dirtycols.items():
+            item = self._rowObject(row)
+            if item is None or getattr(item, pk.key) is None:
+                continue    # gone from the database, or an insert
+            updates.setdefault(tuple(sorted(cols)), []).append(row)
+
+        saved: List[int] = []
+        failed: Dict[int, Exception] = {}
         with self.session_factory() as session:
-            for row in self._data:
-                session.merge(row)   # re-attach changes
+            for cols, rows in updates.items():
+                # SET clause comes from the parameter keys; the WHERE binds the pk under another name
+                stmt = sqlalchemy.update(table).where(table.c[pk.name] == sqlalchemy.bindparam('_pk'))
+                params = []
+                for row in rows:
+                    item = self._rowObject(row)
+                    params.append({'_pk': getattr(item, pk.key), **{self.header[c]: self._getters[c](item) for c in cols}})
+                try:
+                    with session.begin_nested():
+                        session.execute(stmt, params)
+                    saved.extend(rows)
+                except SQLAlchemyError:
+                    for row, rowparams in zip(rows, params):
+                        try:
+                            with session.begin_nested():
+                                session.execute(stmt, [rowparams])
+                            saved.append(row)
+                        except SQLAlchemyError as e:
+                            failed[row] = e
+                    #endfor row
+            #endfor cols
+            inserted = []
+            for row in inserts:
+                item = self._added[row - self._dbRows]
+                try:
+                    with session.begin_nested():
+                        session.add(item)
+                        session.flush()
+                    saved.append(row)
+                    inserted.append(item)
+                except SQLAlchemyError as e:
+                    failed[row] = e
+            #endfor row
             session.commit()
-        self._dirty.clear()
+            # new rows are records now (they have their keys), so saving them again updates rather than re-inserts
+            for item in inserted:
+                session.expunge(item)
+        #endwith session
+
+        savedrows = set(saved)
+        self._dirty = {(r, c) for r, c in self._dirty if r not in savedrows}
+        if inserted:
+            self._findIndex.clear()
+        return failed
 
     def insertRow(self, row, parent:QModelIndex | QPersistentModelIndex=QModelIndex(), persist:bool = False):
-        """Insert a new row"""
+        """Insert a new row
+        
+        New rows have no place in the paged (keyset) order yet, so they go after the database rows,
+        at row if that's past them.
+        """
+        addpos = min(max(row - self._dbRows, 0), len(self._added))
+        row = self._dbRows + addpos
         self.beginInsertRows(parent, row, row)
         new_item = self.model_class()  # Create new instance with default values
+        self._dirty = {(r+1 if r >= row else r, c) for r, c in self._dirty}
+        self._findIndex.clear()
         if not persist:
-            self._data.insert(row, new_item)
+            self._added.insert(addpos, new_item)
             self.endInsertRows()
             return True
         #endif
@@ -246,7 +714,7 @@ class SQLAlchemyTableModel(QAbstractTableModel):
                 session.add(new_item)
                 session.flush()  # to get any defaults set by the DB
                 session.expunge(new_item)  # detach from session
-                self._data.insert(row, new_item)
+                self._added.insert(addpos, new_item)
                 session.commit()
             self.endInsertRows()
             return True
@@ -257,46 +725,104 @@ class SQLAlchemyTableModel(QAbstractTableModel):
     
     def removeRow(self, row, parent:QModelIndex | QPersistentModelIndex=QModelIndex()):
         """Remove a row"""
-        if row < 0 or row >= len(self._data):
+        if row < 0 or row >= self.rowCount():
             return False
             
-        self.beginRemoveRows(parent, row, row)
-        item = self._data.pop(row)
+        pk = sqlalchemy.inspect(self.model_class).primary_key[0]
+        isAdded = row >= self._dbRows
+        if isAdded:
+            item = self._added[row - self._dbRows]
+        else:
+            pgnum = self._pageOfRow(row)
+            item = self._loadPage(pgnum)[row - self._pages[pgnum]['start']]
+        # delete from the database first - if that fails, the model hasn't changed
         try:
-            with self.session_factory() as session:
-                session.delete(session.merge(item))
-                session.commit()
-            self.endRemoveRows()
-            return True
+            if item is not None and getattr(item, pk.key) is not None:
+                with self.session_factory() as session:
+                    session.delete(session.merge(item))
+                    session.commit()
         except Exception as e:
-            self._data.insert(row, item)  # Reinsert if failed
-            self.endRemoveRows()
             print(f"Error removing row: {e}")
             return False
 
+        self.beginRemoveRows(parent, row, row)
+        if isAdded:
+            self._added.pop(row - self._dbRows)
+        else:
+            self._pages[pgnum]['rows'].pop(row - self._pages[pgnum]['start'])
+            self._pages[pgnum]['disp'].pop(row - self._pages[pgnum]['start'])
+            self._shiftPages(pgnum, -1)
+        self._dirty = {(r-1 if r > row else r, c) for r, c in self._dirty if r != row}
+        self._findIndex.clear()
+        self.endRemoveRows()
+        return True
+
+    def _shiftPages(self, pgnum:int, delta:int):
+        """Page pgnum grew or shrank by delta rows; move the pages after it."""
+        self._pages[pgnum]['len'] += delta
+        for pg in self._pages[pgnum+1:]:
+            pg['start'] += delta
+        self._pageStarts = [pg['start'] for pg in self._pages]
+        self._dbRows += delta
+
     def record(self, row:int|None = None):
         """Return the record at the specified row"""
         if row is None:
             return self.header
-        if 0 <= row < len(self._data):
-            return self._data[row]
+        if 0 <= row < self.rowCount():
+            return self._rowObject(row)
         return None
     
+    def _buildFindIndex(self, role:int) -> Dict[Any, int]:
+        """{column 0 value: first row} for every row of the model.
+        
+        One query for just column 0 (in the model's paging order) covers the database rows;
+        rows in memory override it, since they may have unsaved edits.
+        """
+        getter = self._getters[0]
+        values: List[Any] = []
+        if self._dbRows:
+            stmt = select(self.model_class.__table__.columns[self.header[0]])
+            if self._filter is not None:
+                stmt = stmt.where(self._filter)
+            stmt = stmt.order_by(*self._repo.keyset_order(self._orderby)).limit(self._dbRows)
+            with self.session_factory() as session:
+                values = list(session.scalars(stmt))
+            values = (values + [None] * self._dbRows)[:self._dbRows]
+            for pgnum in self._loadedPages:
+                pg = self._pages[pgnum]
+                for off, item in enumerate(pg['rows']):
+                    if item is not None:
+                        values[pg['start'] + off] = getter(item)
+        #endif self._dbRows
+        values.extend(getter(item) for item in self._added)
+        if role == Qt.ItemDataRole.DisplayRole:
+            values = [self._formatValue(v) for v in values]
+
+        index: Dict[Any, int] = {}
+        for row, v in enumerate(values):
+            index.setdefault(v, row)
+        return index
+
     def findData(self, value:Any, role:int=Qt.ItemDataRole.DisplayRole) -> int:
-        """Find the index of the first occurrence of value in the model"""
-        for row in range(self.rowCount()):
-            if self.data(self.index(row, 0), role) == value:
-                return row
-        return -1
+        """Find the index of the first occurrence of value in the model (column 0)
+        
+        DisplayRole matches the display string, EditRole the typed value. The lookup is a hash index,
+        built on first use and dropped when rows are added, removed or column 0 is edited.
+        """
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return -1
+        index = self._findIndex.get(role)
+        if index is None:
+            index = self._findIndex[role] = self._buildFindIndex(role)
+        try:
+            return index.get(value, -1)
+        except TypeError:   # unhashable value - can't be in a column
+            return -1
     
     def findColumn(self, column_name:str) -> int:
         """Find the index of the specified column name"""
-        if self.header:
-            try:
-                return self.header.index(column_name)
-            except ValueError:
-                return -1
-        return -1
+        return self._colIndex.get(column_name, -1)
     
     def getDataAsList(self) -> List[Dict[str, Any]]:
         """Return the data as a list of dictionaries.
@@ -305,7 +831,7 @@ class SQLAlchemyTableModel(QAbstractTableModel):
             List[Dict[str, Any]]: List where each element is a dictionary mapping
                 column names to values for each row.
         """
-        return [{col: getattr(item, col) for col in self.header} for item in self._data]
+        return [{col: getattr(item, col) for col in self.header} for item in self._iterRows()]
 
     # is this needed?    
     def getDataAsDict(self) -> Dict[str, Any]:
@@ -316,11 +842,22 @@ class SQLAlchemyTableModel(QAbstractTableModel):
                 of all values in that column.
         """
         data_dict = {col: [] for col in self.header}
-        for item in self._data:
+        for item in self._iterRows():
             for col in self.header:
                 data_dict[col].append(getattr(item, col))
         return data_dict
 
+    def exportStatement(self) -> sqlalchemy.Select:
+        """The Core SELECT of every row the model covers - filtered and ordered as shown, one column per header entry.
+        
+        For exports: it streams from the database rather than through the page cache, so rows added or
+        edited in the model but not yet saved are not included.
+        """
+        stmt = select(*self.model_class.__table__.columns)
+        if self._filter is not None:
+            stmt = stmt.where(self._filter)
+        return stmt.order_by(*self._repo.keyset_order(self._orderby))
+
     def getSQLStatement(self) -> str:
         """Return the SQL query string used to fetch the data.
         
@@ -329,6 +866,9 @@ class SQLAlchemyTableModel(QAbstractTableModel):
         """
         try:
             stmt = select(self.model_class)
+            if self._filter is not None:
+                stmt = stmt.where(self._filter)
+            stmt = stmt.order_by(*self._repo.keyset_order(self._orderby))
             compiled = stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
             return str(compiled)
         except Exception as e:
@@ -363,42 +903,363 @@ class SQLAlchemyTableModel(QAbstractTableModel):
         else:
             self._dirty.clear()
 
+# SQLAlchemySQLQueryModel.execute: rows per chunk handed to the model, rows fetched before pausing for
+# fetchMoreRows/fetchAllRows, how often (in SQLite VM steps) the running statement checks for cancel,
+# and the least time between progress signals while it runs
+_DFLT_SQL_CHUNK: int = 500
+_DFLT_SQL_PREVIEW: int = 10000
+_SQL_PROGRESS_STEPS: int = 1000
+_SQL_TICK_SECONDS: float = 0.25
+
+# a raw SQL statement that only reads, so it can be run again (to page on, or to export it)
+_READONLY_SQL = re.compile(r'^\s*(select|with|values)\b', re.IGNORECASE)
+_WRITING_SQL = re.compile(r'\b(insert|update|delete|replace|create|drop|alter)\b', re.IGNORECASE)
+
+def isReadOnlySQL(sql:str) -> bool:
+    """True if sql looks like it only reads (SELECT/WITH/VALUES, no writing keyword anywhere)."""
+    return bool(_READONLY_SQL.match(sql)) and not _WRITING_SQL.search(sql)
+
+class _SQLQuerySignals(QObject):
+    """Carries a query runner's results to the GUI thread (queued connections). Every signal carries the run id."""
+    columns = Signal(int, object)   # column names (empty if the statement returns no rows)
+    chunk = Signal(int, object)     # the next rows, column-wise: one tuple of values per column
+    tick = Signal(int)              # still running
+    paused = Signal(int)            # fetched as many rows as asked for; the cursor is open, waiting for more
+    done = Signal(int, str)         # '' when every row is fetched, else the error (or 'cancelled')
+# endclass _SQLQuerySignals
+
+class _SQLQueryRunner(QRunnable):
+    """Runs one SQL statement on a pool thread, streaming the rows back in chunks.
+    
+    After limit rows it pauses until the model asks for more (commands: an int - that many
+    more rows, None - the rest, _STOP - close up). A statement that only reads is closed while
+    paused, so no read transaction is held open (which would stop WAL checkpoints for everyone):
+    it's run again on resume and the rows already handed over are skipped. Anything else
+    can't safely be run twice, so it waits with its cursor open.
+    """
+    _STOP = 'stop'
+
+    def __init__(self, runID:int, sql:str, engine:Engine, signals:_SQLQuerySignals, cancelEvent:threading.Event,
+                 commands:queue.SimpleQueue, chunk_size:int, limit:int|None):
+        super().__init__()
+        self._runID = runID
+        self._sql = sql
+        self._engine = engine
+        self._signals = signals         # held here so it outlives the model if the window closes mid-query
+        self._cancel = cancelEvent
+        self._commands = commands
+        self._chunkSize = chunk_size
+        self._limit = limit
+        self._rerunnable = isReadOnlySQL(sql)
+        self._fetched = 0               # rows handed over so far
+        self._remaining = limit         # rows to hand over before pausing (None - all of them)
+
+    def _progressHandler(self) -> int:
+        # called by SQLite every _SQL_PROGRESS_STEPS VM steps; non-zero interrupts the statement
+        if self._cancel.is_set():
+            return 1
+        now = time.monotonic()
+        if now - self._lastTick >= _SQL_TICK_SECONDS:
+            self._lastTick = now
+            self._signals.tick.emit(self._runID)
+        return 0
+
+    def _waitForCommand(self) -> bool:
+        """Pause until the model asks for more rows; False if it says stop."""
+        self._signals.paused.emit(self._runID)
+        # hand the pool thread back while waiting - a paused query can wait indefinitely
+        pool = QThreadPool.globalInstance()
+        pool.releaseThread()
+        try:
+            cmd = self._commands.get()
+        finally:
+            pool.reserveThread()
+        if cmd == self._STOP or self._cancel.is_set():
+            return False
+        self._remaining = cmd
+        return True
+
+    def _skipRows(self, result) -> bool:
+        """On a re-run, pass over the rows handed over before the pause; False if cancelled."""
+        left = self._fetched
+        while left > 0 and not self._cancel.is_set():
+            rows = result.fetchmany(min(self._chunkSize, left))
+            if not rows:
+                break
+            left -= len(rows)
+        return not self._cancel.is_set()
+
+    def _fetchRows(self, result) -> bool|None:
+        """Hand over rows until they run out (True), the run stops (False), or the limit is
+        reached on a re-runnable statement (None - the caller closes it and waits)."""
+        sig = self._signals
+        while not self._cancel.is_set():
+            if self._remaining == 0:
+                if self._rerunnable:
+                    return None
+                if not self._waitForCommand():
+                    return False
+                continue
+            rows = result.fetchmany(self._chunkSize if self._remaining is None else min(self._chunkSize, self._remaining))
+            if not rows:
+                return True
+            sig.chunk.emit(self._runID, list(zip(*rows)))
+            self._fetched += len(rows)
+            if self._remaining is not None:
+                self._remaining -= len(rows)
+        #endwhile
+        return False
+
+    def run(self):
+        sig = self._signals
+        msg = 'query failed'
+        self._lastTick = time.monotonic()
+        try:
+            started = False
+            state: bool|None = None
+            while state is None:
+                with self._engine.connect() as conn:
+                    dbapi_conn = conn.connection.driver_connection
+                    setHandler = getattr(dbapi_conn, 'set_progress_handler', None)    # sqlite3 only - elsewhere cancel waits for the next chunk
+                    if setHandler:
+                        setHandler(self._progressHandler, _SQL_PROGRESS_STEPS)
+                    try:
+                        result = conn.execute(sqlalchemy.text(self._sql))
+                        if not result.returns_rows:
+                            sig.columns.emit(self._runID, [])
+                            state = True
+                        else:
+                            if not started:
+                                sig.columns.emit(self._runID, list(result.keys()))
+                            started = True
+                            state = self._fetchRows(result) if self._skipRows(result) else False
+                            result.close()
+                    finally:
+                        if setHandler:
+                            setHandler(None, 0)
+                #endwith conn - closed, so a paused run holds no read transaction
+                if state is None and not self._waitForCommand():
+                    state = False
+            #endwhile state is None
+            msg = '' if state else 'cancelled'
+        except SQLAlchemyError as e:
+            msg = str(getattr(e, 'orig', e))
+        except Exception as e:
+            # e.g. a value the driver can't convert - the model still has to hear that the run is over
+            msg = str(e) or type(e).__name__
+        finally:
+            if self._cancel.is_set():
+                msg = 'cancelled'
+            sig.done.emit(self._runID, msg)
+    # run
+# endclass _SQLQueryRunner
+
 class SQLAlchemySQLQueryModel(QAbstractTableModel):
     """A Qt table model that executes raw SQL queries.
     
     This model executes a raw SQL query and displays the results in a table view.
     Unlike SQLAlchemyTableModel, this is read-only and works with raw SQL.
+
+    refresh() runs the query on the calling thread. execute() runs it on a QThreadPool thread
+    instead: rows are appended as they arrive, progress reports rows and elapsed time, and
+    cancel() stops the statement (on SQLite, through the connection's progress handler).
+    execute() stops after preview_limit rows until fetchMoreRows/fetchAllRows ask for more, or
+    cancel ends it. A query that only reads is closed while it waits - no read transaction is
+    held - and is run again to fetch more, so rows written meanwhile can shift what comes next.
+    Anything else waits with its cursor open.
+    Rows are stored column-wise - one list per column, not a list per row.
     
     Attributes:
         sql (str): The SQL query string.
         engine (Engine): SQLAlchemy engine for executing queries.
         header (List[str]): List of column names from the query results.
-        _data (List[List[Any]]): Query results as a list of rows.
+        _cols (List[List[Any]]): Query results, one list of values per column.
+        _nrows (int): Number of rows fetched.
+    
+    Signals:
+        progress: Emitted with (rows fetched, seconds elapsed) while execute() runs.
+        fetchPaused: Emitted when execute() has fetched the rows asked for and more may remain.
+        finished: Emitted when execute() ends - '' once every row is fetched, else the error message, or 'cancelled'.
     """
-    def __init__(self, sql: str, engine: Engine, parent=None):
+    progress = Signal(int, float)
+    fetchPaused = Signal()
+    finished = Signal(str)
+
+    def __init__(self, sql: str, engine: Engine, parent=None, asynchronous:bool = False,
+                 chunk_size:int = _DFLT_SQL_CHUNK, preview_limit:int|None = _DFLT_SQL_PREVIEW):
         """Initialize the SQL query model.
         
         Args:
             sql (str): SQL query string to execute.
             engine (Engine): SQLAlchemy engine for database connection.
             parent (optional): Parent QObject. Defaults to None.
+            asynchronous (bool, optional): Start the query with execute() instead of refresh(). Defaults to False.
+            chunk_size (int, optional): Rows per chunk for execute(). Defaults to _DFLT_SQL_CHUNK.
+            preview_limit (int | None, optional): Rows execute() fetches before pausing (and fetchMoreRows fetches
+                by default); None or 0 fetches everything. Defaults to _DFLT_SQL_PREVIEW.
         """
         super().__init__(parent)
         self.sql = sql
         self.engine = engine
         self.header: List[str] = []
-        self._data: List[List[Any]] = []
-        self.refresh()
+        self._cols: List[List[Any]] = []
+        self._nrows = 0
+        self._chunkSize = max(1, chunk_size)
+        self._previewLimit = preview_limit or None
+        self._runID = 0
+        self._cancelEvent: threading.Event|None = None
+        self._commands: queue.SimpleQueue|None = None
+        self._running = False
+        self._fetching = False
+        self._exhausted = False
+        self._t0 = 0.0
+        self._elapsed = 0.0
+        self._error = ''
+        if asynchronous:
+            self.execute()
+        else:
+            self.refresh()
+
+    def _setColumns(self, header:List[str]):
+        self.header = list(header)
+        self._cols = [[] for _ in self.header]
+        self._nrows = 0
 
     def refresh(self):
-        """Re-execute the SQL query and refresh the model data."""
+        """Re-execute the SQL query and refresh the model data (every row, on this thread)."""
+        # a running execute() is superseded: stop it, and ignore whatever it has already signalled
+        self.cancel()
+        self._runID += 1
+        self._running = False
+        self._fetching = False
+        self._error = ''
         self.beginResetModel()
         with self.engine.connect() as conn:
             result = conn.execute(sqlalchemy.text(self.sql))
-            self.header = list(result.keys())
-            self._data = [list(row) for row in result.fetchall()]
+            self._setColumns(list(result.keys()))
+            while rows := result.fetchmany(self._chunkSize):
+                for col, values in zip(self._cols, zip(*rows)):
+                    col.extend(values)
+                self._nrows += len(rows)
+        self._exhausted = True
+        self.endResetModel()
+
+    ##########################################
+    ########    Background execution
+
+    def execute(self):
+        """Run the SQL query on a pool thread; rows stream into the model. A run in progress is cancelled."""
+        self.cancel()
+        self._runID += 1
+        self._cancelEvent = threading.Event()
+        self._commands = queue.SimpleQueue()
+        self.beginResetModel()
+        self._setColumns([])
+        self.endResetModel()
+
+        signals = _SQLQuerySignals()
+        signals.columns.connect(self._onColumns)
+        signals.chunk.connect(self._onChunk)
+        signals.tick.connect(self._onTick)
+        signals.paused.connect(self._onPaused)
+        signals.done.connect(self._onDone)
+        self._running = True
+        self._fetching = True
+        self._exhausted = False
+        self._error = ''
+        self._t0 = time.monotonic()
+        QThreadPool.globalInstance().start(
+            _SQLQueryRunner(self._runID, self.sql, self.engine, signals, self._cancelEvent, self._commands,
+                            self._chunkSize, self._previewLimit))
+
+    def fetchMoreRows(self, n:int|None = None):
+        """Fetch n more rows (default preview_limit) from a paused execute()."""
+        if self._running and not self._fetching and self._commands is not None:
+            self._fetching = True
+            self._commands.put(n or self._previewLimit)
+
+    def fetchAllRows(self):
+        """Fetch the rest of the rows of a paused execute()."""
+        if self._running and not self._fetching and self._commands is not None:
+            self._fetching = True
+            self._commands.put(None)
+
+    def cancel(self):
+        """Stop the running execute(), if any. finished('cancelled') follows once the statement stops."""
+        if self._running and self._cancelEvent is not None:
+            self._cancelEvent.set()
+            if self._commands is not None:
+                self._commands.put(_SQLQueryRunner._STOP)   # wakes a paused runner
+
+    def isRunning(self) -> bool:
+        """True while an execute() is in progress - fetching, or paused waiting for fetchMoreRows/fetchAllRows."""
+        return self._running
+
+    def isFetching(self) -> bool:
+        """True while an execute() is fetching rows (not paused)."""
+        return self._running and self._fetching
+
+    def isExhausted(self) -> bool:
+        """True once every row of the result has been fetched."""
+        return self._exhausted
+
+    def elapsed(self) -> float:
+        """Seconds the current (or last) execute() has run."""
+        return time.monotonic() - self._t0 if self._running else self._elapsed
+
+    def lastError(self) -> str:
+        """The last execute()'s error message ('' if it succeeded)."""
+        return self._error
+
+    @Slot(int, object)
+    def _onColumns(self, runID:int, columns:List[str]):
+        if runID != self._runID:
+            return
+        self.beginResetModel()
+        self._setColumns(columns)
         self.endResetModel()
 
+    @Slot(int, object)
+    def _onChunk(self, runID:int, columns:List[tuple]):
+        if runID != self._runID or not columns:
+            return
+        nnew = len(columns[0])
+        first = self._nrows
+        self.beginInsertRows(QModelIndex(), first, first + nnew - 1)
+        for col, values in zip(self._cols, columns):
+            col.extend(values)
+        self._nrows += nnew
+        self.endInsertRows()
+        self.progress.emit(self._nrows, self.elapsed())
+
+    @Slot(int)
+    def _onTick(self, runID:int):
+        if runID == self._runID:
+            self.progress.emit(self._nrows, self.elapsed())
+
+    @Slot(int)
+    def _onPaused(self, runID:int):
+        if runID != self._runID:
+            return
+        self._fetching = False
+        self.progress.emit(self._nrows, self.elapsed())
+        self.fetchPaused.emit()
+
+    @Slot(int, str)
+    def _onDone(self, runID:int, message:str):
+        if runID != self._runID:
+            return
+        self._elapsed = time.monotonic() - self._t0
+        self._running = False
+        self._fetching = False
+        self._exhausted = not message
+        self._error = message
+        self.progress.emit(self._nrows, self._elapsed)
+        self.finished.emit(message)
+
+    ########    Background execution
+    ##########################################
+
     def rowCount(self, parent: QModelIndex|QPersistentModelIndex = QModelIndex()) -> int:
         """Return the number of rows in the model.
         
@@ -408,7 +1269,7 @@ class SQLAlchemySQLQueryModel(QAbstractTableModel):
         Returns:
             int: Number of rows.
         """
-        return len(self._data)
+        return self._nrows
 
     def columnCount(self, parent: QModelIndex|QPersistentModelIndex = QModelIndex()) -> int:
         """Return the number of columns in the model.
@@ -435,8 +1296,8 @@ class SQLAlchemySQLQueryModel(QAbstractTableModel):
             return None
         row = index.row()
         column = index.column()
-        if 0 <= row < len(self._data) and 0 <= column < len(self.header):
-            return self._data[row][column]
+        if 0 <= row < self._nrows and 0 <= column < len(self._cols):
+            return self._cols[column][row]
         return None
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
@@ -466,10 +1327,17 @@ class SQLAlchemySQLQueryModel(QAbstractTableModel):
     
     def record(self, row: int | None = None) -> Any:
         """Return the record at the specified row."""
-        if row is not None and 0 <= row < len(self._data):
-            return self._data[row]
+        if row is not None and 0 <= row < self._nrows:
+            return [col[row] for col in self._cols]
         return None
 
+    def iterRows(self):
+        """Iterate the rows fetched so far as tuples, without copying them.
+        
+        Safe to consume on another thread: execute() and refresh() replace the column lists rather than clear them.
+        """
+        return itertools.islice(zip(*self._cols), self._nrows)
+
     def colIndex(self, colName: str) -> int:
         """Return the index of the specified column name.
         
@@ -60,8 +60,13 @@ class cDataList(QLineEdit):
         
         self.setClearButtonEnabled(True)
         
-        choices_to_present = list(choices.values())
-        qCompleterObj = QCompleter(QStringListModel(choices_to_present, self), self)
+        # a choices object that keeps its own (shared, live) completer model supplies it
+        completerModel = getattr(choices, 'completerModel', None)
+        if callable(completerModel):
+            qCompleterObj = QCompleter(completerModel(), self)
+        else:
+            choices_to_present = list(choices.values())
+            qCompleterObj = QCompleter(QStringListModel(choices_to_present, self), self)
         qCompleterObj.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         qCompleterObj.setFilterMode(Qt.MatchFlag.MatchContains)
         qCompleterObj.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
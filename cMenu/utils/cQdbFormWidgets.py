@@ -3,7 +3,7 @@ from collections.abc import (Callable, )
 from functools import (partial, )
 
 from PySide6.QtCore import (
-    Qt, Slot, Signal, 
+    Qt, Slot, Signal, QTimer, 
     )
 from PySide6.QtGui import (
     QFont, QIcon, 
@@ -29,6 +29,7 @@ from .messageBoxes import (areYouSure, )
 from .SQLAlcTools import (get_primary_key_column, )
 
 from app.database import app_Session
+from cMenu.database import (loader_options, identity_cache, )
 
 
 class cQFmNameLabel(QLabel):
@@ -60,6 +61,80 @@ class cQFmNameLabel(QLabel):
     # __init__
 # endclass cQFmNameLabel
 
+class cQTableFilterBar(QWidget):
+    """A row of filter boxes lined up over the columns of a QTableView.
+    
+    The boxes follow the view's column widths, order and horizontal scrolling.
+    filtersChanged is emitted (debounced) with {column: text} once typing pauses.
+    
+    Signals:
+        filtersChanged: Emitted with the {logical column: filter text} of the non-blank boxes.
+    """
+    filtersChanged = Signal(object)     # {int: str} - Signal(dict) would go through QVariantMap and lose int keys
+    _DEBOUNCE_MS: int = 400
+
+    def __init__(self, tableView:QTableView, parent:QWidget|None = None):
+        """Initialize the filter bar.
+        
+        Args:
+            tableView (QTableView): The view whose columns the boxes line up with. Its model must be set.
+            parent (QWidget | None, optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self._view = tableView
+        self._edits: Dict[int, QLineEdit] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self._DEBOUNCE_MS)
+        self._timer.timeout.connect(lambda: self.filtersChanged.emit(self.filters()))
+
+        header = tableView.horizontalHeader()
+        for col in range(tableView.model().columnCount()):
+            edit = QLineEdit(self)
+            edit.setPlaceholderText(self.tr('filter'))
+            edit.setClearButtonEnabled(True)
+            edit.setToolTip(self.tr('text to match, or =, !=, <, <=, >, >= a value'))
+            edit.textChanged.connect(self._timer.start)
+            edit.returnPressed.connect(self._emitNow)
+            self._edits[col] = edit
+        #endfor col
+        self.setFixedHeight(max((e.sizeHint().height() for e in self._edits.values()), default=0))
+
+        header.sectionResized.connect(self._placeEdits)
+        header.sectionMoved.connect(self._placeEdits)
+        header.geometriesChanged.connect(self._placeEdits)
+        tableView.horizontalScrollBar().valueChanged.connect(self._placeEdits)
+    # __init__
+
+    def _emitNow(self):
+        self._timer.stop()
+        self.filtersChanged.emit(self.filters())
+
+    def _placeEdits(self, *args):
+        header = self._view.horizontalHeader()
+        offset = self._view.frameWidth() + self._view.verticalHeader().width()
+        for col, edit in self._edits.items():
+            if header.isSectionHidden(col):
+                edit.hide()
+                continue
+            edit.setGeometry(offset + header.sectionViewportPosition(col), 0, header.sectionSize(col), self.height())
+            edit.show()
+    # _placeEdits
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._placeEdits()
+
+    def filters(self) -> Dict[int, str]:
+        """{logical column: text} of the boxes that aren't blank."""
+        return {col: edit.text() for col, edit in self._edits.items() if edit.text().strip()}
+
+    def markInvalid(self, columns:List[int]):
+        """Highlight the boxes whose filter wasn't understood (and clear the rest)."""
+        for col, edit in self._edits.items():
+            edit.setStyleSheet('QLineEdit { background-color: #ffd0d0; }' if col in columns else '')
+# endclass cQTableFilterBar
+
 # TODO: implement editing
 # deprecate? see subform widget 
 class cSimpleTableForm(QWidget):
@@ -112,7 +187,8 @@ class cSimpleTableForm(QWidget):
 
         # Setup model
         assert self._tbl, "Table model class must be provided"
-        self.model = SQLAlchemyTableModel(self._tbl, ssnmaker)
+        # count_rows: these can be whole (big) tables - size the scrollbar up front, load pages as they scroll into view
+        self.model = SQLAlchemyTableModel(self._tbl, ssnmaker, count_rows=True)
         # self.model.setEditStrategy(QSqlTableModel.OnFieldChange)
 
         # Setup view
@@ -134,7 +210,25 @@ class cSimpleTableForm(QWidget):
         rows = tableView.model().rowCount()
         colNames = [tableView.model().headerData(n, Qt.Orientation.Horizontal) for n in range(tableView.model().columnCount())]
         # tableView.resizeColumnsToContents()
-        layoutFormMain.addWidget(tableView,0,0)
+        self.tableView = tableView
+
+        # header clicks and the filter bar become ORDER BY / WHERE - see SQLAlchemyTableModel.sort, setColumnFilters
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self._sortIndicator = (-1, Qt.SortOrder.AscendingOrder)
+        header.sortIndicatorChanged.connect(self.sortBy)
+        self.filterBar = cQTableFilterBar(tableView, parent=self)
+        self.filterBar.filtersChanged.connect(self.applyFilters)
+        self._appliedFilters: Dict[int, str] = {}
+        self.lblIndexAdvice = QLabel(parent=self)
+        self.lblIndexAdvice.setWordWrap(True)
+        self.lblIndexAdvice.hide()
+        self.model.indexAdvisory.connect(self._showIndexAdvice)
+
+        layoutFormMain.addWidget(self.filterBar,0,0)
+        layoutFormMain.addWidget(tableView,1,0)
+        layoutFormMain.addWidget(self.lblIndexAdvice,2,0)
 
         # Add a add button
         addrow_button = QPushButton("Add Row")
@@ -158,9 +252,64 @@ class cSimpleTableForm(QWidget):
         self.model.insertRow(self.model.rowCount())
     # addRow
 
-    def saveRow(self):
-        """Save all changes made to the table."""
-        self.model.save_changes()
+    def _okToRequery(self) -> bool:
+        """Sorting or filtering re-reads the table; offer to save unsaved changes first."""
+        if not self.model.hasUnsavedChanges():
+            return True
+        choice = areYouSure(
+            self,
+            "Unsaved changes",
+            "You have unsaved changes. Save before continuing?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
+            QMessageBox.StandardButton.Yes,
+            )
+        if choice == QMessageBox.StandardButton.Yes:
+            # rows that didn't save would be lost to the re-query - stay put so they can be fixed
+            return self.saveRow()
+        return choice == QMessageBox.StandardButton.No
+    # _okToRequery
+
+    @Slot(int, Qt.SortOrder)
+    def sortBy(self, column:int, order:Qt.SortOrder):
+        """Re-query the table sorted on column (a header click)."""
+        if column < 0 or (column, order) == self._sortIndicator:
+            return
+        if not self._okToRequery():
+            # put the indicator back
+            header = self.tableView.horizontalHeader()
+            header.blockSignals(True)
+            header.setSortIndicator(*self._sortIndicator)
+            header.blockSignals(False)
+            return
+        self._sortIndicator = (column, order)
+        self.lblIndexAdvice.hide()
+        self.model.sort(column, order)
+    # sortBy
+
+    @Slot(object)
+    def applyFilters(self, filters:Dict[int, str]):
+        """Re-query the table with the filter bar's filters."""
+        if filters == self._appliedFilters:
+            return
+        if not self._okToRequery():
+            return
+        self._appliedFilters = dict(filters)
+        self.filterBar.markInvalid(self.model.setColumnFilters(filters))
+    # applyFilters
+
+    @Slot(str)
+    def _showIndexAdvice(self, advice:str):
+        self.lblIndexAdvice.setText(advice)
+        self.lblIndexAdvice.show()
+
+    def saveRow(self) -> bool:
+        """Save all changes made to the table.  Returns True if every row was saved."""
+        failed = self.model.save_changes()
+        if failed:
+            # the other rows were saved; these stay dirty so they can be fixed and saved again
+            details = '\n'.join(f'row {row+1}: {getattr(err, "orig", err)}' for row, err in sorted(failed.items()))
+            QMessageBox.warning(self, self.tr('Some rows not saved'), f'{len(failed)} row(s) could not be saved:\n{details}')
+        return not failed
     # saveRow
 # endclass cSimpleTableForm
 
@@ -893,6 +1042,8 @@ class cSimpleRecordForm_Base(QWidget):
         _ssnmaker (sessionmaker[Session] | None): Database session factory.
         pages (List): List of page/tab names for multi-page forms.
         fieldDefs (Dict[str, Dict[str, Any]]): Field definitions for the form.
+        _loaderProfile (str | None): Loader profile used when reading the current record
+            (see cMenu.database.LOADER_PROFILES). None means the model's default loading.
     """
     _ORMmodel:Type[Any]|None = None
     _primary_key: Any
@@ -900,6 +1051,7 @@ class cSimpleRecordForm_Base(QWidget):
     _newrecFlag: QLabel
 
     _ssnmaker:sessionmaker[Session]|None = None
+    _loaderProfile: str|None = 'record'
 
     pages: List = []
     _tabindexTOtabname: dict[int, str] = {}
@@ -1534,20 +1686,36 @@ class cSimpleRecordForm_Base(QWidget):
     ########    Read
 
     # # --- Lookup navigation ---
-    def _load_record_by_id(self, pk_val):
-        """Low-level load (assumes it's safe to replace current record)."""
+    def _load_record_by_id(self, pk_val, profile: str|None = None):
+        """Low-level load (assumes it's safe to replace current record).
+        
+        Args:
+            pk_val: primary key of the record to load.
+            profile (str | None, optional): loader profile. Defaults to self._loaderProfile.
+        """
+        modl = self.ORMmodel()
+        assert modl is not None, "ORMmodel must be set before loading record"
+        profile = profile or self._loaderProfile
+
+        # identity_cache hands back its own copy, so the form is free to edit it
+        rec = identity_cache.get(modl, pk_val, profile)
+        if rec is not None:
+            self.setcurrRec(rec)
+            self.fillFormFromcurrRec()
+            return
+        # endif cached
+
         ssnmkr = self.ssnmaker()
         assert ssnmkr is not None, "Sessionmaker must be set before touching the database"
         with ssnmkr() as session:
-            modl = self.ORMmodel()
-            assert modl is not None, "ORMmodel must be set before loading record"
-            rec = session.get(modl, pk_val)
+            rec = session.get(modl, pk_val, options=loader_options(modl, profile))
             if rec is None:
                 self.showError(f"No Record with id {pk_val}")
                 return
             else:
                 # detach rec from session and make it the current record
                 session.expunge(rec)
+                identity_cache.put(rec, profile)
                 self.setcurrRec(rec)
                 self.fillFormFromcurrRec()
             # endif rec 
@@ -1584,13 +1752,14 @@ class cSimpleRecordForm_Base(QWidget):
         with ssnmkr() as session:
             modl = self.ORMmodel()
             assert modl is not None, "ORMmodel must be set before loading record"
-            rec = session.query(modl).filter(orm_field == value).first()
+            rec = session.query(modl).options(*loader_options(modl, self._loaderProfile)).filter(orm_field == value).first()
             if rec is None:
                 self.showError(f"No Record with {orm_field.key} == {value}")
                 return
             else:
                 # detach rec from session and make it the current record
                 session.expunge(rec)
+                identity_cache.put(rec, self._loaderProfile)
                 self.setcurrRec(rec)
                 self.fillFormFromcurrRec()
             # endif rec 
@@ -0,0 +1,43 @@
+from sysver import sysver_key
+
+# SQLite connection tuning, applied to every new connection by cMenu.dbengine.create_sqlite_engine
+# one profile per sysver key; dbconfig_key picks the one in use
+# cache_size < 0 is KiB (so -65536 = 64MB); mmap_size is bytes; busy_timeout is ms
+sqlite_pragmas = {
+    'DEV': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'foreign_keys': 'ON',
+        'temp_store': 'MEMORY',
+        'cache_size': -32768,
+        'mmap_size': 134217728,
+        'busy_timeout': 5000,
+    },
+    'PROD': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'foreign_keys': 'ON',
+        'temp_store': 'MEMORY',
+        'cache_size': -65536,
+        'mmap_size': 268435456,
+        'busy_timeout': 10000,
+    },
+    'DEMO': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'foreign_keys': 'ON',
+        'temp_store': 'MEMORY',
+        'cache_size': -16384,
+        'mmap_size': 67108864,
+        'busy_timeout': 5000,
+    },
+}
+
+# records held by the read-through identity cache (cMenu.database.identity_cache), per profile
+identity_cache_size = {
+    'DEV': 2000,
+    'PROD': 5000,
+    'DEMO': 1000,
+}
+
+dbconfig_key = sysver_key
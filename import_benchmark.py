@@ -0,0 +1,133 @@
+"""
+Spreadsheet import validation benchmark - run with  python import_benchmark.py [ROWS] [--keep FILE]
+
+Builds a synthetic pick-list sheet (default 200,000 rows: Excel-serial dates, whole numbers that come back
+as floats, codes, dollar amounts as text, and a sprinkling of bad cells), reads it once with openpyxl, then
+times UpldSprdsheet's two validation paths over the same rows:
+    - per cell:  _cleanRow, every value through cleanupfld's AllowedTypes
+    - columnar:  _cleanBatch, whole columns through SprdsheetColumnTypes, rejects through cleanupfld
+and checks both produce the same records and the same errors. Nothing is written to a database.
+"""
+from typing import (Any, List, Tuple, )
+import argparse
+import datetime
+from decimal import (Decimal, )
+import os
+import random
+import tempfile
+import time
+
+from openpyxl import (Workbook, load_workbook, )
+
+from cMenu.utils import (UpldSprdsheet, )
+
+_DFLT_ROWS = 200_000
+
+
+def _toDec(val) -> Decimal:
+    # per-cell equivalent of app.models.str_to_dec
+    return Decimal(str(val).replace("$", "").replace(",", "").strip())
+
+def _toInt(val) -> int:
+    if isinstance(val, float) and not val.is_integer():
+        raise ValueError('not a whole number')
+    return int(val)
+
+def _toStr(val) -> str:
+    if isinstance(val, float) and val.is_integer():
+        val = int(val)
+    return str(val).strip()
+
+
+class _BenchUpload(UpldSprdsheet):
+    """Validation only - no TargetModel, nothing written."""
+    SprdsheetFlds = {}
+
+    def __init__(self):
+        super().__init__()
+        C = self.SprdsheetFldDescriptor_creator
+        self.SprdsheetFlds = {
+            'pickDate': C('pickDate', [(datetime.datetime, self.sprdsheetDate), (float, self.sprdsheetDate),
+                                       (int, self.sprdsheetDate), (str, self.sprdsheetDate)], ColumnType='date'),
+            'wave': C('wave', [(int, _toInt), (float, _toInt), (str, _toInt)], ColumnType='int'),
+            'CIMSNum': C('CIMSNum', [(str, _toStr), (int, _toStr), (float, _toStr)], ColumnType='str'),
+            'GPN': C('GPN', [(str, _toStr), (int, _toStr), (float, _toStr)], ColumnType='str'),
+            'qty': C('qty', [(int, _toInt), (float, _toInt), (str, _toInt)], ColumnType='int'),
+            'cost': C('cost', [(str, _toDec), (int, _toDec), (float, _toDec)], ColumnType='decimal'),
+            'notes': C('notes', [(str, _toStr)], ColumnType='str'),
+        }
+# endclass _BenchUpload
+
+
+def build_sheet(flName:str, nrows:int, seed:int = 1):
+    """Write the synthetic sheet: about 1 row in 500 has a bad cell."""
+    rnd = random.Random(seed)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(['pickDate', 'wave', 'CIMSNum', 'GPN', 'qty', 'cost', 'notes'])
+    for n in range(nrows):
+        row: List[Any] = [
+            float(46000 + rnd.randrange(60)),               # date serial, as Excel hands back unformatted dates
+            float(rnd.randrange(1, 6)),
+            5000 + rnd.randrange(2000),                     # codes keyed in as numbers
+            f'GPN{rnd.randrange(5000):05d}',
+            float(rnd.randrange(0, 400)),
+            f'${rnd.randrange(100000)/100:,.2f}',
+            rnd.choice(['', 'rush', None, 'split']),
+        ]
+        if n % 500 == 7:
+            row[rnd.randrange(len(row) - 1)] = rnd.choice(['n/a', 2.5, 'tbd'])
+        ws.append(row)
+    wb.save(flName)
+
+def read_rows(flName:str) -> Tuple[Tuple[Any, ...], List[Tuple[int, Tuple[Any, ...]]]]:
+    wb = load_workbook(flName, read_only=True, data_only=True)
+    rows = wb.active.iter_rows(values_only=True)    # type: ignore
+    header = next(rows)
+    data = [(rownum, row) for rownum, row in enumerate(rows, start=2)]
+    wb.close()
+    return header, data
+
+def run(nrows:int, keep:str|None = None):
+    flName = keep or os.path.join(tempfile.mkdtemp(), 'import_benchmark.xlsx')
+    t = time.perf_counter()
+    build_sheet(flName, nrows)
+    print(f'built {nrows} rows in {time.perf_counter()-t:.1f}s')
+    t = time.perf_counter()
+    header, data = read_rows(flName)
+    print(f'read (openpyxl read_only) {time.perf_counter()-t:.1f}s')
+
+    up = _BenchUpload()
+    colmap = [(colnum, str(name)) for colnum, name in enumerate(header)]
+
+    t = time.perf_counter()
+    percell, percell_errs = [], []
+    for rownum, row in data:
+        try:
+            percell.append((rownum, up._cleanRow(row, colmap, {})))
+        except ValueError as e:
+            percell_errs.append((rownum, str(e)))
+    t_percell = time.perf_counter() - t
+
+    t = time.perf_counter()
+    columnar, columnar_errs = [], []
+    for start in range(0, len(data), up.BatchSize):
+        columnar.extend(up._cleanBatch(data[start:start+up.BatchSize], colmap, {}, columnar_errs))
+    t_columnar = time.perf_counter() - t
+
+    print(f'per cell  {t_percell:7.2f}s  {nrows/t_percell:10,.0f} rows/s  {len(percell_errs)} rejected')
+    print(f'columnar  {t_columnar:7.2f}s  {nrows/t_columnar:10,.0f} rows/s  {len(columnar_errs)} rejected')
+    print(f'speedup   {t_percell/t_columnar:.1f}x')
+    same = percell == columnar and [r for r, _ in percell_errs] == [r for r, _ in columnar_errs]
+    print('results match' if same else 'RESULTS DIFFER')
+    if not keep:
+        os.remove(flName)
+    return same
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description='Time per-cell vs columnar spreadsheet import validation')
+    argparser.add_argument('rows', nargs='?', type=int, default=_DFLT_ROWS)
+    argparser.add_argument('--keep', default=None, metavar='FILE', help='write the synthetic sheet here and keep it')
+    cmdargs = argparser.parse_args()
+    raise SystemExit(0 if run(cmdargs.rows, cmdargs.keep) else 1)
@@ -1,7 +1,6 @@
 
-# import testforms
-from app import forms
-from app import forms_testing
+# views are given as 'module:attr' import paths and imported on first use (see cMenu.menucommand_handlers.resolveFormView),
+# so nothing here pulls in app.forms / app.models at startup
 # import incShip.load_init_data.load_HBL as load_HBL
 # import incShip.load_init_data.load_Invoices as load_Invoices 
 
@@ -23,14 +22,20 @@ FormNameToURL_Map = {}
 
 # FormNameToURL_Map['django-admin'.lower()] = (None, LoadAdmin)
 
-FormNameToURL_Map['WOTbl'.lower()] = (None, forms.WOTable)
-FormNameToURL_Map['ProjTbl'.lower()] = (None, forms.ProjectsTable)
-FormNameToURL_Map['PartsTbl'.lower()] = (None, forms.PartsTable)
+FormNameToURL_Map['WOTbl'.lower()] = (None, 'app.forms:WOTable')
+FormNameToURL_Map['ProjTbl'.lower()] = (None, 'app.forms:ProjectsTable')
+FormNameToURL_Map['PartsTbl'.lower()] = (None, 'app.forms:PartsTable')
 
-FormNameToURL_Map['WOPartsNeeded'.lower()] = (None, forms.WOPartsNeededForm)
+FormNameToURL_Map['WOPartsNeeded'.lower()] = (None, 'app.forms:WOPartsNeededForm')
 
-FormNameToURL_Map['PickList'.lower()] = (None, forms_testing.PickListReport)
+FormNameToURL_Map['PickList'.lower()] = (None, 'app.forms_testing:PickListReport')
 
-FormNameToURL_Map['WORecord'.lower()] = (None, forms.WorkOrdersRecord)
-FormNameToURL_Map['WORecord_MP'.lower()] = (None, forms.WorkOrdersRecord_multipage)
+FormNameToURL_Map['WORecord'.lower()] = (None, 'app.forms:WorkOrdersRecord')
+FormNameToURL_Map['WORecord_MP'.lower()] = (None, 'app.forms:WorkOrdersRecord_multipage')
 
+# forms imported in the background once the menu is up (cMenu.menucommand_handlers.prewarmForms)
+FormPrewarmList = [
+    'WORecord'.lower(),
+    'WOPartsNeeded'.lower(),
+    'PickList'.lower(),
+]
@@ -0,0 +1,331 @@
+"""
+Startup profiler - run with  python Main.py --profile-startup [REPORT_BASENAME] [--startup-budget MS]
+
+Records wall time, from the moment it's installed until the main screen first paints, for
+    - each module import (inclusive and self time)
+    - each MetaData.create_all
+    - each db statement
+    - each construction of a QWidget subclass defined in this project
+then writes REPORT_BASENAME.txt (human-readable) and REPORT_BASENAME.json (every record, for CI/diffing).
+If a budget is given and time-to-first-paint exceeds it, Main exits with STARTUP_BUDGET_EXCEEDED.
+"""
+from typing import (Any, Dict, List, )
+from collections import (defaultdict, )
+from functools import (wraps, )
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+
+_PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+STARTUP_BUDGET_EXCEEDED = 3     # Main's exit code when over budget
+_TOPN = 20                      # rows per section in the text report
+
+
+class _TimedLoader:
+    """Wraps a module's loader so exec_module is timed; everything else goes to the real loader."""
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # the rest of the world should only ever see the real loader
+        spec = module.__spec__
+        if spec is not None:
+            spec.loader = self._loader
+        module.__loader__ = self._loader
+
+        rec = self._profiler._begin('import', module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._end(rec)
+        self._profiler._wrap_widgets(module)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+# endclass _TimedLoader
+
+class _TimedImportFinder(importlib.abc.MetaPathFinder):
+    """First on sys.meta_path: finds specs with the other finders, then swaps in a _TimedLoader."""
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+# endclass _TimedImportFinder
+
+
+class StartupProfiler:
+    """
+    Collects timing records from install() until uninstall().
+
+    Each record is {'kind', 'name', 'start_ms', 'ms', 'self_ms', 'depth'}:
+    start_ms is relative to install(); self_ms excludes nested records (an import inside an import, etc).
+    Records made off the main thread (e.g. prewarmForms) aren't nested; they carry the thread's name instead.
+    """
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self._main_thread = threading.get_ident()
+        self.records: List[Dict[str, Any]] = []
+        self.marks: Dict[str, float] = {}
+        self._stack: List[Dict[str, Any]] = []
+        self._finder: _TimedImportFinder|None = None
+        self._installed = False
+        self._wrapped: set = set()
+        self._listeners: List[tuple] = []
+
+    ##########################################
+    ########    recording
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000.0
+
+    def _begin(self, kind: str, name: str, **extra) -> Dict[str, Any]:
+        rec = {'kind': kind, 'name': name, 'start_ms': self._now_ms(), 'ms': 0.0, 'self_ms': 0.0,
+               'depth': len(self._stack), '_child_ms': 0.0}
+        rec.update(extra)
+        if threading.get_ident() != self._main_thread:
+            rec['thread'] = threading.current_thread().name
+            rec['depth'] = 0
+        else:
+            self._stack.append(rec)
+        return rec
+
+    def _end(self, rec: Dict[str, Any]) -> None:
+        rec['ms'] = self._now_ms() - rec['start_ms']
+        rec['self_ms'] = rec['ms'] - rec.pop('_child_ms')
+        if 'thread' in rec:
+            self.records.append(rec)
+            return
+        # tolerate out-of-order ends (e.g. an exception unwinding several levels)
+        while self._stack:
+            top = self._stack.pop()
+            if top is rec:
+                break
+        if self._stack:
+            self._stack[-1]['_child_ms'] += rec['ms']
+        self.records.append(rec)
+
+    def mark(self, name: str) -> None:
+        """Note a point in time (e.g. 'qapplication', 'first_paint')."""
+        self.marks[name] = self._now_ms()
+
+    ##########################################
+    ########    hooks
+
+    def install(self) -> "StartupProfiler":
+        if self._installed:
+            return self
+        self._finder = _TimedImportFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+        from sqlalchemy.schema import MetaData
+
+        # create_all (fires for every MetaData, whether or not any table is actually created)
+        def _before_create(target, connection, **kw):
+            connection.info.setdefault('startup_profiler_ddl', []).append(
+                self._begin('create_all', ', '.join(sorted(target.tables)) or '(no tables)', db=str(connection.engine.url)))
+        def _after_create(target, connection, **kw):
+            stk = connection.info.get('startup_profiler_ddl')
+            if stk:
+                self._end(stk.pop())
+        self._listeners.append((MetaData, 'before_create', _before_create))
+        self._listeners.append((MetaData, 'after_create', _after_create))
+
+        # every statement on every engine
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault('startup_profiler_stack', []).append(
+                self._begin('query', ' '.join(statement.split())[:200], db=str(conn.engine.url)))
+        def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            stk = conn.info.get('startup_profiler_stack')
+            if stk:
+                self._end(stk.pop())
+        self._listeners.append((Engine, 'before_cursor_execute', _before_cursor_execute))
+        self._listeners.append((Engine, 'after_cursor_execute', _after_cursor_execute))
+
+        for target, ident, fn in self._listeners:
+            event.listen(target, ident, fn)
+
+        self._installed = True
+        return self
+    # install
+
+    def _wrap_widgets(self, module) -> None:
+        """Time __init__ of the QWidget subclasses this project module defines (nested classes included)."""
+        modfile = getattr(module, '__file__', None) or ''
+        if not os.path.abspath(modfile).startswith(_PROJECT_ROOT):
+            return
+        QWidget = getattr(sys.modules.get('PySide6.QtWidgets'), 'QWidget', None)
+        if QWidget is None:
+            return
+
+        seen = set()
+        def _classes(ns):
+            for obj in list(ns.values()):
+                if isinstance(obj, type) and obj.__module__ == module.__name__ and obj not in seen:
+                    seen.add(obj)
+                    yield obj
+                    yield from _classes(vars(obj))
+
+        for cls in _classes(vars(module)):
+            if cls in self._wrapped or not issubclass(cls, QWidget) or '__init__' not in cls.__dict__:
+                continue
+            self._wrapped.add(cls)
+            orig_init = cls.__dict__['__init__']
+            qualname = f'{cls.__module__}.{cls.__qualname__}'
+
+            def _make(orig_init, qualname):
+                @wraps(orig_init)
+                def __init__(this, *args, **kwargs):
+                    rec = self._begin('widget', qualname)
+                    try:
+                        orig_init(this, *args, **kwargs)
+                    finally:
+                        self._end(rec)
+                return __init__
+            # _make
+            cls.__init__ = _make(orig_init, qualname)
+        # endfor cls
+    # _wrap_widgets
+
+    def uninstall(self) -> None:
+        if not self._installed:
+            return
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+        from sqlalchemy import event
+        for target, ident, fn in self._listeners:
+            event.remove(target, ident, fn)
+        self._listeners.clear()
+        self._installed = False
+    # uninstall
+
+    ##########################################
+    ########    report
+
+    def summary(self, budget_ms: float|None = None) -> Dict[str, Any]:
+        bykind: Dict[str, Dict[str, float]] = defaultdict(lambda: {'count': 0, 'ms': 0.0})
+        for rec in self.records:
+            bykind[rec['kind']]['count'] += 1
+            bykind[rec['kind']]['ms'] += rec['self_ms']
+        total_ms = self.marks.get('first_paint', self._now_ms())
+        return {
+            'first_paint_ms': self.marks.get('first_paint'),
+            'total_ms': total_ms,
+            'budget_ms': budget_ms,
+            'over_budget': (budget_ms is not None and total_ms > budget_ms),
+            'marks': dict(self.marks),
+            'by_kind': {k: dict(v) for k, v in bykind.items()},
+        }
+
+    def text_report(self, budget_ms: float|None = None) -> str:
+        smry = self.summary(budget_ms)
+        lines = []
+        fp = smry['first_paint_ms']
+        lines.append('STARTUP PROFILE')
+        lines.append(f"time to first paint: {fp:.1f} ms" if fp is not None else
+                     f"no paint seen; stopped at {smry['total_ms']:.1f} ms")
+        if budget_ms is not None:
+            lines.append(f"budget: {budget_ms:.0f} ms - {'OVER BUDGET' if smry['over_budget'] else 'ok'}")
+        lines.append('')
+        lines.append('marks:')
+        for name, ms in sorted(smry['marks'].items(), key=lambda m: m[1]):
+            lines.append(f'  {ms:9.1f} ms  {name}')
+        lines.append('')
+        lines.append('self time by kind:')
+        for kind, agg in sorted(smry['by_kind'].items(), key=lambda k: -k[1]['ms']):
+            lines.append(f"  {agg['ms']:9.1f} ms  {kind} ({agg['count']})")
+
+        for kind, title, key in (
+                ('import', 'slowest imports (self time; inclusive in brackets)', 'self_ms'),
+                ('create_all', 'create_all', 'ms'),
+                ('query', 'slowest db statements', 'ms'),
+                ('widget', 'slowest widget classes (total self time; inclusive in brackets)', 'self_ms'),
+                ):
+            recs = [r for r in self.records if r['kind'] == kind]
+            if kind == 'widget':
+                # many instances of the same class - one line per class
+                agg: Dict[str, Dict[str, Any]] = {}
+                for r in recs:
+                    a = agg.setdefault(r['name'], {'name': r['name'], 'ms': 0.0, 'self_ms': 0.0, 'count': 0})
+                    a['ms'] += r['ms']
+                    a['self_ms'] += r['self_ms']
+                    a['count'] += 1
+                recs = list(agg.values())
+            recs.sort(key=lambda r: -r[key])
+            if not recs:
+                continue
+            lines.append('')
+            lines.append(f'{title}:')
+            for rec in recs[:_TOPN]:
+                count = f" (x{rec['count']})" if rec.get('count', 1) > 1 else ''
+                lines.append(f"  {rec[key]:9.1f} ms  [{rec['ms']:9.1f}]  {rec['name']}{count}")
+            if len(recs) > _TOPN:
+                lines.append(f'  ... {len(recs) - _TOPN} more in the json report')
+        # endfor kind
+        return '\n'.join(lines) + '\n'
+
+    def write_report(self, basename: str, budget_ms: float|None = None) -> Dict[str, Any]:
+        """Write basename.txt and basename.json; return the summary."""
+        smry = self.summary(budget_ms)
+        with open(f'{basename}.txt', 'w') as f:
+            f.write(self.text_report(budget_ms))
+        with open(f'{basename}.json', 'w') as f:
+            json.dump({'summary': smry, 'records': sorted(self.records, key=lambda r: r['start_ms'])}, f, indent=1)
+        return smry
+
+    ##########################################
+    ########    first paint
+
+    def watch_first_paint(self, widget, on_done, timeout_ms: int = 30000) -> None:
+        """
+        Mark 'first_paint' when widget first paints, then call on_done() from the event loop.
+        If nothing paints within timeout_ms (e.g. a headless run), on_done() is called anyway.
+        """
+        from PySide6.QtCore import (QObject, QEvent, QTimer, )
+
+        profiler = self
+        done = []
+
+        def _finish():
+            if done:
+                return
+            done.append(True)
+            on_done()
+
+        class _PaintWatcher(QObject):
+            def eventFilter(self, obj, evnt):
+                if evnt.type() == QEvent.Type.Paint and 'first_paint' not in profiler.marks:
+                    profiler.mark('first_paint')
+                    QTimer.singleShot(0, _finish)
+                return False
+        # endclass _PaintWatcher
+
+        self._paintwatcher = _PaintWatcher(widget)
+        widget.installEventFilter(self._paintwatcher)
+        QTimer.singleShot(timeout_ms, _finish)
+    # watch_first_paint
+# endclass StartupProfiler
@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+# the modules import each other from the repo root (dbconfig, cMenu, app), as Main.py runs them
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import Integer, String, UniqueConstraint, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+
+from cMenu.dbengine import create_sqlite_engine
+from cMenu.database import Repository
+
+
+class _Base(DeclarativeBase):
+    pass
+
+class _Part(_Base):
+    # unique=True and a UniqueConstraint on the same column - one key
+    __tablename__ = 'Parts'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    GPN: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
+    notes: Mapped[str] = mapped_column(String(20), default='', nullable=False)
+    __table_args__ = (UniqueConstraint('GPN'), )
+
+class _Tag(_Base):
+    # two different keys
+    __tablename__ = 'Tags'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    TagID: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
+    Serial: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
+    notes: Mapped[str] = mapped_column(String(20), default='', nullable=False)
+
+
+@pytest.fixture
+def factory(tmp_path):
+    engine = create_sqlite_engine(str(tmp_path / 'upsert.sqlite'))
+    _Base.metadata.create_all(engine)
+    return sessionmaker(engine, expire_on_commit=False)
+
+def test_one_unique_key_is_the_default_target(factory):
+    repo = Repository(factory, _Part)
+    ids = repo.add_many([{'GPN': 'A'}, {'GPN': 'B', 'notes': 'x'}])
+    assert len(ids) == 2
+    repo.add_many([{'GPN': 'A', 'notes': 'new'}], on_conflict='update')
+    with factory() as session:
+        assert dict(session.execute(select(_Part.GPN, _Part.notes)).all()) == {'A': 'new', 'B': 'x'}
+
+def test_several_unique_keys_need_conflict_cols(factory):
+    repo = Repository(factory, _Tag)
+    repo.add_many([{'TagID': 'T1', 'Serial': 'S1'}])       # a plain insert has no conflict target
+    with pytest.raises(ValueError, match='conflict_cols'):
+        repo.add_many([{'TagID': 'T1', 'Serial': 'S1', 'notes': 'n'}], on_conflict='update')
+    repo.add_many([{'TagID': 'T1', 'Serial': 'S1', 'notes': 'n'}], on_conflict='update', conflict_cols=['TagID'])
+    with factory() as session:
+        assert session.scalars(select(_Tag.notes)).all() == ['n']
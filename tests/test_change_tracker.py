@@ -0,0 +1,90 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import Integer, String, update
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+
+from cMenu.dbengine import create_sqlite_engine
+from cMenu.database import (Repository, change_tracker, identity_cache, )
+
+
+class _Base(DeclarativeBase):
+    pass
+
+class _Item(_Base):
+    __tablename__ = 'Items'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(20), nullable=False)
+
+class _Summary(_Base):
+    # stands in for a trigger-maintained table
+    __tablename__ = 'ItemSummary'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+change_tracker.register_derived_table(_Summary.__table__, [_Item.__table__])
+
+_seen: dict[str, list] = {'flush': [], 'commit': []}
+change_tracker.subscribe(lambda ch: _seen['flush'].append(ch), at_flush=True)
+change_tracker.subscribe(lambda ch: _seen['commit'].append(ch))
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / 'tracked.sqlite')
+    engine = create_sqlite_engine(path)
+    _Base.metadata.create_all(engine)
+    for v in _seen.values():
+        v.clear()
+    return path, engine, sessionmaker(engine, expire_on_commit=False)
+
+def _ours(changes):
+    return [ch for ch in changes if _Item.__table__ in ch.tables]
+
+def test_commit_reports_rows_and_derived_tables(db):
+    _, _, factory = db
+    with factory() as session:
+        a, b = _Item(name='a'), _Item(name='b')
+        session.add_all([a, b])
+        session.flush()
+        assert _ours(_seen['flush'])[-1].rows == {_Item.__table__: {a.id, b.id}}
+        assert not _ours(_seen['commit'])
+        b.name = 'bb'
+        session.commit()
+    (changes, ) = _ours(_seen['commit'])
+    assert changes.rows == {_Item.__table__: {a.id, b.id}}
+    assert changes.bulk == {_Summary.__table__}
+
+def test_bulk_dml_and_rollback(db):
+    _, _, factory = db
+    with factory() as session:
+        session.add(_Item(name='a'))
+        session.commit()
+    _seen['commit'].clear()
+    with factory() as session:
+        session.execute(update(_Item).values(name='z'))
+        session.rollback()
+    assert not _ours(_seen['commit'])
+    with factory() as session:
+        session.execute(update(_Item).values(name='z'))
+        session.commit()
+    (changes, ) = _ours(_seen['commit'])
+    assert changes.bulk == {_Item.__table__, _Summary.__table__}
+
+def test_tables_written_outside_a_session(db):
+    change_tracker.tables_written({_Item.__table__})
+    assert _ours(_seen['commit'])[-1].bulk == {_Item.__table__, _Summary.__table__}
+
+def test_identity_cache_drops_records_another_connection_wrote(db):
+    path, engine, factory = db
+    identity_cache.watch(engine, _Base.metadata)
+    repo = Repository(factory, _Item)
+    item = repo.add(_Item(name='old'))
+    assert repo.get_by_id(item.id).name == 'old'
+    assert identity_cache.get(_Item, item.id) is not None     # cached
+    # another process (or a raw connection) writes the file
+    other = sqlite3.connect(path)
+    other.execute('UPDATE Items SET name = ?', ('new', ))
+    other.commit()
+    other.close()
+    assert identity_cache.get(_Item, item.id) is None
+    assert repo.get_by_id(item.id).name == 'new'
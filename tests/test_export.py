@@ -0,0 +1,30 @@
+from openpyxl import load_workbook
+from PySide6.QtCore import QCoreApplication, QDeadlineTimer, QThreadPool
+
+from cMenu.utils.Excel import (RowExporter, write_rows, )
+
+
+def _wait(exporter, qapp, secs:float = 10):
+    deadline = QDeadlineTimer(int(secs * 1000))
+    while exporter.isRunning() and not deadline.hasExpired():
+        QThreadPool.globalInstance().waitForDone(50)
+        QCoreApplication.processEvents()
+
+def test_control_characters_dropped_from_xlsx(tmp_path):
+    flName = str(tmp_path / 'out.xlsx')
+    assert write_rows(flName, ['a', 'b'], [['bad\x01cell', b'\x02bytes'], ['ok', 1]]) == 2
+    ws = load_workbook(flName, read_only=True).active
+    rows = list(ws.iter_rows(values_only=True))
+    assert rows[1][0] == 'badcell'
+    assert rows[2] == ('ok', 1)
+
+def test_failed_export_still_finishes(qapp, tmp_path):
+    def job(**kw):
+        raise RuntimeError('boom')
+    exporter = RowExporter(str(tmp_path / 'out.xlsx'), job)
+    results = []
+    exporter.finished.connect(lambda n, msg: results.append((n, msg)))
+    exporter.start()
+    _wait(exporter, qapp)
+    assert not exporter.isRunning()
+    assert results == [(0, 'boom')]
@@ -0,0 +1,32 @@
+import pytest
+
+import cMenu.dbmenulist     # cMenu.menucommand_handlers has to be reached through it, as the app does (circular imports)
+from cMenu import menucommand_handlers
+
+
+class _BrokenForm:
+    def __init__(self):
+        raise AttributeError('bug in the form')
+
+
+@pytest.fixture
+def shown(qapp, monkeypatch):
+    dialogs = []
+    class _Dialog:
+        def __init__(self, parent, msg):
+            dialogs.append(msg)
+        def show(self):
+            pass
+    monkeypatch.setattr(menucommand_handlers, 'UnderConstruction_Dialog', _Dialog)
+    return dialogs
+
+def test_a_view_that_does_not_resolve_is_not_built_yet(shown, monkeypatch):
+    monkeypatch.setitem(menucommand_handlers.FormNameToURL_Map, 'nosuchform', (None, 'no_such_module:View'))
+    assert menucommand_handlers.FormBrowse(None, 'nosuchform') is None
+    assert len(shown) == 1 and 'nosuchform exists but view' in shown[0]
+
+def test_an_error_in_the_form_propagates(shown, monkeypatch):
+    monkeypatch.setitem(menucommand_handlers.FormNameToURL_Map, 'brokenform', (None, _BrokenForm))
+    with pytest.raises(AttributeError, match='bug in the form'):
+        menucommand_handlers.FormBrowse(None, 'brokenform')
+    assert not shown
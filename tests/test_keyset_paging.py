@@ -0,0 +1,69 @@
+import random
+
+import pytest
+from sqlalchemy import Integer, String, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+
+from cMenu.dbengine import create_sqlite_engine
+from cMenu.database import Repository
+
+
+class _Base(DeclarativeBase):
+    pass
+
+class _Row(_Base):
+    __tablename__ = 'Rows'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    qty: Mapped[int|None] = mapped_column(Integer, nullable=True)
+    code: Mapped[str] = mapped_column(String(10), nullable=False)
+
+_NROWS = 1000
+
+
+@pytest.fixture(scope='module')
+def session_factory(tmp_path_factory):
+    engine = create_sqlite_engine(str(tmp_path_factory.mktemp('db') / 'paging.sqlite'))
+    _Base.metadata.create_all(engine)
+    rnd = random.Random(7)
+    factory = sessionmaker(engine, expire_on_commit=False)
+    with factory() as session:
+        # a third NULL, lots of ties among the rest
+        session.add_all([_Row(qty=None if rnd.random() < .33 else rnd.randrange(20), code=f'C{rnd.randrange(50):02d}')
+                         for _ in range(_NROWS)])
+        session.commit()
+    return factory
+
+def _expected(session_factory, order):
+    with session_factory() as session:
+        return list(session.scalars(select(_Row.id).order_by(*order)))
+
+
+@pytest.mark.parametrize('order_by', [_Row.qty, 'qty', _Row.qty.desc(), _Row.code, _Row.code.desc()])
+@pytest.mark.parametrize('page_size', [1, 37, 500])
+def test_iter_all_every_row_in_order(session_factory, order_by, page_size):
+    repo = Repository(session_factory, _Row)
+    got = [r.id for r in repo.iter_all(order_by=order_by, page_size=page_size)]
+    assert got == _expected(session_factory, repo.keyset_order(order_by))
+    assert len(got) == _NROWS
+
+@pytest.mark.parametrize('order_by', [_Row.id, 'id', _Row.id.desc()])
+def test_pk_attribute_pages_on_pk(session_factory, order_by):
+    repo = Repository(session_factory, _Row)
+    sortcol, pk, descending = repo._keyset(order_by)
+    assert sortcol is pk
+    got = [r.id for r in repo.iter_all(order_by=order_by, page_size=37)]
+    assert got == sorted(range(1, _NROWS + 1), reverse=descending)
+
+@pytest.mark.parametrize('descending', [False, True])
+@pytest.mark.parametrize('count_rows', [False, True])
+def test_table_model_sorted_on_nullable_column(qapp, session_factory, descending, count_rows):
+    from cMenu.utils.cQModels import SQLAlchemyTableModel
+    order_by = _Row.qty.desc() if descending else _Row.qty
+    model = SQLAlchemyTableModel(_Row, session_factory, orderby=order_by, page_size=50, max_pages=3, count_rows=count_rows)
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == _NROWS
+    idcol = model.header.index('id')
+    got = [model.data(model.index(row, idcol)) for row in range(model.rowCount())]
+    want = _expected(session_factory, Repository(session_factory, _Row).keyset_order(order_by))
+    assert [int(v) for v in got] == want
@@ -0,0 +1,50 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from cMenu.dbengine import create_sqlite_engine
+from cMenu.database import (Repository, identity_cache, )
+from app.models import (Parts, PartDemandTotals, Projects, Scans, WorkOrderPartsNeeded, WorkOrders,
+                        create_app_schema, rebuild_part_demand_totals, )
+from app.picklist import (picklist_text, )
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # only the change tracker may drop cached records here - not the watch on the app's own file
+    monkeypatch.setattr(identity_cache, '_watches', [])
+    engine = create_sqlite_engine(str(tmp_path / 'app.sqlite'))
+    create_app_schema(engine)
+    factory = sessionmaker(engine, expire_on_commit=False)
+    with factory() as session:
+        part = Parts(GPN='GPN-1')
+        wo = WorkOrders(CIMSNum='C1', WOMAid='WO1', project=Projects(ProjectName='P', Color='red'))
+        session.add_all([
+            WorkOrderPartsNeeded(workorder=wo, part=part, targetQty=10),
+            Scans(pickDate=date(2026, 1, 5), wave=1, TagID='T1', part=part, workorder=wo, qty=4),
+            ])
+        session.commit()
+        part_id = part.id
+    identity_cache.clear()
+    return engine, factory, part_id
+
+def test_totals_follow_the_source_tables(db):
+    _, factory, part_id = db
+    with factory() as session:
+        totals = session.get(PartDemandTotals, part_id)
+        assert (totals.demand, totals.picked, totals.remaining) == (10, 4, 6)
+
+def test_rebuild_drops_cached_totals(db):
+    engine, factory, part_id = db
+    repo = Repository(factory, PartDemandTotals)
+    with engine.begin() as conn:
+        conn.execute(text('UPDATE "PartDemandTotals" SET demand = 999'))
+    assert repo.get_by_id(part_id).demand == 999
+    rebuild_part_demand_totals(engine)
+    assert repo.get_by_id(part_id).demand == 10
+
+def test_picklist_shows_picked_and_remaining(db):
+    _, factory, _ = db
+    assert 'Σ = 10,  picked 4,  remaining 6' in picklist_text(session_factory=factory)
@@ -0,0 +1,36 @@
+import os
+
+from sqlalchemy import inspect
+
+from cMenu.dbengine import create_sqlite_engine
+import cMenu.dbmenulist     # cMenu.models has to be reached through it, as the app does (circular imports)
+from cMenu.models import (bootstrap_schema, getSchemaVersion, )
+
+
+def test_version_is_kept_in_the_database_it_describes(tmp_path):
+    path = str(tmp_path / 'app.sqlite')
+    other = create_sqlite_engine(str(tmp_path / 'menu.sqlite'))
+    runs = []
+
+    def bootstrap():
+        engine = create_sqlite_engine(path)
+        def create():
+            runs.append(1)
+            with engine.begin() as conn:
+                conn.exec_driver_sql('CREATE TABLE IF NOT EXISTS t (id INTEGER PRIMARY KEY)')
+        ran = bootstrap_schema('app', 2, create, engine)
+        return engine, ran
+
+    engine, ran = bootstrap()
+    assert ran and getSchemaVersion(engine) == 2
+    assert getSchemaVersion(other) == 0
+    assert not bootstrap()[1]
+
+    # the database is replaced - the version goes with it, so the tables are created again
+    engine.dispose()
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    engine, ran = bootstrap()
+    assert ran and 't' in inspect(engine).get_table_names()
+    assert len(runs) == 2
@@ -0,0 +1,94 @@
+import datetime
+
+import pytest
+from openpyxl import Workbook
+from sqlalchemy import Date, Integer, String, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+
+from cMenu.dbengine import create_sqlite_engine
+from cMenu.utils import (UpldSprdsheet, )
+
+
+class _Base(DeclarativeBase):
+    pass
+
+class _Pick(_Base):
+    __tablename__ = 'Picks'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    code: Mapped[str] = mapped_column(String(20), nullable=False)
+    qty: Mapped[int] = mapped_column(Integer, nullable=False)
+    pickDate: Mapped[datetime.date|None] = mapped_column(Date, nullable=True)
+
+
+def _toInt(val) -> int:
+    if isinstance(val, float) and not val.is_integer():
+        raise ValueError('not a whole number')
+    return int(val)
+
+class _PickUpload(UpldSprdsheet):
+    TargetModel = _Pick
+    OnConflict = None
+    SprdsheetFlds = {}
+
+    def __init__(self):
+        super().__init__()
+        C = self.SprdsheetFldDescriptor_creator
+        self.SprdsheetFlds = {
+            'code': C('code', [(str, str.strip)], ColumnType='str'),
+            'qty': C('qty', [(int, _toInt), (float, _toInt), (str, _toInt)], ColumnType='int'),
+            'pickDate': C('pickDate', [(float, self.sprdsheetDate), (int, self.sprdsheetDate), (str, self.sprdsheetDate),
+                                       (datetime.datetime, self.sprdsheetDate)], ColumnType='date'),
+        }
+# endclass _PickUpload
+
+_HEADER = ('code', 'qty', 'pickDate')
+# (row, bad?) - the bad cells are ones the columnar converters used to raise on
+_ROWS = [
+    (('A', 3, 46000.0), False),
+    (('B', '--5', 46001.0), True),
+    (('C', '²', 46002.0), True),
+    (('D', 4, 1e12), True),             # date serial out of range
+    (('E', float('inf'), 46003.0), True),
+    (('F', ' 7 ', '2026-01-05'), False),
+    (('G', 2.5, 46004.0), True),
+    (('H', 'n/a', 46005.0), True),
+]
+
+
+@pytest.fixture
+def uploader():
+    return _PickUpload()
+
+def test_bad_cells_rejected_the_same_by_both_paths(uploader):
+    colmap = list(enumerate(_HEADER))
+    batch = [(rownum, row) for rownum, (row, _) in enumerate(_ROWS, start=2)]
+    percell, percell_errs = [], []
+    for rownum, row in batch:
+        try:
+            percell.append((rownum, uploader._cleanRow(row, colmap, {})))
+        except ValueError:
+            percell_errs.append(rownum)
+    columnar_errs = []
+    columnar = uploader._cleanBatch(batch, colmap, {}, columnar_errs)
+    assert columnar == percell
+    assert sorted(r for r, _ in columnar_errs) == percell_errs == [r for r, (_, bad) in enumerate(_ROWS, start=2) if bad]
+
+@pytest.mark.parametrize('columnar', [True, False])
+def test_bad_cells_do_not_abort_the_import(uploader, tmp_path, columnar):
+    engine = create_sqlite_engine(str(tmp_path / 'import.sqlite'))
+    _Base.metadata.create_all(engine)
+    uploader.SessionFactory = sessionmaker(engine)
+    uploader.Columnar = columnar
+    wb = Workbook()
+    wb.active.append(_HEADER)
+    for row, _ in _ROWS:
+        wb.active.append(row)
+    wb.save(tmp_path / 'picks.xlsx')
+
+    report = uploader.process_spreadsheet(str(tmp_path / 'picks.xlsx'))
+    good = [row[0] for row, bad in _ROWS if not bad]
+    assert report.rows_read == len(_ROWS)
+    assert report.rows_written == len(good)
+    assert len(report.errors) == len(_ROWS) - len(good)
+    with uploader.SessionFactory() as session:
+        assert list(session.scalars(select(_Pick.code).order_by(_Pick.code))) == good
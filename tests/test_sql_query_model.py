@@ -0,0 +1,67 @@
+import pytest
+from PySide6.QtCore import QCoreApplication, QDeadlineTimer, QThreadPool
+from sqlalchemy import text
+
+from cMenu.dbengine import create_sqlite_engine
+from cMenu.utils.cQModels import (SQLAlchemySQLQueryModel, _SQLQueryRunner, )
+
+_NROWS = 250
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_sqlite_engine(str(tmp_path / 'query.sqlite'))
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)'))
+        conn.execute(text('INSERT INTO t (v) VALUES (:v)'), [{'v': f'v{i}'} for i in range(_NROWS)])
+    return engine
+
+def _waitFor(cond, secs:float = 10):
+    deadline = QDeadlineTimer(int(secs * 1000))
+    while not cond() and not deadline.hasExpired():
+        QThreadPool.globalInstance().waitForDone(20)
+        QCoreApplication.processEvents()
+    return cond()
+
+def test_unexpected_error_still_finishes(qapp, engine, monkeypatch):
+    def boom(self, result):
+        raise RuntimeError('cannot convert')
+    monkeypatch.setattr(_SQLQueryRunner, '_fetchRows', boom)
+    model = SQLAlchemySQLQueryModel('SELECT * FROM t', engine, asynchronous=True)
+    messages = []
+    model.finished.connect(messages.append)
+    assert _waitFor(lambda: not model.isRunning())
+    assert messages == ['cannot convert']
+    assert model.lastError() == 'cannot convert'
+
+def test_paused_preview_holds_no_read_transaction(qapp, engine):
+    model = SQLAlchemySQLQueryModel('SELECT id FROM t ORDER BY id', engine, asynchronous=True, chunk_size=40, preview_limit=100)
+    assert _waitFor(lambda: model.isRunning() and not model.isFetching())
+    assert model.rowCount() == 100
+    # another client writes and checkpoints - a reader still in its snapshot would make the checkpoint busy
+    with engine.begin() as conn:
+        conn.execute(text('INSERT INTO t (v) VALUES (:v)'), [{'v': 'new'}] * 10)
+    with engine.connect() as conn:
+        busy, _, _ = conn.execute(text('PRAGMA wal_checkpoint(TRUNCATE)')).one()
+    assert busy == 0
+
+    model.fetchMoreRows()
+    assert _waitFor(lambda: model.rowCount() == 200 and not model.isFetching())
+    model.fetchAllRows()
+    assert _waitFor(lambda: not model.isRunning())
+    assert model.isExhausted()
+    ids = [model.data(model.index(r, 0)) for r in range(model.rowCount())]
+    assert ids == list(range(1, _NROWS + 11))
+
+def test_refresh_ignores_the_run_it_superseded(qapp, engine):
+    model = SQLAlchemySQLQueryModel('SELECT id FROM t ORDER BY id', engine, asynchronous=True, chunk_size=40, preview_limit=100)
+    assert _waitFor(lambda: model.isRunning() and not model.isFetching())
+    messages = []
+    model.finished.connect(messages.append)
+    model.refresh()
+    # let the cancelled run stop and its signals arrive
+    QThreadPool.globalInstance().waitForDone(5000)
+    QCoreApplication.processEvents()
+    assert not model.isRunning() and model.isExhausted() and model.lastError() == ''
+    assert messages == []
+    assert [model.data(model.index(r, 0)) for r in range(model.rowCount())] == list(range(1, _NROWS + 1))
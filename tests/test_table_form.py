@@ -0,0 +1,45 @@
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QMessageBox
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+
+from cMenu.dbengine import create_sqlite_engine
+
+
+class _Base(DeclarativeBase):
+    pass
+
+class _Rec(_Base):
+    __tablename__ = 'Recs'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(20), nullable=False)
+
+
+@pytest.fixture
+def form(qapp, tmp_path, monkeypatch):
+    from cMenu.utils import cQdbFormWidgets
+    engine = create_sqlite_engine(str(tmp_path / 'form.sqlite'))
+    _Base.metadata.create_all(engine)
+    factory = sessionmaker(engine)
+    with factory() as session:
+        session.add_all([_Rec(name=n) for n in 'ba'])
+        session.commit()
+    monkeypatch.setattr(cQdbFormWidgets, 'areYouSure', lambda *args: QMessageBox.StandardButton.Yes)
+    monkeypatch.setattr(QMessageBox, 'warning', lambda *args: None)
+    return cQdbFormWidgets.cSimpleTableForm('Recs', _Rec, factory)
+
+def test_requery_waits_for_rows_that_did_not_save(form):
+    model = form.model
+    model.insertRow(model.rowCount())       # name is NOT NULL - this row can't be saved
+    sortIndicator = form._sortIndicator
+    form.sortBy(model.findColumn('name'), Qt.SortOrder.DescendingOrder)
+    assert form._sortIndicator == sortIndicator
+    assert model.hasUnsavedChanges() and model.rowCount() == 3
+
+def test_requery_goes_ahead_once_saved(form):
+    model = form.model
+    model.setData(model.index(0, model.findColumn('name')), 'c')
+    form.sortBy(model.findColumn('name'), Qt.SortOrder.DescendingOrder)
+    assert not model.hasUnsavedChanges()
+    assert [model.data(model.index(r, model.findColumn('name'))) for r in range(model.rowCount())] == ['c', 'a']
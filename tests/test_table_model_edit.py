@@ -0,0 +1,85 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from PySide6.QtCore import QDate, Qt
+from PySide6.QtWidgets import QDateEdit, QStyledItemDelegate, QStyleOptionViewItem, QWidget
+from sqlalchemy import Date, Integer, Numeric, String, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
+
+from cMenu.dbengine import create_sqlite_engine
+
+
+class _Base(DeclarativeBase):
+    pass
+
+class _Rec(_Base):
+    __tablename__ = 'Recs'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(20), nullable=False)
+    due: Mapped[datetime.date|None] = mapped_column(Date, nullable=True)
+    qty: Mapped[int] = mapped_column(Integer, nullable=False)
+    cost: Mapped[Decimal|None] = mapped_column(Numeric(10, 2), nullable=True)
+
+class _FailingCommitSession(Session):
+    def commit(self):
+        raise RuntimeError('commit refused')
+
+
+@pytest.fixture
+def model(qapp, tmp_path):
+    from cMenu.utils.cQModels import SQLAlchemyTableModel
+    engine = create_sqlite_engine(str(tmp_path / 'edit.sqlite'))
+    _Base.metadata.create_all(engine)
+    factory = sessionmaker(engine)
+    with factory() as session:
+        session.add(_Rec(name='a', due=datetime.date(2026, 3, 4), qty=5, cost=Decimal('1.50')))
+        session.commit()
+    return SQLAlchemyTableModel(_Rec, factory)
+
+def _idx(model, name):
+    return model.index(0, model.findColumn(name))
+
+def test_date_edits_through_default_delegate(model):
+    idx = _idx(model, 'due')
+    assert model.data(idx, Qt.ItemDataRole.EditRole) == QDate(2026, 3, 4)
+    delegate, parent = QStyledItemDelegate(), QWidget()
+    editor = delegate.createEditor(parent, QStyleOptionViewItem(), idx)
+    assert isinstance(editor, QDateEdit)
+    delegate.setEditorData(editor, idx)
+    editor.setDate(editor.date().addDays(1))
+    delegate.setModelData(editor, model, idx)
+    assert model.save_changes() == {}
+    with model.session_factory() as session:
+        assert session.scalar(select(_Rec.due)) == datetime.date(2026, 3, 5)
+
+def test_text_is_converted_to_the_column_type(model):
+    assert model.data(_idx(model, 'cost'), Qt.ItemDataRole.EditRole) == '1.50'
+    assert model.setData(_idx(model, 'cost'), '2.25')
+    assert model.setData(_idx(model, 'qty'), ' 7 ')
+    assert model.setData(_idx(model, 'due'), '')
+    assert model.save_changes() == {}
+    with model.session_factory() as session:
+        assert session.execute(select(_Rec.cost, _Rec.qty, _Rec.due)).one() == (Decimal('2.25'), 7, None)
+
+def test_unconvertible_text_is_refused(model):
+    assert not model.setData(_idx(model, 'qty'), 'seven')
+    assert not model.setData(_idx(model, 'due'), '2026-13-01')
+    assert not model.setData(_idx(model, 'cost'), 'n/a')
+    assert not model.hasUnsavedChanges()
+
+def test_failed_delete_leaves_the_model_alone(qapp, tmp_path):
+    from cMenu.utils.cQModels import SQLAlchemyTableModel
+    engine = create_sqlite_engine(str(tmp_path / 'remove.sqlite'))
+    _Base.metadata.create_all(engine)
+    with sessionmaker(engine)() as session:
+        session.add_all([_Rec(name=n, qty=1) for n in 'abc'])
+        session.commit()
+    model = SQLAlchemyTableModel(_Rec, sessionmaker(engine, class_=_FailingCommitSession))
+    model.rowCount()
+    removed = []
+    model.rowsRemoved.connect(lambda *args: removed.append(args))
+    assert not model.removeRow(2)
+    assert (model.rowCount(), model._dbRows, model._added, removed) == (3, 3, [], [])
+    assert model.data(model.index(2, model.findColumn('name'))) == 'c'
+    assert not model.hasUnsavedChanges()